@@ -0,0 +1,57 @@
+"""
+Benchmark of `cayley_bezout_determinant`: the symmetric half storage
+elimination of the Bezoutian against the dense fraction-free elimination of
+the Cayley-Bezout matrix, and `det` for small degrees.
+
+Random dense polynomials of equal degree are generated with integer
+coefficients or with symbolic parameters in their coefficients. Run from the
+benchmarks directory:
+
+    python bench_bezout_determinant.py --degrees 10 20 40 60 --parameters 0
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import argparse
+import random
+
+import sympy as sym
+
+from cayley_bezout import cayley_bezout_determinant
+from bench_sylvester_resultant import random_polynomial, time_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--degrees", type=int, nargs="+", default=[10, 20, 40, 60])
+    parser.add_argument("--parameters", type=int, nargs="+", default=[0])
+    parser.add_argument("--max-det-degree", type=int, default=8,
+                        help="largest degree timed with cayley_bezout_matrix(...).det()")
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    x = sym.symbols("x")
+    rng = random.Random(arguments.seed)
+
+    print("{:>8} {:>11} {:>12} {:>10} {:>9} {:>12}".format(
+        "degree", "parameters", "bareiss (s)", "ldl (s)", "speedup", "det (s)"))
+    for number_of_parameters in arguments.parameters:
+        parameters = sym.symbols("t:{}".format(number_of_parameters))
+        for degree in arguments.degrees:
+            p = random_polynomial(x, degree, parameters, rng)
+            q = random_polynomial(x, degree, parameters, rng)
+
+            bareiss = time_call(lambda: cayley_bezout_determinant(p, q, x, method="bareiss"))
+            ldl = time_call(lambda: cayley_bezout_determinant(p, q, x, method="ldl"))
+            if degree <= arguments.max_det_degree:
+                det = "{:12.3f}".format(time_call(lambda: cayley_bezout_determinant(p, q, x, method="det")))
+            else:
+                det = "{:>12}".format("skipped")
+
+            print("{:>8} {:>11} {:12.3f} {:10.3f} {:9.2f} {}".format(
+                degree, number_of_parameters, bareiss, ldl, bareiss / ldl, det))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark of the divided differences Dixon's polynomial against det().factor().
+
+Random systems of n + 1 dense polynomials in n variables are generated, with
+an optional symbolic parameter. Run from the benchmarks directory:
+
+    python bench_dixon_polynomial.py --variables 2 3 --degree 2
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import argparse
+import itertools
+import random
+import time
+
+import sympy as sym
+
+from dixon import DixonResultant
+
+
+def random_system(variables, degree, parameters, rng):
+    """
+    Returns
+    -------
+    polynomials: list
+        n + 1 lambdified dense polynomials of total degree `degree` with small
+        integer coefficients, some of them shifted by the parameters.
+    """
+    monomials = [m for m in itertools.product(range(degree + 1), repeat=len(variables))
+                 if sum(m) <= degree]
+    polynomials = []
+    for _ in range(len(variables) + 1):
+        terms = []
+        for powers in monomials:
+            coefficient = rng.randint(-5, 5) + sum(rng.randint(0, 1) * t for t in parameters)
+            terms.append(coefficient * sym.Mul(*[v ** e for v, e in zip(variables, powers)]))
+        polynomials.append(sym.lambdify(variables, sym.Add(*terms)))
+
+    return polynomials
+
+
+def time_call(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--variables", type=int, nargs="+", default=[2, 3])
+    parser.add_argument("--degree", type=int, default=2)
+    parser.add_argument("--parameters", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    rng = random.Random(arguments.seed)
+    parameters = sym.symbols("t:{}".format(arguments.parameters))
+
+    print("{:>10} {:>22} {:>12}".format("variables", "divided differences (s)", "factor (s)"))
+    for number_of_variables in arguments.variables:
+        variables = sym.symbols("x:{}".format(number_of_variables))
+        dixon = DixonResultant(random_system(variables, arguments.degree, parameters, rng),
+                               list(variables))
+
+        fast = time_call(lambda: dixon.get_dixon_polynomial())
+        slow = time_call(lambda: dixon.get_dixon_polynomial(method="factor"))
+
+        print("{:>10} {:22.3f} {:12.3f}".format(number_of_variables, fast, slow))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark of `MacaulayResultant.get_resultant` against the quotient of two
+symbolic determinants, get_matrix().det() / get_submatrix(...).det().
+
+Random dense homogeneous systems with symbolic parameters are used. The
+symbolic quotient is only timed up to --det-limit rows, above which it takes
+too long. Run from the benchmarks directory:
+
+    python bench_macaulay_resultant.py --degrees 1,1,1 2,1,1 2,2,1 2,2,1,1
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import argparse
+import itertools
+import random
+import time
+
+import sympy as sym
+
+from macaulay import MacaulayResultant
+
+
+def time_call(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def get_system(degrees, parameters, rng):
+    variables = list(sym.symbols("x_0:{}".format(len(degrees))))
+
+    polynomials = []
+    for i, degree in enumerate(degrees):
+        support = [powers for powers in itertools.product(range(degree + 1), repeat=len(variables))
+                   if sum(powers) == degree]
+        coefficients = [rng.randint(-9, 9) for _ in support]
+        coefficients[0] += parameters[i % len(parameters)]
+        polynomials.append(sum(c * sym.Mul(*[v ** e for v, e in zip(variables, powers)])
+                               for c, powers in zip(coefficients, support)))
+
+    return polynomials, variables
+
+
+def get_quotient(macaulay):
+    matrix = macaulay.get_matrix()
+    return sym.cancel(matrix.det() / macaulay.get_submatrix(matrix).det())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--degrees", nargs="+", default=["1,1,1", "2,1,1", "2,2,1", "2,2,1,1"])
+    parser.add_argument("--parameters", type=int, default=2)
+    parser.add_argument("--det-limit", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    rng = random.Random(arguments.seed)
+    parameters = sym.symbols("t_0:{}".format(arguments.parameters))
+
+    print("{:>10} {:>8} {:>10} {:>16} {:>12}".format("degrees", "size", "minor", "resultant (s)",
+                                                        "det / det (s)"))
+    for degrees in arguments.degrees:
+        degrees = [int(d) for d in degrees.split(",")]
+        polynomials, variables = get_system(degrees, parameters, rng)
+
+        macaulay = MacaulayResultant(polynomials, variables)
+        elimination, resultant = time_call(macaulay.get_resultant)
+        size, minor = macaulay.matrix.rows, macaulay.submatrix.rows
+
+        quotient = "-"
+        if size <= arguments.det_limit:
+            macaulay.invalidate()
+            seconds, expected = time_call(lambda: get_quotient(macaulay))
+            assert sym.expand(expected - resultant.as_expr()) == 0 or \
+                sym.expand(expected + resultant.as_expr()) == 0
+            quotient = "{:.3f}".format(seconds)
+
+        print("{:>10} {:>8} {:>10} {:16.3f} {:>12}".format(",".join(map(str, degrees)), size, minor,
+                                                            elimination, quotient))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark of streaming Macaulay's matrix to memory-mapped files with
+`MacaulayResultant.write_modular_rows` against building it in memory with
+`get_matrix`.
+
+Random dense homogeneous systems with integer coefficients are used. For each
+the time and the peak traced memory of both are reported, together with the
+out of core rank of the stored rows. The in-memory matrix is only built up to
+--build-limit rows. Run from the benchmarks directory:
+
+    python bench_macaulay_storage.py --degrees 2,2,2,2 2,2,2,2,2 3,2,2,2,2
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import argparse
+import itertools
+import random
+import tempfile
+import time
+import tracemalloc
+
+import sympy as sym
+
+from macaulay import MacaulayResultant
+from modular import sparse_rank_mod_prime
+from storage import iter_sparse_rows
+
+
+def measure(function):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak / 2 ** 20, result
+
+
+def get_system(degrees, rng):
+    variables = list(sym.symbols("x_0:{}".format(len(degrees))))
+
+    polynomials = []
+    for degree in degrees:
+        support = [powers for powers in itertools.product(range(degree + 1), repeat=len(variables))
+                   if sum(powers) == degree]
+        polynomials.append({powers: rng.randint(-9, 9) or 1 for powers in support})
+
+    return [sym.Poly.from_dict(terms, *variables) for terms in polynomials], variables
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--degrees", nargs="+", default=["2,2,2,2", "2,2,2,2,2", "3,2,2,2,2"])
+    parser.add_argument("--build-limit", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    rng = random.Random(arguments.seed)
+
+    print("{:>12} {:>8} {:>10} {:>10} {:>10} {:>10} {:>10} {:>8}".format(
+        "degrees", "size", "nnz", "write (s)", "write (MB)", "build (s)", "build (MB)", "rank"))
+    for degrees in arguments.degrees:
+        degrees = [int(d) for d in degrees.split(",")]
+        polynomials, variables = get_system(degrees, rng)
+
+        with tempfile.TemporaryDirectory() as directory:
+            macaulay = MacaulayResultant(polynomials, variables)
+            write, write_peak, header = measure(lambda: macaulay.write_modular_rows(directory))
+            rank = sparse_rank_mod_prime(iter_sparse_rows(directory), header["prime"])
+
+        build, build_peak = "-", "-"
+        if header["shape"][0] <= arguments.build_limit:
+            macaulay = MacaulayResultant(polynomials, variables)
+            seconds, peak, _ = measure(macaulay.get_matrix)
+            build, build_peak = "{:.3f}".format(seconds), "{:.2f}".format(peak)
+
+        print("{:>12} {:>8} {:>10} {:10.3f} {:10.2f} {:>10} {:>10} {:>8}".format(
+            ",".join(map(str, degrees)), header["shape"][0], header["nnz"], write, write_peak,
+            build, build_peak, rank))
+
+
+if __name__ == "__main__":
+    main()
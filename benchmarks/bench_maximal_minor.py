@@ -0,0 +1,71 @@
+"""
+Benchmark of the maximal minor selection of `DixonResultant.get_maximal_minor`.
+
+Random rank deficient matrices with entries polynomial in two parameters are
+used, the shape of singular parametric Dixon matrices. The one-off conversion
+of the entries to modular terms and the selection itself (evaluation and rank
+profile modulo a prime) are timed separately, against sympy's symbolic rank
+for the smaller sizes. Run from the benchmarks directory:
+
+    python bench_maximal_minor.py --sizes 6 20 50 100
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import argparse
+import random
+import time
+
+import sympy as sym
+
+from modular import (LARGEST_PRIME, evaluate_modular_terms, get_modular_terms,
+                     rank_profile_mod_prime)
+
+
+def time_call(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def get_matrix(size, rng, a, b):
+    matrix = sym.Matrix(size, size, lambda i, j: sym.expand(
+        rng.randint(-9, 9) * a ** rng.randint(0, 3) + rng.randint(-9, 9) * a * b + rng.randint(0, 5))
+        if rng.random() < 0.5 else 0)
+    for k in range(size // 10):
+        matrix[:, size - 1 - k] = matrix[:, k] + matrix[:, k + 1]
+
+    return matrix
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[6, 10, 20, 50, 100])
+    parser.add_argument("--sympy-limit", type=int, default=6,
+                        help="largest size for which sympy's rank is timed")
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    rng = random.Random(arguments.seed)
+    a, b = sym.symbols("a, b")
+
+    print("{:>6} {:>6} {:>14} {:>14} {:>12}".format("size", "rank", "convert (s)", "select (s)", "sympy (s)"))
+    for size in arguments.sizes:
+        matrix = get_matrix(size, rng, a, b)
+
+        convert, terms = time_call(lambda: get_modular_terms(matrix, [a, b], LARGEST_PRIME))
+        point = [rng.randrange(1, LARGEST_PRIME) for _ in range(2)]
+        select, (rows, columns) = time_call(lambda: rank_profile_mod_prime(
+            evaluate_modular_terms(terms, matrix.shape, point, LARGEST_PRIME), LARGEST_PRIME))
+
+        exact = "-"
+        if size <= arguments.sympy_limit:
+            seconds, rank = time_call(lambda: matrix.rank())
+            assert rank == len(rows)
+            exact = "{:.3f}".format(seconds)
+
+        print("{:>6} {:>6} {:14.3f} {:14.4f} {:>12}".format(size, len(rows), convert, select, exact))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark of `modular_determinant` against sympy's exact determinant.
+
+Random integer matrices of the given sizes are used, which is the shape of the
+numerical Dixon and Macaulay matrices. Run from the benchmarks directory:
+
+    python bench_modular.py --sizes 30 40 60
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import argparse
+import random
+import time
+
+import sympy as sym
+
+from modular import modular_determinant
+
+
+def time_call(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[30, 40, 60])
+    parser.add_argument("--entry-size", type=int, default=1000,
+                        help="entries are drawn from [-entry_size, entry_size]")
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    rng = random.Random(arguments.seed)
+    bound = arguments.entry_size
+
+    print("{:>6} {:>12} {:>12}".format("size", "modular (s)", "sympy (s)"))
+    for size in arguments.sizes:
+        matrix = sym.Matrix(size, size, lambda i, j: rng.randint(-bound, bound))
+
+        modular, result = time_call(lambda: modular_determinant(matrix))
+        exact, expected = time_call(lambda: matrix.det())
+        assert result == expected
+
+        print("{:>6} {:12.3f} {:12.3f}".format(size, modular, exact))
+
+
+if __name__ == "__main__":
+    main()
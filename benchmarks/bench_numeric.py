@@ -0,0 +1,77 @@
+"""
+Benchmark of the floating point hidden variable solver of `numeric` against
+the symbolic path, the Sylvester's resultant in x followed by the numerical
+roots of the resulting polynomial in y.
+
+Random dense bivariate systems of total degree d are used; such a system has
+d ** 2 common roots. The symbolic path is only timed up to --symbolic-limit.
+Run from the benchmarks directory:
+
+    python bench_numeric.py --degrees 2 4 6 8 10
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import argparse
+import time
+
+import numpy as np
+import sympy as sym
+
+import numeric
+from sylvesters import sylvester_resultant
+
+
+def time_call(function, repeat=1):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def get_system(degree, rng):
+    mask = np.add.outer(np.arange(degree + 1), np.arange(degree + 1)) <= degree
+    return [np.where(mask, rng.integers(-9, 10, mask.shape), 0).astype(float) for _ in range(2)]
+
+
+def solve_symbolic(p, q):
+    x, y = sym.symbols("x, y")
+    expressions = [sum(int(c) * x ** i * y ** j for (i, j), c in np.ndenumerate(a) if c) for a in (p, q)]
+    return sym.Poly(sylvester_resultant(*expressions, x), y).nroots()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--degrees", nargs="+", type=int, default=[2, 4, 6, 8, 10])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--symbolic-limit", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    rng = np.random.default_rng(arguments.seed)
+
+    print("{:>8} {:>8} {:>14} {:>14} {:>14} {:>14}".format(
+        "degree", "roots", "bezout (ms)", "sylvester (ms)", "max residual", "symbolic (s)"))
+    for degree in arguments.degrees:
+        p, q = get_system(degree, rng)
+
+        timings, residual = [], 0.0
+        for method in ["bezout", "sylvester"]:
+            seconds, (roots, residuals, _) = time_call(
+                lambda: numeric.solve_bivariate(p, q, method=method, seed=0), arguments.repeat)
+            timings.append(seconds * 1000)
+            residual = max(residual, residuals.max(initial=0.0))
+
+        symbolic = "-"
+        if degree <= arguments.symbolic_limit:
+            symbolic = "{:.3f}".format(time_call(lambda: solve_symbolic(p, q))[0])
+
+        print("{:>8} {:>8} {:14.3f} {:14.3f} {:14.2e} {:>14}".format(
+            degree, len(roots), *timings, residual, symbolic))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark of the process pool layer for independent systems.
+
+The same batch of parametric Sylvester resultants is computed serially and
+with an increasing number of workers. Run from the benchmarks directory:
+
+    python bench_parallel.py --systems 64 --workers 1 2 4 8
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import argparse
+import time
+
+import sympy as sym
+
+from parallel import compute_resultant, parallel_resultants
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--systems", type=int, default=64)
+    parser.add_argument("--degree", type=int, default=8)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--chunksize", type=int, default=4)
+    arguments = parser.parse_args()
+
+    x, t = sym.symbols("x, t")
+    systems = [([sum((k + i + t) * x ** i for i in range(arguments.degree + 1)),
+                 sum((k - i) * t * x ** i + 1 for i in range(arguments.degree))], [x])
+               for k in range(arguments.systems)]
+
+    start = time.perf_counter()
+    expected = [compute_resultant("sylvester", *system) for system in systems]
+    serial = time.perf_counter() - start
+    print("{:>8} {:>10} {:>8}".format("workers", "time (s)", "speedup"))
+    print("{:>8} {:10.3f} {:8.2f}".format("serial", serial, 1))
+
+    for workers in arguments.workers:
+        start = time.perf_counter()
+        results = list(parallel_resultants(systems, "sylvester", max_workers=workers,
+                                           chunksize=arguments.chunksize))
+        elapsed = time.perf_counter() - start
+        assert results == expected
+
+        print("{:>8} {:10.3f} {:8.2f}".format(workers, elapsed, serial / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark of the cost model of `resultant.ResultantPlan`.
+
+For families of random systems every applicable formulation is timed and
+the order of the measured times is compared with the order of the estimated
+costs. The last columns give the method chosen by "auto", the measured
+fastest one and the slowdown of the choice against it; "auto" does not
+choose Dixon's projection operator, so on affine systems the slowdown is the
+price of the exact resultant. Run from the benchmarks directory:
+
+    python bench_resultant.py --degrees 2 3 4 5 6
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import argparse
+import itertools
+import random
+import time
+
+import sympy as sym
+
+from resultant import get_plan
+
+x, y, z = sym.symbols("x, y, z")
+a, b = sym.symbols("a, b")
+
+
+def get_coefficient(rng, parameters):
+    return rng.randint(-9, 9) + sum(rng.randint(-2, 2) * p for p in parameters) or 1
+
+
+def get_polynomial(rng, variables, degree, parameters=(), homogeneous=False):
+    monomials = [powers for powers in itertools.product(range(degree + 1), repeat=len(variables))
+                 if (sum(powers) == degree if homogeneous else sum(powers) <= degree)]
+    return sum(get_coefficient(rng, parameters) * sym.Mul(*[v ** e for v, e in zip(variables, powers)])
+               for powers in monomials)
+
+
+def get_families(degree, rng):
+    """
+    Returns
+    -------
+    families: list
+        (name, polynomials, variables) triples of systems of the given degree.
+    """
+    return [
+        ("univariate d, d", [get_polynomial(rng, [x], degree, [a]),
+                             get_polynomial(rng, [x], degree, [a])], [x]),
+        ("univariate 2d, 1", [get_polynomial(rng, [x], 2 * degree, [a]),
+                              get_polynomial(rng, [x], 1, [a])], [x]),
+        ("affine 3 in x, y", [get_polynomial(rng, [x, y], max(1, degree - 2), [a])
+                              for _ in range(3)], [x, y]),
+        ("homogeneous 3 in x, y, z", [get_polynomial(rng, [x, y, z], max(1, degree - 2), [a],
+                                                     homogeneous=True) for _ in range(3)], [x, y, z]),
+    ]
+
+
+def is_concordant(costs, times):
+    """
+    Returns
+    -------
+    concordant: float
+        The fraction of pairs of methods ordered the same by cost and time.
+    """
+    pairs = list(itertools.combinations(costs, 2))
+    if not pairs:
+        return 1.0
+    return sum((costs[i] - costs[j]) * (times[i] - times[j]) >= 0 for i, j in pairs) / len(pairs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--degrees", nargs="+", type=int, default=[2, 3, 4, 5, 6])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--time-limit", type=float, default=30.0,
+                        help="Skip the formulations of a family after one took longer.")
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    rng = random.Random(arguments.seed)
+    skipped = set()
+    print("{:<26} {:>6} {:<34} {:>10} {:>9} {:>9} {:>8}".format(
+        "family", "degree", "method: size, time (s)", "concordant", "auto", "fastest", "slowdown"))
+
+    for degree in arguments.degrees:
+        for name, polynomials, variables in get_families(degree, rng):
+            plan = get_plan(polynomials, variables)
+            costs, times = {}, {}
+            for candidate in plan.candidates:
+                method = candidate["method"]
+                if (name, method) in skipped:
+                    continue
+                samples = []
+                for _ in range(arguments.repeat):
+                    start = time.perf_counter()
+                    get_plan(polynomials, variables).run(method)
+                    samples.append(time.perf_counter() - start)
+                costs[method], times[method] = candidate["cost"], min(samples)
+                if times[method] > arguments.time_limit:
+                    skipped.add((name, method))
+
+            fastest = min(times, key=times.get)
+            chosen = plan.chosen["method"]
+            described = ", ".join("{}: {}, {:.3f}".format(c["method"][:3], c["rows"], times[c["method"]])
+                                  for c in plan.candidates if c["method"] in times)
+            slowdown = "{:.2f}".format(times[chosen] / times[fastest]) if chosen in times else "-"
+            print("{:<26} {:>6} {:<34} {:10.2f} {:>9} {:>9} {:>8}".format(
+                name, degree, described, is_concordant(costs, times), chosen, fastest, slowdown))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark of the binary matrix format of `serialization` against pickling the
+sympy matrices.
+
+Dixon's matrices of random systems with symbolic parameters and large integer
+coefficients are saved and loaded both ways; the sizes on disk and the times
+are reported. Run from the benchmarks directory:
+
+    python bench_serialization.py --degrees 1 2 3 --parameters 2 --bits 64
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import argparse
+import itertools
+import os
+import pickle
+import random
+import tempfile
+import time
+
+import sympy as sym
+
+from dixon import DixonResultant
+from serialization import load_matrix, save_matrix
+
+
+def time_call(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def get_system(degree, parameters, bits, rng):
+    x, y = sym.symbols("x, y")
+    box = list(itertools.product(range(degree + 1), repeat=2))
+
+    polynomials = []
+    for i in range(3):
+        coefficients = [rng.randint(-2 ** bits, 2 ** bits) for _ in box]
+        coefficients[0] += parameters[i % len(parameters)]
+        polynomials.append(sum(c * x ** e[0] * y ** e[1] for c, e in zip(coefficients, box)))
+
+    return polynomials, [x, y]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--degrees", nargs="+", type=int, default=[1, 2, 3])
+    parser.add_argument("--parameters", type=int, default=2)
+    parser.add_argument("--bits", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    rng = random.Random(arguments.seed)
+    parameters = sym.symbols("t_0:{}".format(arguments.parameters))
+
+    print("{:>8} {:>10} {:>12} {:>12} {:>12} {:>12} {:>12} {:>12}".format(
+        "degree", "shape", "pickle (KB)", "binary (KB)", "dump (s)", "save (s)", "unpickle (s)",
+        "load (s)"))
+    for degree in arguments.degrees:
+        polynomials, variables = get_system(degree, parameters, arguments.bits, rng)
+        matrix = DixonResultant(polynomials, variables).dixon_matrix
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "matrix.pickle")
+            binary = os.path.join(directory, "matrix.bin")
+
+            def dump():
+                with open(path, "wb") as f:
+                    pickle.dump(matrix, f)
+
+            def unpickle():
+                with open(path, "rb") as f:
+                    return pickle.load(f)
+
+            dumping, _ = time_call(dump)
+            saving, _ = time_call(lambda: save_matrix(binary, matrix))
+            unpickling, _ = time_call(unpickle)
+            loading, loaded = time_call(lambda: load_matrix(binary))
+            assert loaded == matrix
+
+            print("{:>8} {:>10} {:12.1f} {:12.1f} {:12.4f} {:12.4f} {:12.4f} {:12.4f}".format(
+                degree, "x".join(map(str, matrix.shape)), os.path.getsize(path) / 1024,
+                os.path.getsize(binary) / 1024, dumping, saving, unpickling, loading))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark of the startup of a short-lived worker: a fresh interpreter which
+imports the package and computes its first resultant of a small integer
+system, with the sympy-free `core` and with the symbolic modules.
+
+Each case is run --repeat times in a new process and the fastest wall time is
+reported, together with whether sympy was imported. Run from the benchmarks
+directory:
+
+    python bench_startup.py --repeat 5
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import argparse
+import subprocess
+import time
+
+CASES = {
+    "core.sylvester_resultant": (
+        "import core; core.sylvester_resultant([2, -3, 0, 5], [1, 4, -7])"),
+    "core.macaulay_resultant": (
+        "import core; core.macaulay_resultant([{(2, 0, 0): 3, (0, 1, 1): 1}, "
+        "{(0, 2, 0): 1, (1, 0, 1): 5}, {(1, 0, 0): 1, (0, 1, 0): 2, (0, 0, 1): -7}])"),
+    "sylvesters.sylvester_resultant": (
+        "import sympy as sym; from sylvesters import sylvester_resultant; x = sym.Symbol('x'); "
+        "sylvester_resultant(2 * x ** 3 - 3 * x ** 2 + 5, x ** 2 + 4 * x - 7, x)"),
+    "macaulay.get_resultant": (
+        "import sympy as sym; from macaulay import MacaulayResultant; x, y, z = sym.symbols('x, y, z'); "
+        "MacaulayResultant([3 * x ** 2 + y * z, y ** 2 + 5 * x * z, x + 2 * y - 7 * z], "
+        "[x, y, z]).get_resultant()"),
+}
+
+
+def run(code, repeat):
+    """
+    Returns
+    -------
+    seconds: float
+        The fastest wall time of a new interpreter running the code.
+    sympy: bool
+        Whether sympy was imported.
+    """
+    script = "import sys; sys.path.insert(0, '../src/'); {}; print('sympy' in sys.modules)".format(code)
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+        times.append(time.perf_counter() - start)
+
+    return min(times), output.stdout.strip() == "True"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    baseline, _ = run("pass", arguments.repeat)
+    print("{:<36} {:>12} {:>8}".format("case", "startup (s)", "sympy"))
+    print("{:<36} {:12.3f} {:>8}".format("python -c pass", baseline, "-"))
+    for name, code in CASES.items():
+        seconds, sympy = run(code, arguments.repeat)
+        print("{:<36} {:12.3f} {:>8}".format(name, seconds, "yes" if sympy else "no"))
+
+
+if __name__ == "__main__":
+    main()
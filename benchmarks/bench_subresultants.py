@@ -0,0 +1,69 @@
+"""
+Benchmark of `subresultant_chain` against one determinant per subresultant.
+
+The chain of two parametric polynomials is computed in one elimination, and
+compared with the time of the resultant alone and of the principal minors of
+the Sylvester's matrix taken separately. Run from the benchmarks directory:
+
+    python bench_subresultants.py --degrees 4 8 12
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import argparse
+import random
+import time
+
+import sympy as sym
+
+from fraction_free import bareiss_determinant
+from subresultants import principal_subresultant_coefficients
+from sylvesters import get_sylvester_rows, sylvester_resultant
+
+
+def time_call(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def get_separate_minors(p, q, x):
+    gens = tuple(sorted((p.free_symbols | q.free_symbols) - {x}, key=sym.default_sort_key))
+    rows = get_sylvester_rows([sym.Poly(c, *gens) for c in sym.Poly(p, x).all_coeffs()],
+                              [sym.Poly(c, *gens) for c in sym.Poly(q, x).all_coeffs()],
+                              sym.Poly(0, *gens))
+    m, n = sym.degree(p, x), sym.degree(q, x)
+
+    minors = []
+    for j in range(min(m, n)):
+        size = m + n - 2 * j
+        block = list(range(n - j)) + [n + k for k in range(m - j)]
+        minors.append(bareiss_determinant([rows[i][:size] for i in block]))
+
+    return minors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--degrees", type=int, nargs="+", default=[4, 8, 12])
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    rng = random.Random(arguments.seed)
+    x, s, t = sym.symbols("x, s, t")
+
+    print("{:>6} {:>14} {:>12} {:>14}".format("degree", "resultant (s)", "chain (s)", "separate (s)"))
+    for degree in arguments.degrees:
+        p = sum((rng.randint(-9, 9) + s * (i % 2)) * x ** i for i in range(degree + 1))
+        q = sum((rng.randint(-9, 9) + t * (1 - i % 2)) * x ** i for i in range(degree))
+
+        resultant, _ = time_call(lambda: sylvester_resultant(p, q, x))
+        chain, coefficients = time_call(lambda: principal_subresultant_coefficients(p, q, x))
+        separate, minors = time_call(lambda: get_separate_minors(p, q, x))
+        assert coefficients == minors
+
+        print("{:>6} {:14.3f} {:12.3f} {:14.3f}".format(degree, resultant, chain, separate))
+
+
+if __name__ == "__main__":
+    main()
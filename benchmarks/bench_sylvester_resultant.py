@@ -0,0 +1,78 @@
+"""
+Benchmark of `sylvester_resultant`, by elimination of the matrix and by the
+subresultant remainder sequence, against `sylvester_matrix(...).det()`.
+
+Random dense polynomials of equal degree are generated with one or two
+symbolic parameters in their coefficients. Run from the benchmarks directory:
+
+    python bench_sylvester_resultant.py --degrees 5 10 20 40 60
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import argparse
+import random
+import time
+
+import sympy as sym
+
+from sylvesters import sylvester_matrix, sylvester_resultant
+
+
+def random_polynomial(x, degree, parameters, rng):
+    """
+    Returns
+    -------
+    polynomial: sympy expression
+        A polynomial of the given degree in x with small integer coefficients,
+        where every third coefficient is linear in the parameters.
+    """
+    terms = []
+    for power in range(degree + 1):
+        coefficient = rng.randint(1, 9)
+        if power % 3 == 0:
+            coefficient += sum(rng.randint(1, 9) * t for t in parameters)
+        terms.append(coefficient * x ** power)
+
+    return sym.Add(*terms)
+
+
+def time_call(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--degrees", type=int, nargs="+", default=[5, 10, 20, 40, 60])
+    parser.add_argument("--parameters", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--max-det-degree", type=int, default=5,
+                        help="largest degree timed with sylvester_matrix(...).det()")
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    x = sym.symbols("x")
+    rng = random.Random(arguments.seed)
+
+    print("{:>8} {:>11} {:>12} {:>14} {:>12}".format(
+        "degree", "parameters", "bareiss (s)", "euclidean (s)", "det (s)"))
+    for number_of_parameters in arguments.parameters:
+        parameters = sym.symbols("t:{}".format(number_of_parameters))
+        for degree in arguments.degrees:
+            p = random_polynomial(x, degree, parameters, rng)
+            q = random_polynomial(x, degree, parameters, rng)
+
+            bareiss = time_call(lambda: sylvester_resultant(p, q, x))
+            euclidean = time_call(lambda: sylvester_resultant(p, q, x, method="euclidean"))
+            if degree <= arguments.max_det_degree:
+                det = "{:12.3f}".format(time_call(lambda: sylvester_matrix(p, q, x).det()))
+            else:
+                det = "{:>12}".format("skipped")
+
+            print("{:>8} {:>11} {:12.3f} {:14.3f} {}".format(
+                degree, number_of_parameters, bareiss, euclidean, det))
+
+
+if __name__ == "__main__":
+    main()
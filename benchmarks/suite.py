@@ -0,0 +1,285 @@
+"""
+Scaling benchmark suite of the four formulations.
+
+Families of generated systems vary one of the degree, the number of
+variables, the number of symbolic parameters or the size of the integer
+coefficients. For each case the construction of the matrix and its
+determinant are timed separately and their peak memory is recorded with
+`tracemalloc`. Results are written as JSON; with --compare the run is checked
+against a saved baseline and slower cases are flagged. Run from the
+benchmarks directory:
+
+    python suite.py --output baseline.json
+    python suite.py --output current.json --compare baseline.json
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import argparse
+import datetime
+import itertools
+import json
+import platform
+import random
+import time
+import tracemalloc
+
+import numpy as np
+import sympy as sym
+
+from cayley_bezout import cayley_bezout_matrix
+from dixon import DixonResultant
+from macaulay import MacaulayResultant
+from parallel import determinant
+from sylvesters import sylvester_matrix
+
+FAMILIES = {
+    "degree": [("sylvester", {"degree": d}) for d in (4, 8, 16, 32)]
+              + [("bezout", {"degree": d}) for d in (4, 8, 16, 32)]
+              + [("dixon", {"degree": d, "variables": 2}) for d in (1, 2, 3)]
+              + [("macaulay", {"degree": d, "variables": 3}) for d in (1, 2, 3)],
+    "variables": [("dixon", {"degree": 1, "variables": n}) for n in (1, 2, 3)]
+                 + [("macaulay", {"degree": 2, "variables": n}) for n in (2, 3, 4)],
+    "parameters": [(formulation, {"degree": 4, "parameters": k})
+                   for formulation in ("sylvester", "bezout") for k in (0, 1, 2, 3)]
+                  + [("dixon", {"degree": 1, "variables": 2, "parameters": k}) for k in (0, 1, 2)]
+                  + [("macaulay", {"degree": 1, "variables": 3, "parameters": k}) for k in (0, 1, 2)],
+    "coefficients": [(formulation, {"degree": 16, "bits": b})
+                     for formulation in ("sylvester", "bezout") for b in (4, 64, 256)]
+                    + [("dixon", {"degree": 2, "variables": 2, "bits": b}) for b in (4, 64, 256)]
+                    + [("macaulay", {"degree": 2, "variables": 3, "bits": b}) for b in (4, 64, 256)],
+}
+
+DEFAULTS = {"degree": 2, "variables": 1, "parameters": 0, "bits": 8}
+
+
+def get_case_name(family, formulation, settings):
+    """
+    Returns
+    -------
+    name: str
+        A name identifying a case across runs.
+    """
+    return "{}/{}/".format(family, formulation) + ",".join(
+        "{}={}".format(key, settings[key]) for key in sorted(settings))
+
+
+def get_coefficients(count, settings, rng):
+    """
+    Returns
+    -------
+    coefficients: list
+        Random non zero integers of the given bit size. The first coefficients
+        are shifted by the symbolic parameters t_0, ..., t_{k - 1}.
+    """
+    bound = 2 ** settings["bits"]
+    parameters = sym.symbols("t_0:{}".format(settings["parameters"]))
+
+    coefficients = [rng.choice([-1, 1]) * rng.randint(1, bound) for _ in range(count)]
+    for i, parameter in enumerate(parameters):
+        coefficients[i % count] += parameter
+
+    return coefficients
+
+
+def get_polynomial(exponents, variables, settings, rng):
+    """
+    Returns
+    -------
+    polynomial: sympy expression
+        A polynomial with the given support and random coefficients.
+    """
+    coefficients = get_coefficients(len(exponents), settings, rng)
+    return sym.Add(*[c * sym.Mul(*[v ** e for v, e in zip(variables, powers)])
+                     for c, powers in zip(coefficients, exponents)])
+
+
+def generate_system(formulation, settings, seed=0):
+    """
+    Returns
+    -------
+    polynomials: list
+        A generated system of the formulation: two univariate polynomials for
+        Sylvester and Bezout, n + 1 polynomials of degree d in each of n
+        variables for Dixon and n dense homogeneous polynomials of degree d
+        for Macaulay.
+    variables: list
+        The variables of the system.
+    """
+    rng = random.Random(seed)
+    degree, n = settings["degree"], settings["variables"]
+    variables = list(sym.symbols("x_0:{}".format(n)))
+
+    if formulation in ("sylvester", "bezout"):
+        x = variables[0]
+        return [get_polynomial([(i,) for i in range(d + 1)], [x], settings, rng)
+                for d in (degree, degree - 1)], [x]
+
+    if formulation == "dixon":
+        box = list(itertools.product(range(degree + 1), repeat=n))
+        return [get_polynomial(box, variables, settings, rng) for _ in range(n + 1)], variables
+
+    homogeneous = [powers for powers in itertools.product(range(degree + 1), repeat=n)
+                   if sum(powers) == degree]
+    return [get_polynomial(homogeneous, variables, settings, rng) for _ in range(n)], variables
+
+
+def build_matrices(formulation, polynomials, variables):
+    """
+    Returns
+    -------
+    matrices: list
+        The matrices whose determinants are benchmarked: the matrix of the
+        formulation and for Macaulay also its submatrix.
+    """
+    if formulation == "sylvester":
+        return [sylvester_matrix(*polynomials, variables[0])]
+    if formulation == "bezout":
+        return [cayley_bezout_matrix(*polynomials, variables[0])]
+    if formulation == "dixon":
+        return [DixonResultant(polynomials, variables).dixon_matrix]
+
+    macaulay = MacaulayResultant(polynomials, variables)
+    return [macaulay.matrix, macaulay.submatrix]
+
+
+def measure(function, repeat):
+    """
+    Returns
+    -------
+    seconds: float
+        The fastest of repeat calls.
+    peak: int
+        The peak traced memory in bytes of one more call. It is a separate
+        call because tracing slows down the allocations.
+    result: object
+        The result of the last call.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return min(times), peak, result
+
+
+def run_case(family, formulation, settings, repeat):
+    """
+    Returns
+    -------
+    record: dict
+        The timings, peak memory and matrix shapes of a case. Determinants
+        of non square matrices are skipped and recorded as None.
+    """
+    settings = {**DEFAULTS, **settings}
+    polynomials, variables = generate_system(formulation, settings)
+
+    construction, construction_peak, matrices = measure(
+        lambda: build_matrices(formulation, polynomials, variables), repeat)
+
+    record = {"name": get_case_name(family, formulation, settings), "family": family,
+              "formulation": formulation, **settings,
+              "shapes": [list(matrix.shape) for matrix in matrices],
+              "construction_time": construction, "construction_peak": construction_peak,
+              "determinant_time": None, "determinant_peak": None}
+
+    if all(matrix.rows == matrix.cols for matrix in matrices):
+        seconds, peak, _ = measure(lambda: [determinant(matrix) for matrix in matrices], repeat)
+        record.update(determinant_time=seconds, determinant_peak=peak)
+
+    return record
+
+
+def get_metadata():
+    """
+    Returns
+    -------
+    metadata: dict
+        The environment of the run.
+    """
+    return {"date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(), "platform": platform.platform(),
+            "sympy": sym.__version__, "numpy": np.__version__}
+
+
+def compare(results, baseline, threshold, floor):
+    """
+    Returns
+    -------
+    regressions: list
+        (name, metric, baseline, current) for every timing which is more than
+        threshold times its baseline and above floor seconds.
+    """
+    previous = {record["name"]: record for record in baseline["results"]}
+
+    regressions = []
+    for record in results:
+        old = previous.get(record["name"])
+        if old is None:
+            continue
+        for metric in ("construction_time", "determinant_time"):
+            if old[metric] is None or record[metric] is None:
+                continue
+            if record[metric] > max(threshold * old[metric], floor):
+                regressions.append((record["name"], metric, old[metric], record[metric]))
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--families", nargs="+", choices=sorted(FAMILIES), default=sorted(FAMILIES))
+    parser.add_argument("--formulations", nargs="+",
+                        default=["sylvester", "bezout", "dixon", "macaulay"])
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--output", default="results.json")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="a JSON file of a previous run to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.5,
+                        help="flag timings slower than threshold times the baseline")
+    parser.add_argument("--floor", type=float, default=0.05,
+                        help="ignore timings below this many seconds")
+    arguments = parser.parse_args()
+
+    results = []
+    print("{:<72} {:>12} {:>12} {:>12}".format("case", "build (s)", "det (s)", "peak (MB)"))
+    for family in arguments.families:
+        for formulation, settings in FAMILIES[family]:
+            if formulation not in arguments.formulations:
+                continue
+            record = run_case(family, formulation, settings, arguments.repeat)
+            results.append(record)
+
+            determinant_time = record["determinant_time"]
+            peak = max(record["construction_peak"], record["determinant_peak"] or 0)
+            print("{:<72} {:12.4f} {:>12} {:12.2f}".format(
+                record["name"], record["construction_time"],
+                "-" if determinant_time is None else "{:.4f}".format(determinant_time),
+                peak / 2 ** 20))
+
+    with open(arguments.output, "w") as f:
+        json.dump({"metadata": get_metadata(), "results": results}, f, indent=2)
+
+    if arguments.compare is None:
+        return
+
+    with open(arguments.compare) as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline, arguments.threshold, arguments.floor)
+    for name, metric, old, new in regressions:
+        print("REGRESSION {} {}: {:.4f}s -> {:.4f}s ({:.2f}x)".format(name, metric, old, new, new / old))
+    if regressions:
+        sys.exit(1)
+    print("No regressions against {}".format(arguments.compare))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Batched NumPy evaluation of parametric resultant matrices.
+
+A symbolic matrix from any of the four formulations is compiled once into a
+vectorised NumPy function of its parameters. Evaluating it on k parameter
+points returns a stacked (k, N, M) array, on which determinants, ranks and
+condition numbers are computed for the whole stack at once.
+"""
+import numpy as np
+import sympy as sym
+
+from canonical import get_symbols
+
+
+class CompiledMatrix():
+    """
+    A class for evaluating a symbolic matrix over many parameter points.
+    """
+
+    def __init__(self, matrix, parameters=None, dtype=None):
+        """
+        A class that takes a sympy matrix and compiles its entries into a
+        single NumPy function of the parameters.
+
+        Parameters
+        ----------
+        matrix: sympy Matrix
+            A matrix, for example from `sylvester_matrix`,
+            `cayley_bezout_matrix`, `get_dixon_matrix` or `get_matrix`.
+        parameters: list
+            The parameters of the entries. Defaults to the symbols and
+            indexed symbols of the matrix sorted by name.
+        dtype: numpy dtype
+            The dtype of the evaluated stack. Defaults to complex if an entry
+            contains the imaginary unit and to float otherwise.
+        """
+        if parameters is None:
+            parameters = sorted(get_symbols(matrix), key=sym.default_sort_key)
+
+        self.parameters = list(parameters)
+        self.shape = matrix.shape
+
+        if dtype is None:
+            dtype = complex if any(entry.has(sym.I) for entry in matrix) else float
+        self.dtype = np.dtype(dtype)
+
+        self.function = sym.lambdify(self.parameters, list(matrix), modules="numpy")
+
+    def get_points(self, points):
+        """
+        Returns
+        -------
+        points: numpy array
+            The points as a (k, p) array, where p is the number of parameters.
+            A one dimensional input is read as k values of a single parameter,
+            or as a single point if there are several parameters.
+        """
+        points = np.asarray(points, dtype=self.dtype)
+        if points.ndim == 0 or (points.ndim == 1 and len(self.parameters) != 1):
+            points = points.reshape(1, -1)
+
+        return points.reshape(len(points), len(self.parameters))
+
+    def __call__(self, points):
+        """
+        Returns
+        -------
+        stack: numpy array
+            The (k, N, M) array of the matrix evaluated at each of the k points.
+        """
+        points = self.get_points(points)
+        values = self.function(*points.T)
+
+        stack = np.empty((len(points), len(values)), dtype=self.dtype)
+        for index, value in enumerate(values):
+            stack[:, index] = value
+
+        return stack.reshape(len(points), *self.shape)
+
+
+def compile_matrix(matrix, parameters=None, dtype=None):
+    """
+    A function that takes a symbolic matrix and returns a `CompiledMatrix`,
+    which maps a (k, p) array of parameter points to a (k, N, M) stack.
+    """
+    return CompiledMatrix(matrix, parameters, dtype)
+
+
+def batched_slogdet(stack):
+    """
+    Returns
+    -------
+    sign: numpy array
+        The sign (or phase for complex stacks) of each determinant.
+    logdet: numpy array
+        The natural logarithm of the absolute value of each determinant.
+    """
+    return np.linalg.slogdet(stack)
+
+
+def batched_rank(stack, tol=None):
+    """
+    Returns
+    -------
+    ranks: numpy array
+        The numerical rank of each matrix of the stack, from its singular
+        values and the tolerance tol (NumPy's default if None).
+    """
+    return np.linalg.matrix_rank(stack, tol=tol)
+
+
+def batched_condition(stack):
+    """
+    Returns
+    -------
+    conditions: numpy array
+        The 2-norm condition number of each matrix of the stack, the ratio of
+        its largest to its smallest singular value.
+    """
+    return np.linalg.cond(stack)
@@ -0,0 +1,217 @@
+"""
+A content-addressed cache of constructed resultant matrices.
+
+Matrices are keyed by a hash of the canonical form of the polynomial system
+(expanded coefficients and variable order) and of the construction method.
+A bounded in-memory LRU tier is backed by an optional on-disk tier of pickle
+files, which survives restarts.
+"""
+import collections
+import hashlib
+import os
+import pickle
+import tempfile
+
+from canonical import serialize_system
+from dixon import DixonResultant
+from macaulay import MacaulayResultant
+
+
+def get_system_key(polynomials, variables, method):
+    """
+    Returns
+    -------
+    key: str
+        The sha256 hex digest of the canonical form of the system and of the
+        method name.
+    """
+    system = serialize_system(polynomials, variables)
+    return hashlib.sha256(repr((method, system)).encode()).hexdigest()
+
+
+class MatrixCache():
+    """
+    A class for caching constructed matrices in memory and on disk.
+    """
+
+    def __init__(self, max_entries=128, directory=None, max_disk_entries=1024):
+        """
+        Parameters
+        ----------
+        max_entries: int
+            The number of matrices kept in memory. The least recently used
+            entry is evicted first.
+        directory: str
+            A directory for the on-disk tier. No disk tier if None.
+        max_disk_entries: int
+            The number of files kept on disk. The least recently used file
+            is evicted first.
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+
+        self.memory = collections.OrderedDict()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def get_path(self, key):
+        """
+        Returns
+        -------
+        path: str
+            The file of a key in the on-disk tier.
+        """
+        return os.path.join(self.directory, key + ".pickle")
+
+    def store_memory(self, key, value):
+        """
+        Stores a value in the memory tier, evicting the least recently used
+        entries beyond max_entries.
+        """
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def store_disk(self, key, value):
+        """
+        Writes a value to the disk tier, evicting the least recently used
+        files beyond max_disk_entries. The pickle is written to a temporary
+        file in the same directory and moved into place, so that other
+        processes never read a partial file; files removed by another process
+        during the eviction are skipped.
+        """
+        path = self.get_path(key)
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as f:
+                pickle.dump(value, f)
+            os.replace(temporary, path)
+        except BaseException:
+            os.remove(temporary)
+            raise
+
+        others = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".pickle") and name != os.path.basename(path):
+                other = os.path.join(self.directory, name)
+                try:
+                    others.append((os.stat(other).st_mtime_ns, other))
+                except FileNotFoundError:
+                    continue
+        others.sort()
+        for _, other in others[:max(len(others) + 1 - self.max_disk_entries, 0)]:
+            try:
+                os.remove(other)
+            except FileNotFoundError:
+                pass
+
+    def load_disk(self, key):
+        """
+        Returns
+        -------
+        value: object
+            The value stored on disk for the key, or None.
+        """
+        path = self.get_path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        return value
+
+    def get(self, key):
+        """
+        Returns
+        -------
+        value: object
+            The cached value of the key, or None. A disk hit is promoted to the
+            memory tier.
+        """
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return self.memory[key]
+
+        if self.directory is not None:
+            value = self.load_disk(key)
+            if value is not None:
+                self.stats["disk_hits"] += 1
+                self.store_memory(key, value)
+                return value
+
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, key, value):
+        """
+        Stores the value in the memory tier and, if there is one, on disk.
+        """
+        self.store_memory(key, value)
+        if self.directory is not None:
+            self.store_disk(key, value)
+
+    def get_or_build(self, polynomials, variables, method, build):
+        """
+        Returns
+        -------
+        value: object
+            The cached value of the system for this method, or the value of
+            build() which is then cached.
+        """
+        key = get_system_key(polynomials, variables, method)
+
+        value = self.get(key)
+        if value is None:
+            value = build()
+            self.put(key, value)
+
+        return value
+
+    def clear(self):
+        """
+        Empties both tiers and resets the statistics.
+        """
+        self.memory.clear()
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pickle"):
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except FileNotFoundError:
+                        pass
+        self.stats = {key: 0 for key in self.stats}
+
+    def get_dixon_matrix(self, polynomials, variables):
+        """
+        Returns
+        -------
+        dixon_matrix: sympy Matrix
+            The Dixon matrix of the system, from the cache if possible.
+        """
+        def build():
+            return DixonResultant(polynomials, variables).dixon_matrix
+
+        return self.get_or_build(polynomials, variables, "dixon", build)
+
+    def get_macaulay_matrices(self, polynomials, variables):
+        """
+        Returns
+        -------
+        macaulay_matrix: sympy Matrix
+            The Macaulay's matrix of the system, from the cache if possible.
+        macaulay_submatrix: sympy Matrix
+            Its submatrix.
+        """
+        def build():
+            macaulay = MacaulayResultant(polynomials, variables)
+            return macaulay.matrix, macaulay.submatrix
+
+        return self.get_or_build(polynomials, variables, "macaulay", build)
+
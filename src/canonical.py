@@ -0,0 +1,109 @@
+"""
+Canonical, picklable forms of polynomial systems.
+
+The classes of this repository take lambdified callables, which cannot be
+sent to other processes or hashed. A system is converted to a canonical form
+instead: the variables and, for each polynomial, its expanded terms as sorted
+(exponents, coefficient) pairs, with sympy objects stored by `srepr`.
+"""
+import sympy as sym
+
+
+def as_expression(polynomial, variables):
+    """
+    Returns
+    -------
+    expression: sympy expression
+        The polynomial as an expression in the variables. Polynomials can be
+        given as sympy Poly objects, expressions or lambdified callables.
+    """
+    if isinstance(polynomial, sym.Poly):
+        return polynomial.as_expr()
+    if isinstance(polynomial, sym.Basic):
+        return polynomial
+    if callable(polynomial):
+        return sym.sympify(polynomial(*variables))
+
+    return sym.sympify(polynomial)
+
+
+def get_symbols(expression):
+    """
+    Returns
+    -------
+    symbols: set
+        The Symbol and Indexed atoms of a sympy expression or matrix, the
+        generators it is a polynomial in. Unlike `free_symbols`, the label of
+        an IndexedBase is only included where it also appears on its own.
+    """
+    expression = sym.sympify(expression)
+    indexed = expression.atoms(sym.Indexed)
+    dummies = {atom: sym.Dummy() for atom in indexed}
+
+    return (expression.xreplace(dummies).free_symbols - set(dummies.values())) | indexed
+
+
+def get_terms(polynomial, variables):
+    """
+    Returns
+    -------
+    terms: dict
+        The sparse representation of a polynomial in the variables, mapping
+        exponent tuples to sympy coefficients. Polynomials are accepted in any
+        form of `as_expression`.
+    """
+    if isinstance(polynomial, sym.Poly) and polynomial.gens == tuple(variables):
+        return dict(polynomial.terms())
+
+    return dict(sym.Poly(as_expression(polynomial, variables), *variables).terms())
+
+
+def serialize_polynomial(polynomial, variables):
+    """
+    Returns
+    -------
+    terms: tuple
+        The sorted (exponents, srepr(coefficient)) pairs of the expanded
+        polynomial in the variables.
+    """
+    terms = get_terms(polynomial, variables)
+
+    return tuple(sorted((powers, sym.srepr(coefficient)) for powers, coefficient in terms.items()))
+
+
+def deserialize_polynomial(terms, variables):
+    """
+    Returns
+    -------
+    polynomial: sympy expression
+        The polynomial rebuilt from the output of `serialize_polynomial`.
+    """
+    return sym.Add(*[sym.sympify(coefficient) * sym.Mul(*[v ** e for v, e in zip(variables, powers)])
+                     for powers, coefficient in terms])
+
+
+def serialize_system(polynomials, variables):
+    """
+    Returns
+    -------
+    system: tuple
+        The canonical form of a polynomial system, a pair of the srepr of the
+        variables and the serialized polynomials. It is hashable and picklable.
+    """
+    return (tuple(sym.srepr(v) for v in variables),
+            tuple(serialize_polynomial(p, variables) for p in polynomials))
+
+
+def deserialize_system(system):
+    """
+    Returns
+    -------
+    polynomials: list
+        The polynomials of a serialized system as sympy expressions.
+    variables: list
+        The variables of the system.
+    """
+    variables = [sym.sympify(v) for v in system[0]]
+    polynomials = [deserialize_polynomial(terms, variables) for terms in system[1]]
+
+    return polynomials, variables
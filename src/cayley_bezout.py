@@ -10,8 +10,15 @@ Literature: https://dl.acm.org/citation.cfm?doid=190347.190372.
 
 import sympy as sym
 
+from canonical import as_expression
+from core import get_bezoutian
+from fraction_free import bareiss_determinant, poly_rows, symmetric_bareiss_determinant
+from profiling import profiled, stage
+from sylvesters import get_coefficient_ring
 
-def cayley_bezout_matrix(p, q, x):
+
+@profiled("bezout.matrix")
+def cayley_bezout_matrix(p, q, x, method="recurrence"):
     """
     A function that takes two univariate non zero polynomials and returns the
     Caley-Bezout formulation matrix $n\timesn$, where $n$ is the maximum degree
@@ -19,17 +26,146 @@ def cayley_bezout_matrix(p, q, x):
 
     Parameters
     ----------
-    p: sympy lambdify function
-        A non zero polynomial.
-    q: sympy lambdify function
-        A non zero polynomial.
+    p: sympy polynomial
+        A non zero polynomial, as a sympy Poly, expression or lambdified
+        function of x.
+    q: sympy polynomial
+        A non zero polynomial, in any of the forms of p.
     x: sympy symbol
         Variable for which we are solving.
+    method: str
+        "recurrence" builds the entries directly from the coefficients of p
+        and q. "factor" divides the Cayley determinant by (x - a) symbolically.
+    """
+    p, q = as_expression(p, [x]), as_expression(q, [x])
+
+    if method == "factor":
+        return factor_bezout_matrix(p, q, x)
+
+    if method != "recurrence":
+        raise ValueError("Unknown method: {}".format(method))
+
+    degree = max(sym.Poly(p, x).degree(), sym.Poly(q, x).degree())
+    gens = get_coefficient_ring(p, q, x)
+
+    p_coefficients = get_ascending_coefficients(p, x, degree, gens)
+    q_coefficients = get_ascending_coefficients(q, x, degree, gens)
+
+    entries = get_bezoutian(p_coefficients, q_coefficients)
+
+    return sym.Matrix([[entries[column][degree - 1 - row].as_expr() for column in range(degree)]
+                       for row in range(degree)])
+
+
+@profiled("bezout.determinant")
+def cayley_bezout_determinant(p, q, x, method="ldl"):
+    """
+    A function that takes two univariate non zero polynomials and returns the
+    determinant of their Cayley-Bezout matrix, as a sympy polynomial in the
+    remaining parameters.
+
+    Parameters
+    ----------
+    p: sympy polynomial
+        A non zero polynomial, in any of the forms of `cayley_bezout_matrix`.
+    q: sympy polynomial
+        A non zero polynomial, in any of the forms of p.
+    x: sympy symbol
+        Variable for which we are solving.
+    method: str
+        "ldl" eliminates the symmetric Bezoutian fraction free from its upper
+        triangle, with half the storage and operations of a dense
+        elimination; the rows of `cayley_bezout_matrix` are those of the
+        Bezoutian in reverse order. "bareiss" eliminates the matrix fraction
+        free and "det" calls its determinant.
+    """
+    p, q = as_expression(p, [x]), as_expression(q, [x])
+    gens = get_coefficient_ring(p, q, x)
+
+    if method == "det":
+        return sym.Poly(cayley_bezout_matrix(p, q, x).det(), *gens)
+
+    if method == "bareiss":
+        _, rows = poly_rows(cayley_bezout_matrix(p, q, x), gens)
+        return sym.Poly(bareiss_determinant(rows), *gens) if rows else sym.Poly(1, *gens)
+
+    if method != "ldl":
+        raise ValueError("Unknown method: {}".format(method))
+
+    degree = max(sym.Poly(p, x).degree(), sym.Poly(q, x).degree())
+    entries = get_bezoutian(get_ascending_coefficients(p, x, degree, gens),
+                            get_ascending_coefficients(q, x, degree, gens))
+    upper = [entries[i][i:] for i in range(degree)]
+
+    with stage("bezout.ldl", size=degree):
+        determinant = symmetric_bareiss_determinant(upper) if upper else sym.Poly(1, *gens)
+
+    return determinant if degree * (degree - 1) // 2 % 2 == 0 else -determinant
+
+
+@profiled("bezout.resultant")
+def bezout_resultant(p, q, x, method="ldl"):
+    """
+    A function that takes two univariate non zero polynomials and returns
+    their Sylvester resultant from the determinant of their Cayley-Bezout
+    matrix, as a sympy polynomial in the remaining parameters.
+
+    For p and q of degrees m and n the determinant is lc(p) ** (m - n) times
+    the resultant if m >= n and (-1) ** (n * (m + 1)) * lc(q) ** (n - m)
+    times it otherwise; the extraneous factor is divided out exactly.
+
+    Parameters
+    ----------
+    p: sympy polynomial
+        A non zero polynomial, in any of the forms of `cayley_bezout_matrix`.
+    q: sympy polynomial
+        A non zero polynomial, in any of the forms of p.
+    x: sympy symbol
+        Variable for which we are solving.
+    method: str
+        The method of `cayley_bezout_determinant`.
+    """
+    p, q = as_expression(p, [x]), as_expression(q, [x])
+    gens = get_coefficient_ring(p, q, x)
+    p_polynomial, q_polynomial = sym.Poly(p, x), sym.Poly(q, x)
+    m, n = p_polynomial.degree(), q_polynomial.degree()
+
+    result = cayley_bezout_determinant(p, q, x, method)
+    if m != n:
+        leading = (p_polynomial.LC() if m > n else q_polynomial.LC()) ** abs(m - n)
+        result = result.exquo(sym.Poly(leading, *gens))
+
+    return -result if m < n and n * (m + 1) % 2 else result
+
+
+@profiled("bezout.coefficients")
+def get_ascending_coefficients(polynomial, x, degree, gens):
+    """
+    Returns
+    -------
+    coefficients: list
+        The degree + 1 coefficients of the polynomial, lowest power first, as
+        sympy polynomials in gens.
+    """
+    coefficients = sym.Poly(polynomial, x).all_coeffs()[::-1]
+    coefficients += [0] * (degree + 1 - len(coefficients))
+
+    return [sym.Poly(c, *gens) for c in coefficients]
+
+
+@profiled("bezout.factor")
+def factor_bezout_matrix(p, q, x):
+    """
+    Returns
+    -------
+    bezout_matrix: sympy Matrix
+        The Cayley-Bezout matrix, obtained by dividing the Cayley determinant
+        by (x - a) and factoring.
     """
     a = sym.symbols('a')
-    degree = max(sym.Poly(p(x)).degree(), sym.Poly(q(x)).degree())
+    degree = max(sym.Poly(p, x).degree(), sym.Poly(q, x).degree())
 
-    matrix = sym.Matrix([[p(x), q(x)], [p(a), q(a)]])
+    matrix = sym.Matrix([[p, q], [p.subs(x, a), q.subs(x, a)]])
 
     bezout_polynomial = (matrix.det() / (x - a)).factor().collect(a)
     coefficients = sym.Poly(bezout_polynomial, a).all_coeffs()
@@ -40,4 +176,3 @@ def cayley_bezout_matrix(p, q, x):
                                 for row in coefficients])
 
     return bezout_matrix
-
@@ -0,0 +1,456 @@
+"""
+A lightweight core of the resultant formulations which does not import sympy.
+
+Polynomials are dictionaries mapping exponent tuples to coefficients, the
+sparse terms of `canonical.get_terms`, and univariate polynomials can also be
+given as coefficient lists, highest power first. With coefficients that are
+Python integers or `fractions.Fraction` the Sylvester, Bezout and Macaulay
+matrices are lists of rows of plain numbers and their resultants are computed
+by fraction-free elimination, so a short-lived worker only pays for the
+import of this module. Sympy is imported lazily, when a sympy polynomial is
+given or a sympy matrix is requested; NumPy only by `to_array`.
+
+The symbolic modules build on the same functions: `sylvesters`,
+`cayley_bezout` and `macaulay` take their rows, Bezoutian and monomial
+structure from here.
+"""
+import fractions
+import sys
+
+from fraction_free import bareiss_determinant, exact_quotient, permutation_sign, sparse_bareiss_minors
+from profiling import profiled
+
+
+def is_symbolic(value):
+    """
+    Returns
+    -------
+    symbolic: bool
+        Whether a value is a sympy object, decided without importing sympy.
+    """
+    return type(value).__module__.split(".")[0] == "sympy"
+
+
+def to_number(value):
+    """
+    Returns
+    -------
+    number: int or Fraction
+        An integer, rational or float coefficient (Python, NumPy or sympy) as a
+        Python int, or as a Fraction if it is not integral. Floats are
+        converted exactly. Other sympy coefficients are returned unchanged.
+    """
+    if isinstance(value, int):
+        return int(value)
+    if is_symbolic(value):
+        if not value.is_Rational:
+            return value
+        value = fractions.Fraction(int(value.p), int(value.q))
+    else:
+        value = fractions.Fraction(value)
+
+    return value.numerator if value.denominator == 1 else value
+
+
+def get_terms(polynomial, variables=None):
+    """
+    Returns
+    -------
+    terms: dict
+        The sparse terms of a polynomial with int or Fraction coefficients
+        where possible. A dictionary of terms is normalised; any other input
+        (a sympy Poly, expression or lambdified function) needs the variables
+        and goes through `canonical.get_terms`, which imports sympy.
+    """
+    if isinstance(polynomial, dict):
+        return {tuple(powers): to_number(c) for powers, c in polynomial.items() if c != 0}
+
+    from canonical import get_terms as get_sympy_terms
+
+    return {powers: to_number(c) for powers, c in get_sympy_terms(polynomial, variables).items()}
+
+
+def get_coefficients(polynomial):
+    """
+    Returns
+    -------
+    coefficients: list
+        The coefficients of a univariate polynomial, highest power first,
+        from a coefficient list or a dictionary of terms. Leading zeros are
+        dropped.
+    """
+    if isinstance(polynomial, dict):
+        degree = max(powers[0] for powers in polynomial)
+        coefficients = [0] * (degree + 1)
+        for (power,), coefficient in polynomial.items():
+            coefficients[degree - power] = to_number(coefficient)
+    else:
+        coefficients = [to_number(c) for c in polynomial]
+
+    while len(coefficients) > 1 and coefficients[0] == 0:
+        coefficients = coefficients[1:]
+    if not any(c != 0 for c in coefficients):
+        raise ValueError('The polynomial is zero.')
+
+    return coefficients
+
+
+def get_sylvester_rows(p_coefficients, q_coefficients, zero=0):
+    """
+    Returns
+    -------
+    rows: list
+        The rows of the Sylvester's matrix of two polynomials given by their
+        coefficient lists, highest power first. The first n rows are shifts of
+        p and the last m rows are shifts of q.
+    """
+    matrix_size = len(p_coefficients) + len(q_coefficients) - 2
+
+    rows = []
+    for coefficients in [p_coefficients, q_coefficients]:
+        for shift in range(matrix_size - len(coefficients) + 1):
+            padding = matrix_size - len(coefficients) - shift
+            rows.append([zero] * shift + list(coefficients) + [zero] * padding)
+
+    return rows
+
+
+@profiled("bezout.bezoutian")
+def get_bezoutian(p_coefficients, q_coefficients):
+    """
+    Returns
+    -------
+    entries: list
+        The coefficients b_ij of x ** i * a ** j in the Bezoutian
+        (p(x)q(a) - p(a)q(x)) / (x - a), given the coefficients of p and q
+        lowest power first. Multiplying by (x - a) gives
+        b_{i-1, j} - b_{i, j-1} = p_i q_j - p_j q_i, which is solved for
+        decreasing i in O(n ** 2) operations.
+    """
+    degree = len(p_coefficients) - 1
+
+    entries = [[0] * degree for _ in range(degree + 1)]
+    for i in range(degree - 1, -1, -1):
+        for j in range(degree):
+            entry = (p_coefficients[i + 1] * q_coefficients[j]
+                     - p_coefficients[j] * q_coefficients[i + 1])
+            if j > 0:
+                entry += entries[i + 1][j - 1]
+            entries[i][j] = entry
+
+    return entries[:degree]
+
+
+def pseudo_remainder(a, b):
+    """
+    Returns
+    -------
+    remainder: list
+        The pseudo remainder lc(b) ** (deg a - deg b + 1) * a modulo b of two
+        coefficient lists, highest power first, without leading zeros. The
+        coefficients are ring elements; no division is needed.
+    """
+    remainder = list(a)
+    leading = b[0]
+    for _ in range(len(a) - len(b) + 1):
+        factor = remainder[0]
+        remainder = [leading * r - factor * b[i] if i < len(b) else leading * r
+                     for i, r in enumerate(remainder)][1:]
+
+    start = next((i for i, r in enumerate(remainder) if r), len(remainder))
+    return remainder[start:]
+
+
+def get_euclidean_resultant(p_coefficients, q_coefficients):
+    """
+    Returns
+    -------
+    resultant: ring element
+        The determinant of the Sylvester's matrix of two polynomials given by
+        their coefficient lists, highest power first, by the subresultant
+        polynomial remainder sequence. Each pseudo remainder is divided
+        exactly by g * h ** delta, which keeps the coefficients to the size of
+        the subresultants, so the resultant costs O(m * n) ring operations
+        instead of the O((m + n) ** 3) of an elimination of the matrix.
+
+        Literature: H. Cohen, A Course in Computational Algebraic Number
+        Theory, Algorithm 3.3.7.
+    """
+    a, b = list(p_coefficients), list(q_coefficients)
+    one = a[0] ** 0
+    sign = 1
+    if len(a) < len(b):
+        a, b = b, a
+        if (len(a) - 1) % 2 and (len(b) - 1) % 2:
+            sign = -1
+
+    g = h = one
+    while len(b) > 1:
+        delta = len(a) - len(b)
+        if (len(a) - 1) % 2 and (len(b) - 1) % 2:
+            sign = -sign
+
+        remainder = pseudo_remainder(a, b)
+        if not remainder:
+            return one * 0
+
+        divisor = g * h ** delta
+        a, b = b, [exact_quotient(r, divisor) for r in remainder]
+        g = a[0]
+        if delta == 1:
+            h = g
+        elif delta > 1:
+            h = exact_quotient(g ** delta, h ** (delta - 1))
+
+    degree = len(a) - 1
+    if degree == 0:
+        return sign * one
+    if degree > 1:
+        h = exact_quotient(b[0] ** degree, h ** (degree - 1))
+    else:
+        h = b[0]
+
+    return h if sign == 1 else -h
+
+
+def sylvester_matrix(p, q):
+    """
+    A function that takes two non zero univariate polynomials, as coefficient
+    lists (highest power first) or dictionaries of terms, and returns the rows
+    of their Sylvester's matrix, as `sylvesters.sylvester_matrix`.
+    """
+    return get_sylvester_rows(get_coefficients(p), get_coefficients(q))
+
+
+def bezout_matrix(p, q):
+    """
+    A function that takes two non zero univariate polynomials, in the forms of
+    `sylvester_matrix`, and returns the rows of their Cayley-Bezout matrix, as
+    `cayley_bezout.cayley_bezout_matrix`.
+    """
+    p_coefficients, q_coefficients = get_coefficients(p)[::-1], get_coefficients(q)[::-1]
+    degree = max(len(p_coefficients), len(q_coefficients)) - 1
+    p_coefficients += [0] * (degree + 1 - len(p_coefficients))
+    q_coefficients += [0] * (degree + 1 - len(q_coefficients))
+
+    entries = get_bezoutian(p_coefficients, q_coefficients)
+    return [[entries[column][degree - 1 - row] for column in range(degree)] for row in range(degree)]
+
+
+def sylvester_resultant(p, q, method="bareiss"):
+    """
+    A function that takes two non zero univariate polynomials, in the forms of
+    `sylvester_matrix`, and returns their resultant, the determinant of the
+    Sylvester's matrix, as an int or Fraction. With method "bareiss" the
+    matrix is eliminated fraction free; "euclidean" runs the subresultant
+    remainder sequence of `get_euclidean_resultant` on the coefficients.
+    """
+    if method == "euclidean":
+        return to_number(get_euclidean_resultant(get_coefficients(p), get_coefficients(q)))
+    if method != "bareiss":
+        raise ValueError("Unknown method: {}".format(method))
+
+    return to_number(bareiss_determinant(sylvester_matrix(p, q)))
+
+
+def get_exponents(degree, n):
+    """
+    Returns
+    -------
+    exponents: list
+        A list of the exponent tuples of all monomials of a certain degree in
+        n variables, in decreasing lexicographic order.
+    """
+    def compositions(total, length):
+        if length == 1:
+            yield (total,)
+            return
+        for first in range(total, -1, -1):
+            for rest in compositions(total - first, length - 1):
+                yield (first,) + rest
+
+    if degree < 0:
+        return []
+
+    return list(compositions(degree, n))
+
+
+def get_divisibility_mask(exponents, degrees):
+    """
+    Returns
+    -------
+    mask: tuple
+        For each variable x_i whether the monomial is divisible by
+        x_i ** d_i, where d_i is the degree of the i polynomial.
+    """
+    return tuple(e >= d for e, d in zip(exponents, degrees))
+
+
+def get_row_exponents(degrees, degree_m):
+    """
+    Returns
+    -------
+    row_exponents: list
+        For each polynomial i the exponent tuples of its Macaulay row
+        multipliers: the monomials of degree degree_m - d_i which are not
+        divisible by x_j ** d_j for any j < i.
+    """
+    return [[exponents for exponents in get_exponents(degree_m - d, len(degrees))
+             if not any(get_divisibility_mask(exponents, degrees)[:i])]
+            for i, d in enumerate(degrees)]
+
+
+def iter_macaulay_rows(terms, row_exponents, monomial_index):
+    """
+    Returns
+    -------
+    rows: generator
+        The rows of Macaulay's matrix one at a time, each a list of (column,
+        coefficient) pairs sorted by column. A row is a polynomial times a
+        multiplier, so only its terms are placed, by the column index of
+        their exponents.
+    """
+    for polynomial, multipliers in zip(terms, row_exponents):
+        items = list(polynomial.items())
+        for multiplier in multipliers:
+            row = []
+            for powers, coefficient in items:
+                column = monomial_index.get(tuple(a + b for a, b in zip(powers, multiplier)))
+                if column is not None:
+                    row.append((column, coefficient))
+            row.sort()
+            yield row
+
+
+def get_macaulay_structure(terms):
+    """
+    Returns
+    -------
+    structure: dict
+        The degrees d_i of n polynomials in n variables, degree_m =
+        1 + sum(d_i - 1), the exponents of the monomials of degree degree_m
+        (the columns of Macaulay's matrix), their index, the row multipliers,
+        the column of the monomial x_i ** d_i times the multiplier of each
+        row, and the extraneous rows and columns, those of the monomials
+        divisible by at least two x_i ** d_i.
+    """
+    degrees = [max(sum(powers) for powers in polynomial) for polynomial in terms]
+    degree_m = 1 + sum(d - 1 for d in degrees)
+    monomials = get_exponents(degree_m, len(degrees))
+    monomial_index = {exponents: j for j, exponents in enumerate(monomials)}
+    row_exponents = get_row_exponents(degrees, degree_m)
+
+    row_monomials = []
+    for i, multipliers in enumerate(row_exponents):
+        for exponents in multipliers:
+            product = list(exponents)
+            product[i] += degrees[i]
+            row_monomials.append(monomial_index[tuple(product)])
+
+    columns = [j for j, exponents in enumerate(monomials)
+               if sum(get_divisibility_mask(exponents, degrees)) >= 2]
+    column_set = set(columns)
+    rows = [row for row, column in enumerate(row_monomials) if column in column_set]
+
+    return {"degrees": degrees, "degree_m": degree_m, "monomials": monomials,
+            "monomial_index": monomial_index, "row_exponents": row_exponents,
+            "row_monomials": row_monomials, "extraneous": (rows, columns)}
+
+
+def macaulay_matrix(terms):
+    """
+    A function that takes n homogeneous polynomials in n variables as
+    dictionaries of terms and returns the rows of their Macaulay's matrix,
+    as `MacaulayResultant.get_matrix`.
+    """
+    terms = [get_terms(polynomial) for polynomial in terms]
+    structure = get_macaulay_structure(terms)
+
+    matrix = []
+    for pairs in iter_macaulay_rows(terms, structure["row_exponents"], structure["monomial_index"]):
+        row = [0] * len(structure["monomials"])
+        for column, coefficient in pairs:
+            row[column] = coefficient
+        matrix.append(row)
+
+    return matrix
+
+
+def get_macaulay_quotient(entries, row_monomials, extraneous):
+    """
+    Returns
+    -------
+    resultant: ring element
+        The quotient det(M) / det(A) of Macaulay's matrix M, given by rows of
+        dictionaries {column: entry}, by its extraneous minor A. The rows and
+        columns of A are moved first, so that a single sparse fraction-free
+        elimination gives det(A) as a leading minor on the way to det(M), and
+        the quotient is exact. The sign is normalised so that the resultant
+        of x_1 ** d_1, ..., x_n ** d_n is 1. Raises ValueError if det(A)
+        vanishes.
+    """
+    rows, columns = extraneous
+    row_set, column_set = set(rows), set(columns)
+    row_order = rows + [r for r in range(len(entries)) if r not in row_set]
+    column_order = columns + [c for c in range(len(entries)) if c not in column_set]
+    position = {column: k for k, column in enumerate(column_order)}
+
+    reordered = [{position[j]: entry for j, entry in entries[i].items()} for i in row_order]
+    extraneous_minor, determinant = sparse_bareiss_minors(reordered, [len(rows), len(row_order)])
+    if not extraneous_minor:
+        raise ValueError('The extraneous factor vanishes for this system.')
+
+    monomial_permutation = [position[row_monomials[row]] for row in row_order]
+    sign = permutation_sign(monomial_permutation[:len(rows)]) * permutation_sign(monomial_permutation)
+
+    resultant = exact_quotient(determinant, extraneous_minor) if determinant else determinant
+    return resultant if sign == 1 else -resultant
+
+
+def macaulay_resultant(terms):
+    """
+    A function that takes n homogeneous polynomials in n variables with
+    integer or rational coefficients, as dictionaries of terms, and returns
+    their Macaulay's resultant as an int or Fraction, as
+    `MacaulayResultant.get_resultant`.
+    """
+    terms = [get_terms(polynomial) for polynomial in terms]
+    structure = get_macaulay_structure(terms)
+
+    entries = [dict(pairs) for pairs in
+               iter_macaulay_rows(terms, structure["row_exponents"], structure["monomial_index"])]
+    return to_number(get_macaulay_quotient(entries, structure["row_monomials"], structure["extraneous"]))
+
+
+def to_sympy_matrix(rows):
+    """
+    Returns
+    -------
+    matrix: sympy Matrix
+        The rows as a sympy matrix. This imports sympy.
+    """
+    import sympy as sym
+
+    return sym.Matrix([[sym.sympify(entry) for entry in row] for row in rows])
+
+
+def to_array(rows, dtype=float):
+    """
+    Returns
+    -------
+    array: numpy array
+        The rows as a NumPy array, float64 by default. This imports NumPy.
+    """
+    import numpy as np
+
+    return np.array(rows, dtype=dtype)
+
+
+def is_sympy_loaded():
+    """
+    Returns
+    -------
+    loaded: bool
+        Whether sympy has been imported in this process.
+    """
+    return "sympy" in sys.modules
@@ -6,15 +6,28 @@ Dixon's resultant is a generalisation of the Cayley-Bezout resultant.
 """
 
 import sympy as sym
-import numpy as np
+import math
 import functools
+import random
 
-from sympy.polys.monomials import itermonomials
+from canonical import get_symbols, get_terms
+from fraction_free import bareiss_determinant, poly_rows
+from interpolation import interpolate_determinant
+from modular import (LARGEST_PRIME, evaluate_modular_terms, get_modular_terms,
+                     modular_determinant, rank_profile_mod_prime)
+from profiling import profiled, stage
 
 class DixonResultant():
     """
     A class for retrieving the Dixon's resultant of a multivariate system.
+
+    The pipeline stages (terms, degrees, Dixon's polynomial, matrix and
+    resultant) are attributes computed on first access and cached. Cheap
+    stages such as the degree and size bounds do not build the matrix.
+    `invalidate` drops the cached stages.
     """
+    stages = ("terms", "dummy_variables", "max_degrees", "upper_degree",
+              "size_bounds", "dixon_polynomial", "dixon_matrix", "resultant")
 
     def __init__(self, polynomials, variables):
         """
@@ -26,16 +39,61 @@ class DixonResultant():
         variables: list
             A list of all n variables
         polynomials : list of sympy polynomials
-            A  list of m n-degree polynomials
+            A  list of m n-degree polynomials, given as sympy Poly objects,
+            expressions or lambdified functions of the variables. They are
+            converted once to dictionaries of exponent tuples, `self.terms`.
         """
         self.polynomials = polynomials
         self.variables = variables
 
-        self.n = len(self.variables)
-        self.m = len(self.polynomials)
+    @property
+    def n(self):
+        return len(self.variables)
+
+    @property
+    def m(self):
+        return len(self.polynomials)
+
+    @functools.cached_property
+    def terms(self):
+        return [get_terms(p, self.variables) for p in self.polynomials]
+
+    @functools.cached_property
+    def dummy_variables(self):
+        return self.get_dummy_variables()
+
+    @functools.cached_property
+    def max_degrees(self):
+        return self.get_max_degrees()
+
+    @functools.cached_property
+    def upper_degree(self):
+        return self.get_upper_degree()
+
+    @functools.cached_property
+    def size_bounds(self):
+        return self.get_size_bounds()
+
+    @functools.cached_property
+    def dixon_polynomial(self):
+        return self.get_dixon_polynomial()
 
-        self.dummy_variables = self.get_dummy_variables()
-        self.max_degrees = self.get_max_degrees()
+    @functools.cached_property
+    def dixon_matrix(self):
+        return self.get_dixon_matrix(self.dixon_polynomial)
+
+    @functools.cached_property
+    def resultant(self):
+        if self.dixon_matrix.rows != self.dixon_matrix.cols:
+            raise ValueError('The Dixon matrix is not square.')
+        return self.get_interpolated_determinant(self.dixon_matrix)
+
+    def invalidate(self):
+        """
+        Drops the cached stages, for instance after changing the polynomials.
+        """
+        for stage in self.stages:
+            self.__dict__.pop(stage, None)
 
     def get_dummy_variables(self):
         """
@@ -50,6 +108,19 @@ class DixonResultant():
 
         return dummy_variables
 
+    def get_parameters(self):
+        """
+        Returns
+        -------
+
+        parameters: list
+            The symbols and indexed symbols of the polynomials which are not
+            variables, sorted by name.
+        """
+        symbols = set().union(*[get_symbols(c) for terms in self.terms for c in terms.values()])
+        return sorted(symbols - set(self.variables), key=sym.default_sort_key)
+
+    @profiled("dixon.degrees")
     def get_max_degrees(self):
         """
         Returns
@@ -59,9 +130,11 @@ class DixonResultant():
             A list of the d_max of each variable. The max degree is the
             max(degree(p_1, x_i), ..., degree(p_m, x_i))
         """
-        return [sym.degree(f(*self.variables)) for f in self.polynomials]
+        return [max(powers[i] for terms in self.terms for powers in terms)
+                for i in range(self.n)]
 
-    def get_dixon_polynomial(self):
+    @profiled("dixon.polynomial")
+    def get_dixon_polynomial(self, method="divided_differences"):
         """
         Returns
         -------
@@ -76,25 +149,59 @@ class DixonResultant():
                  |p_1(a_1,... x_n), ..., p_n(a_1,... x_n)|
                  |...             , ...,              ...|
                  |p_1(a_1,... a_n), ..., p_n(a_1,... a_n)|
+
+            With method "divided_differences" row i of A is replaced by
+            (row_i - row_{i-1}) / (x_i - a_i), an exact polynomial division,
+            and the determinant is taken fraction free. Method "factor"
+            divides Delta(A) by the product and factors.
         """
         if self.m != (self.n + 1):
             raise Exception('Method invalid for given combination.')
 
-        # first row
-        rows = [[poly(*self.variables) for poly in self.polynomials]]
+        gens = [*self.variables, *self.dummy_variables]
+        with stage("dixon.substitution", size=self.m):
+            rows = [[self.get_substituted_polynomial(terms, idx, gens) for terms in self.terms]
+                    for idx in range(self.n + 1)]
 
-        temp = [*self.variables]
-        iterator = iter(self.dummy_variables)
+        if method == "factor":
+            A = sym.Matrix([[entry.as_expr() for entry in row] for row in rows])
+            product_of_differences = functools.reduce(lambda x, y: x * y,
+                                                      [a - b for a, b in zip(self.variables, self.dummy_variables)])
+            with stage("dixon.determinant", size=self.m):
+                determinant = A.det()
+            with stage("dixon.factor"):
+                dixon_polynomial = (determinant / product_of_differences).factor()
+            return sym.Poly(dixon_polynomial, *self.dummy_variables)
 
-        for idx in (idx for idx in range(self.n)):
-            temp[idx] = next(iterator)
-            rows.append([poly(*temp) for poly in self.polynomials])
+        if method != "divided_differences":
+            raise ValueError("Unknown method: {}".format(method))
 
-        A = sym.Matrix(rows)
-        product_of_differences = functools.reduce(lambda x, y: x * y,
-                                                  [a - b for a, b in zip(self.variables, self.dummy_variables)])
-        dixon_polynomial = (A.det() / product_of_differences).factor()
-        return sym.Poly(dixon_polynomial, *self.dummy_variables)
+        with stage("dixon.divided_differences", size=self.m):
+            for idx in range(self.n, 0, -1):
+                difference = sym.Poly(self.variables[idx - 1] - self.dummy_variables[idx - 1], *gens)
+                rows[idx] = [(current - previous).exquo(difference)
+                             for current, previous in zip(rows[idx], rows[idx - 1])]
+
+        with stage("dixon.determinant", size=self.m):
+            dixon_polynomial = bareiss_determinant(rows)
+        return sym.Poly(dixon_polynomial.as_expr(), *self.dummy_variables)
+
+    def get_substituted_polynomial(self, terms, idx, gens):
+        """
+        Returns
+        -------
+        polynomial: sympy polynomial
+            The polynomial with the first idx variables x_i replaced by alpha_i,
+            as a sympy polynomial in gens = (x_1, ..., x_n, alpha_1, ..., alpha_n).
+            The substitution moves exponents, no expression is evaluated.
+        """
+        substituted = {}
+        for powers, coefficient in terms.items():
+            shifted = tuple(0 if i < idx else e for i, e in enumerate(powers)) + \
+                      tuple(e if i < idx else 0 for i, e in enumerate(powers))
+            substituted[shifted] = coefficient
+
+        return sym.Poly.from_dict(substituted, *gens)
 
     def get_coefficients_of_alpha(self, polynomial):
         """
@@ -104,34 +211,125 @@ class DixonResultant():
             A list of coefficients (in x_i, ..., x_n terms) of the power products
             a_1, ..., _n in Dixon's polynomial
         """
-        coefficients = []
-        for powers in polynomial.monoms():
-            monomial = functools.reduce(lambda i, j: i * j,
-                                    [a ** b for a, b in zip(self.dummy_variables, powers)])
-            coefficients.append(polynomial.coeff_monomial(monomial))
-
-        return coefficients
+        return polynomial.coeffs()
 
     def get_upper_degree(self):
-        list_of_products = [self.variables[i] ** ((i + 1) * self.max_degrees[i] -1)
-                                                        for i in range(self.n)]
-        product =  np.prod(list_of_products)
-        product = sym.Poly(product).monoms()
+        """
+        Returns
+        -------
+        upper_degree: int
+            The total degree of the product x_1 ** (d_1 - 1) ... x_n ** (n d_n - 1),
+            where d_i is the max degree of x_i.
+        """
+        return sum(max((i + 1) * d - 1, 0) for i, d in enumerate(self.max_degrees))
+
+    def get_size_bounds(self):
+        """
+        Returns
+        -------
+        rows: int
+            An upper bound of the number of rows of the Dixon matrix. Dixon's
+            polynomial has degree at most (n - i + 1) d_i - 1 in a_i.
+        columns: int
+            An upper bound of the number of columns. Dixon's polynomial has
+            degree at most i d_i - 1 in x_i.
+        """
+        rows = math.prod([(self.n - i) * d for i, d in enumerate(self.max_degrees)])
+        columns = math.prod([(i + 1) * d for i, d in enumerate(self.max_degrees)])
 
-        return sym.polys.monomials.monomial_deg(*product)
+        return rows, columns
 
+    @profiled("dixon.matrix")
     def get_dixon_matrix(self, polynomial):
         """
         Construct the Dixon matrix from the coefficients of polynomial \alpha. Each coefficient is
-        viewed as a polynomial of x and y.
+        viewed as a polynomial of x and y. The columns are the monomials that appear in the
+        coefficients, in graded lexicographic order.
         """
-        coefficients = self.get_coefficients_of_alpha(polynomial)
-        size = len(polynomial.monoms())
-        monomials = list(itermonomials(self.variables, self.get_upper_degree()))
+        rows = [dict(sym.Poly(c, *self.variables).terms())
+                for c in self.get_coefficients_of_alpha(polynomial)]
 
-        array = np.array([[sym.Poly(c, *self.variables).coeff_monomial(m) for m in monomials]
-                                                         for c in coefficients])
+        support = sorted(set().union(*rows), key=lambda powers: (sum(powers), powers))
+        columns = {powers: j for j, powers in enumerate(support)}
+
+        dixon_matrix = sym.zeros(len(rows), len(support))
+        for i, row in enumerate(rows):
+            for powers, coefficient in row.items():
+                dixon_matrix[i, columns[powers]] = coefficient
 
-        dixon_matrix = sym.Matrix(np.delete(array, np.nonzero((array==0).sum(axis=0) == size), 
-                                                                        axis=1))
         return dixon_matrix
+
+    @profiled("dixon.interpolated_determinant")
+    def get_interpolated_determinant(self, matrix):
+        """
+        Returns
+        -------
+
+        determinant: sympy polynomial
+            The determinant of a square Dixon matrix as a polynomial in the
+            parameters. The parameters are substituted by integer points, the
+            numerical determinants are computed modulo primes and the result
+            is interpolated within the degree bounds of the matrix rows.
+        """
+        return interpolate_determinant(matrix, self.get_parameters())
+
+    @profiled("dixon.maximal_minor")
+    def get_maximal_minor(self, matrix=None, trials=2, seed=None):
+        """
+        Returns
+        -------
+        rows: list
+            The rows of a maximal non singular submatrix of the Dixon matrix.
+        columns: list
+            Its columns. The parameters are substituted by random points and
+            the rank profile is computed modulo a prime; the evaluation of
+            largest rank out of trials is kept, which has the rank of the
+            symbolic matrix with high probability.
+        """
+        matrix = self.dixon_matrix if matrix is None else matrix
+        parameters = self.get_parameters()
+        terms = get_modular_terms(matrix, parameters, LARGEST_PRIME)
+        rng = random.Random(seed)
+
+        best = [], []
+        for _ in range(trials if parameters else 1):
+            point = [rng.randrange(1, LARGEST_PRIME) for _ in parameters]
+            rows = evaluate_modular_terms(terms, matrix.shape, point, LARGEST_PRIME)
+            profile = rank_profile_mod_prime(rows, LARGEST_PRIME)
+            if len(profile[0]) > len(best[0]):
+                best = profile
+
+        return best
+
+    @profiled("dixon.resultant")
+    def get_dixon_resultant(self, method="bareiss", seed=None):
+        """
+        Returns
+        -------
+        resultant: sympy polynomial
+            The projection operator of Kapur, Saxena and Yang: the determinant
+            of a maximal non singular submatrix of the Dixon matrix, as a
+            polynomial in the parameters (or a number if there are none). It
+            is a multiple of the resultant and it is defined when the Dixon
+            matrix is not square or is singular.
+
+            With method "bareiss" the minor is eliminated fraction free over
+            the polynomial ring of the parameters; with "interpolation" its
+            determinant is interpolated from modular evaluations.
+        """
+        if method not in ("bareiss", "interpolation"):
+            raise ValueError("Unknown method: {}".format(method))
+
+        rows, columns = self.get_maximal_minor(seed=seed)
+        parameters = self.get_parameters()
+        if not rows:
+            return sym.Poly(0, *parameters) if parameters else sym.Integer(0)
+
+        minor = self.dixon_matrix.extract(rows, columns)
+        if not parameters:
+            return modular_determinant(minor)
+        if method == "interpolation":
+            return interpolate_determinant(minor, parameters)
+
+        gens, entries = poly_rows(minor, tuple(parameters))
+        return bareiss_determinant(entries)
@@ -0,0 +1,285 @@
+"""
+Fraction-free (Bareiss) elimination over polynomial coefficient rings.
+
+The determinant of a matrix whose entries are polynomials is computed with
+exact divisions only, so intermediate entries stay polynomials and no
+rational function simplification is needed.
+
+The eliminations only use ring operations, so they also run on plain Python
+integers and `fractions.Fraction`; sympy is imported by the functions which
+convert sympy matrices.
+
+Literature: https://doi.org/10.1090/S0025-5718-1968-0226829-0.
+"""
+
+
+def exact_quotient(a, b):
+    """
+    Returns
+    -------
+    quotient: ring element
+        The exact quotient a / b of two elements of the same ring. Sympy
+        polynomials are divided with `exquo`, integers with floor division and
+        any other number with plain division.
+    """
+    if hasattr(a, "exquo"):
+        return a.exquo(b)
+    if isinstance(a, int) and isinstance(b, int):
+        return a // b
+    return a / b
+
+
+def poly_rows(matrix, gens=None):
+    """
+    Returns
+    -------
+    gens: tuple
+        The generators of the coefficient ring. These are the symbols and
+        indexed symbols of the matrix sorted by name, unless given explicitly.
+    rows: list
+        The entries of the matrix as sympy polynomials in gens. If there are
+        no generators the entries are sympy numbers.
+    """
+    import sympy as sym
+
+    from canonical import get_symbols
+
+    if gens is None:
+        gens = tuple(sorted(get_symbols(matrix), key=sym.default_sort_key))
+
+    if not gens:
+        return gens, [[sym.sympify(entry) for entry in matrix.row(i)]
+                      for i in range(matrix.rows)]
+
+    return gens, [[sym.Poly(entry, *gens) for entry in matrix.row(i)]
+                  for i in range(matrix.rows)]
+
+
+def bareiss_determinant(rows, previous=None):
+    """
+    Returns
+    -------
+    determinant: ring element
+        The determinant of a square matrix given as a list of rows. The
+        entries can be any exact ring elements (sympy polynomials, integers or
+        rationals). Rows are swapped when a pivot vanishes. To continue an
+        elimination on its trailing block, previous is the last pivot, by
+        which the first step divides.
+    """
+    size = len(rows)
+    if size == 0:
+        return 1
+
+    rows = [list(row) for row in rows]
+    sign = 1
+
+    for k in range(size - 1):
+        if not rows[k][k]:
+            swap = next((i for i in range(k + 1, size) if rows[i][k]), None)
+            if swap is None:
+                return rows[k][k] * 0
+            rows[k], rows[swap] = rows[swap], rows[k]
+            sign = -sign
+
+        pivot = rows[k][k]
+        for i in range(k + 1, size):
+            for j in range(k + 1, size):
+                entry = pivot * rows[i][j] - rows[i][k] * rows[k][j]
+                rows[i][j] = entry if previous is None else exact_quotient(entry, previous)
+        previous = pivot
+
+    determinant = rows[-1][-1]
+    return determinant if sign == 1 else -determinant
+
+
+def symmetric_bareiss_determinant(upper):
+    """
+    Returns
+    -------
+    determinant: ring element
+        The determinant of a symmetric matrix stored as its upper triangle,
+        where upper[i] holds the entries i, ..., N - 1 of row i. The
+        fraction-free updates keep the trailing block symmetric, so only half
+        of it is stored and updated: the pivots are the diagonal of a
+        fraction-free LDL^T factorisation and the last one is the
+        determinant. A vanishing pivot is replaced by a non zero diagonal
+        entry, swapping a row and the same column; if the trailing diagonal
+        is zero the elimination continues on the full trailing block with
+        `bareiss_determinant`.
+    """
+    size = len(upper)
+    if size == 0:
+        return 1
+
+    upper = [list(row) for row in upper]
+    index = list(range(size))
+
+    def get(i, j):
+        i, j = sorted((index[i], index[j]))
+        return upper[i][j - i]
+
+    def put(i, j, entry):
+        i, j = sorted((index[i], index[j]))
+        upper[i][j - i] = entry
+
+    previous = None
+    for k in range(size - 1):
+        if not get(k, k):
+            swap = next((i for i in range(k + 1, size) if get(i, i)), None)
+            if swap is None:
+                trailing = [[get(i, j) for j in range(k, size)] for i in range(k, size)]
+                return bareiss_determinant(trailing, previous)
+            index[k], index[swap] = index[swap], index[k]
+
+        pivot = get(k, k)
+        for i in range(k + 1, size):
+            factor = get(k, i)
+            for j in range(i, size):
+                entry = pivot * get(i, j) - factor * get(k, j)
+                put(i, j, entry if previous is None else exact_quotient(entry, previous))
+        previous = pivot
+
+    return get(size - 1, size - 1)
+
+
+def sparse_poly_rows(matrix, gens=None):
+    """
+    Returns
+    -------
+    gens: tuple
+        The generators of the coefficient ring, as in `poly_rows`.
+    rows: list
+        For each row of the matrix a dictionary mapping the columns of its non
+        zero entries to sympy polynomials (or numbers if there are no gens).
+    """
+    import sympy as sym
+
+    from canonical import get_symbols
+
+    if gens is None:
+        gens = tuple(sorted(get_symbols(matrix), key=sym.default_sort_key))
+
+    rows = [{} for _ in range(matrix.rows)]
+    for (i, j), entry in matrix.todok().items():
+        if entry != 0:
+            rows[i][j] = sym.Poly(entry, *gens) if gens else sym.sympify(entry)
+
+    return gens, rows
+
+
+def sparse_bareiss_determinant(rows, size):
+    """
+    Returns
+    -------
+    determinant: ring element
+        The determinant of a square matrix given by rows of dictionaries
+        {column: entry}. Only the non zero entries are updated, and at each
+        step the pivot is the row with the fewest entries in the column.
+    """
+    return sparse_bareiss_minors(rows, [size])[0]
+
+
+def sparse_bareiss_minors(rows, sizes):
+    """
+    Returns
+    -------
+    minors: list
+        The leading principal minors of the given increasing sizes of a
+        square matrix given by rows of dictionaries {column: entry}, from one
+        sparse fraction-free elimination. Rows are only exchanged within the
+        smallest block which has a pivot, so each leading block keeps its
+        rows; the pivot is the row of that block with the fewest entries in
+        the column. A vanishing leading minor does not stop the elimination.
+    """
+    rows = [dict(row) for row in rows]
+    active = list(range(sizes[-1]))
+    minors = {size: 1 for size in sizes if size == 0}
+    sign = 1
+    previous = None
+
+    for k in range(sizes[-1]):
+        # A block whose rows have no entry in column k is singular; the pivot
+        # is then taken from the smallest larger block which has one.
+        for size in sizes:
+            if size <= k:
+                continue
+            candidates = [t for t, r in enumerate(active[:size - k]) if k in rows[r]]
+            if candidates:
+                break
+            minors[size] = 0
+        else:
+            break
+        position = min(candidates, key=lambda t: len(rows[active[t]]))
+        if position != 0:
+            active[0], active[position] = active[position], active[0]
+            sign = -sign
+
+        pivot_row = rows[active.pop(0)]
+        pivot = pivot_row.pop(k)
+
+        for r in active:
+            row = rows[r]
+            factor = row.pop(k, None)
+            if factor is None:
+                updated = {column: pivot * entry for column, entry in row.items()}
+            else:
+                updated = {}
+                for column in set(row) | set(pivot_row):
+                    entry = pivot * row.get(column, 0) - factor * pivot_row.get(column, 0)
+                    if entry:
+                        updated[column] = entry
+            if previous is not None:
+                updated = {column: exact_quotient(entry, previous)
+                           for column, entry in updated.items()}
+            rows[r] = updated
+        previous = pivot
+
+        if k + 1 in sizes and k + 1 not in minors:
+            minors[k + 1] = previous if sign == 1 else -previous
+
+    return [minors.get(size, 0) for size in sizes]
+
+
+def permutation_sign(permutation):
+    """
+    Returns
+    -------
+    sign: int
+        The sign of a permutation of 0, ..., n - 1 given as a list, from the
+        parity of its cycles. Other lists of distinct integers are replaced
+        by their ranks, which gives the sign of the permutation sorting them.
+    """
+    rank = {value: k for k, value in enumerate(sorted(permutation))}
+    permutation = [rank[value] for value in permutation]
+
+    sign = 1
+    seen = [False] * len(permutation)
+    for start in range(len(permutation)):
+        length = 0
+        current = start
+        while not seen[current]:
+            seen[current] = True
+            current = permutation[current]
+            length += 1
+        if length and length % 2 == 0:
+            sign = -sign
+
+    return sign
+
+
+def sparse_determinant(matrix):
+    """
+    A function that takes a square (sparse) sympy matrix and returns its
+    determinant with a sparse fraction-free elimination, as a sympy polynomial
+    in the free symbols of the matrix or a number if there are none.
+
+    Parameters
+    ----------
+    matrix: sympy SparseMatrix
+        A square matrix with polynomial entries.
+    """
+    if matrix.rows != matrix.cols:
+        raise ValueError('Determinant of a non square matrix.')
+
+    gens, rows = sparse_poly_rows(matrix)
+    return sparse_bareiss_determinant(rows, matrix.rows)
@@ -0,0 +1,183 @@
+"""
+Evaluation and interpolation of parametric determinants.
+
+Instead of one large symbolic determinant, the parameters are substituted by
+integer points on a grid, each numerical determinant is computed with the
+modular backend and the determinant is rebuilt with a tensor product Newton
+interpolation. The entries are expanded into modular terms once, so that each
+evaluation is integer arithmetic only, and the evaluations are independent of
+each other.
+
+Literature: https://doi.org/10.1145/800206.806398.
+"""
+import itertools
+import math
+
+import sympy as sym
+
+from canonical import get_symbols
+from modular import (combine_residues, determinant_mod_prime, evaluate_modular_terms,
+                     get_crt_primes, get_modular_terms, hadamard_bound, modular_determinant)
+
+
+def get_parameters(matrix):
+    """
+    Returns
+    -------
+    parameters: tuple
+        The symbols and indexed symbols of the matrix sorted by name.
+    """
+    return tuple(sorted(get_symbols(matrix), key=sym.default_sort_key))
+
+
+def get_degree_bounds(matrix, parameters):
+    """
+    Returns
+    -------
+    degree_bounds: list
+        For each parameter an upper bound of the degree of the determinant in
+        that parameter. This is the smallest of the sums of the maximum entry
+        degrees over the rows and over the columns.
+    """
+    degrees = [[sym.Poly(entry, *parameters).degree_list() if entry != 0
+                else (0,) * len(parameters) for entry in matrix.row(i)]
+               for i in range(matrix.rows)]
+
+    bounds = []
+    for k in range(len(parameters)):
+        row_bound = sum(max(entry[k] for entry in row) for row in degrees)
+        column_bound = sum(max(row[j][k] for row in degrees) for j in range(matrix.cols))
+        bounds.append(min(row_bound, column_bound))
+
+    return bounds
+
+
+def get_evaluation_points(degree_bounds):
+    """
+    Returns
+    -------
+    points: iterator
+        The integer grid {0, ..., d_1} x ... x {0, ..., d_k} on which the
+        determinant is evaluated.
+    """
+    return itertools.product(*[range(bound + 1) for bound in degree_bounds])
+
+
+def get_evaluation_terms(matrix, parameters, degree_bounds):
+    """
+    Returns
+    -------
+    terms: dict
+        The entries of the matrix as given by `get_modular_terms` for each of
+        enough primes to recover its determinant at any point of the grid of
+        `get_evaluation_points` by the Chinese Remainder Theorem. The number
+        of primes follows from the Hadamard bound of the entries bounded at
+        the largest point of the grid.
+    denominator: int
+        The product over the rows of the lcm of the denominators of their
+        coefficients, which clears the denominator of the determinant.
+    """
+    bounds = [[0] * matrix.cols for _ in range(matrix.rows)]
+    scales = [1] * matrix.rows
+    for (i, j), entry in matrix.todok().items():
+        for exponents, coefficient in sym.Poly(entry, *parameters).terms():
+            coefficient = sym.Rational(coefficient)
+            scales[i] = math.lcm(scales[i], int(coefficient.q))
+            bounds[i][j] += abs(coefficient) * math.prod(
+                bound ** exponent for bound, exponent in zip(degree_bounds, exponents))
+
+    rows = [[int(entry * scale) for entry in row] for row, scale in zip(bounds, scales)]
+    primes = get_crt_primes(2 * hadamard_bound(rows))
+
+    return {prime: get_modular_terms(matrix, parameters, prime) for prime in primes}, math.prod(scales)
+
+
+def evaluate_determinant(terms, shape, denominator, point):
+    """
+    Returns
+    -------
+    determinant: sympy Rational
+        The exact determinant at an integer point of the grid of a matrix
+        given by `get_evaluation_terms`, from its determinants modulo each
+        prime.
+    """
+    residues = {prime: determinant_mod_prime(evaluate_modular_terms(prime_terms, shape, point, prime),
+                                             prime) * denominator % prime
+                for prime, prime_terms in terms.items()}
+
+    return sym.Rational(combine_residues(residues), denominator)
+
+
+def newton_interpolation(values, parameter, gens):
+    """
+    Returns
+    -------
+    polynomial: sympy Poly
+        The polynomial in gens of degree len(values) - 1 in parameter that
+        takes values[i] at parameter = i. The values are polynomials in gens.
+    """
+    coefficients = list(values)
+    degree = len(coefficients) - 1
+
+    for k in range(1, degree + 1):
+        for i in range(degree, k - 1, -1):
+            coefficients[i] = (coefficients[i] - coefficients[i - 1]) * sym.Rational(1, k)
+
+    polynomial = coefficients[degree]
+    for i in range(degree - 1, -1, -1):
+        polynomial = polynomial * sym.Poly(parameter - i, *gens) + coefficients[i]
+
+    return polynomial
+
+
+def interpolate_values(values, parameters, degree_bounds):
+    """
+    Returns
+    -------
+    polynomial: sympy Poly
+        The polynomial in the parameters that takes the given values on the
+        grid of `get_evaluation_points`. Values are given as a dictionary
+        mapping each point to a number.
+    """
+    def interpolate(prefix):
+        level = len(prefix)
+        if level == len(parameters):
+            return sym.Poly(values[prefix], *parameters, domain='QQ')
+
+        slices = [interpolate(prefix + (node,)) for node in range(degree_bounds[level] + 1)]
+        return newton_interpolation(slices, parameters[level], parameters)
+
+    return interpolate(())
+
+
+def interpolate_determinant(matrix, parameters=None, degree_bounds=None):
+    """
+    A function that takes a square matrix whose entries are polynomials in a
+    few parameters and returns its determinant as a sympy polynomial, or as a
+    number if there are no parameters.
+
+    Parameters
+    ----------
+    matrix: sympy Matrix
+        A square matrix with polynomial entries.
+    parameters: list
+        The parameters of the entries. Defaults to the free symbols.
+    degree_bounds: list
+        Upper bounds of the degree of the determinant in each parameter.
+        Defaults to `get_degree_bounds`.
+    """
+    if matrix.rows != matrix.cols:
+        raise ValueError('Determinant of a non square matrix.')
+
+    parameters = tuple(parameters) if parameters is not None else get_parameters(matrix)
+    if not parameters:
+        return modular_determinant(matrix)
+
+    if degree_bounds is None:
+        degree_bounds = get_degree_bounds(matrix, parameters)
+
+    terms, denominator = get_evaluation_terms(matrix, parameters, degree_bounds)
+    values = {point: evaluate_determinant(terms, matrix.shape, denominator, point)
+              for point in get_evaluation_points(degree_bounds)}
+
+    return interpolate_values(values, parameters, degree_bounds)
@@ -3,16 +3,33 @@ A class for creating the Macaulay's matrix and calculating the Macaulay's
 resultant. Literature:
 """
 
+import functools
+
 import sympy as sym
 
-from sympy.polys.monomials import itermonomials
-from sympy.polys.orderings import monomial_key
 from sympy.functions.combinatorial.factorials import binomial
 
+from canonical import get_symbols, get_terms
+from core import (get_divisibility_mask, get_exponents, get_macaulay_quotient, get_row_exponents,
+                  iter_macaulay_rows)
+from interpolation import interpolate_determinant
+from modular import LARGEST_PRIME, get_residue
+from profiling import profiled, stage
+from storage import write_sparse_rows
+
 class MacaulayResultant():
     """
     A class for calculating the Macaulay resultant.
+
+    The pipeline stages (degrees, monomial sets, row multipliers, matrix,
+    submatrix and resultant) are attributes computed on first access and
+    cached, so the degree bound and the matrix size do not build the matrix.
+    `invalidate` drops the cached stages.
     """
+    stages = ("terms", "degrees", "degree_m", "monomials_size", "monomial_exponents",
+              "monomial_index", "divisibility_masks", "monomial_set", "row_exponents",
+              "row_monomials", "reduced_nonreduced", "matrix", "submatrix", "resultant")
+
     def __init__(self, polynomials, variables):
         """
         Parameters
@@ -25,16 +42,92 @@ class MacaulayResultant():
         variables: list
             A list of all n variables
         polynomials : list of sympy polynomials
-            A  list of m n-degree polynomials
+            A  list of m n-degree polynomials, given as sympy Poly objects,
+            expressions or lambdified functions of the variables. They are
+            converted once to dictionaries of exponent tuples, `self.terms`.
         """
         self.polynomials = polynomials
         self.variables = variables
-        self.n = len(variables)
 
-        self.degrees = self.get_max_degrees()
-        self.degree_m = self.get_degree_m()
-        self.monomials_size = self.get_size()
+    @property
+    def n(self):
+        return len(self.variables)
+
+    @functools.cached_property
+    def terms(self):
+        return [get_terms(p, self.variables) for p in self.polynomials]
+
+    @functools.cached_property
+    def degrees(self):
+        return self.get_max_degrees()
+
+    @functools.cached_property
+    def degree_m(self):
+        return self.get_degree_m()
+
+    @functools.cached_property
+    def monomials_size(self):
+        return self.get_size()
+
+    @functools.cached_property
+    def monomial_exponents(self):
+        return self.get_exponents_of_certain_degree(self.degree_m)
+
+    @functools.cached_property
+    def monomial_index(self):
+        return {exponents: j for j, exponents in enumerate(self.monomial_exponents)}
+
+    @functools.cached_property
+    def divisibility_masks(self):
+        return [self.get_divisibility_mask(exponents) for exponents in self.monomial_exponents]
 
+    @functools.cached_property
+    def monomial_set(self):
+        return [self.get_monomial(exponents) for exponents in self.monomial_exponents]
+
+    @functools.cached_property
+    def row_exponents(self):
+        return self.get_row_exponents()
+
+    @functools.cached_property
+    def row_monomials(self):
+        return self.get_row_monomials()
+
+    @functools.cached_property
+    def reduced_nonreduced(self):
+        return self.get_reduced_nonreduced()
+
+    @functools.cached_property
+    def matrix(self):
+        return self.get_matrix()
+
+    @functools.cached_property
+    def submatrix(self):
+        return self.get_submatrix(self.matrix)
+
+    @functools.cached_property
+    def resultant(self):
+        return self.get_resultant()
+
+    def invalidate(self):
+        """
+        Drops the cached stages, for instance after changing the polynomials.
+        """
+        for stage in self.stages:
+            self.__dict__.pop(stage, None)
+
+    def get_parameters(self):
+        """
+        Returns
+        -------
+        parameters: list
+            The symbols and indexed symbols of the polynomials which are not
+            variables, sorted by name.
+        """
+        symbols = set().union(*[get_symbols(c) for terms in self.terms for c in terms.values()])
+        return sorted(symbols - set(self.variables), key=sym.default_sort_key)
+
+    @profiled("macaulay.degrees")
     def get_max_degrees(self):
         """
         Returns
@@ -42,7 +135,7 @@ class MacaulayResultant():
         degrees: list
             A list of the d_max of each polynomial
         """
-        degrees = [self.get_polynomial_degree(poly) for poly in self.polynomials]
+        degrees = [max(sum(powers) for powers in terms) for terms in self.terms]
         return degrees
 
     def get_polynomial_degree(self, poly):
@@ -50,9 +143,9 @@ class MacaulayResultant():
         Returns
         -------
         degree: int
-            The degree of a polynomial
+            The total degree of a polynomial in the variables
         """
-        return sym.Poly(poly(*self.variables)).degree()
+        return max(sum(powers) for powers in get_terms(poly, self.variables))
 
     def get_degree_m(self):
         """
@@ -74,27 +167,68 @@ class MacaulayResultant():
         """
         return binomial(self.degree_m + self.n - 1, self.n - 1)
 
+    @profiled("macaulay.monomials")
+    def get_exponents_of_certain_degree(self, degree):
+        """
+        Returns
+        -------
+        exponents: list
+            A list of the exponent tuples of all monomials of a certain degree
+            in the n variables, in decreasing lexicographic order.
+        """
+        return get_exponents(degree, self.n)
+
+    def get_monomial(self, exponents):
+        """
+        Returns
+        -------
+        monomial: sympy expression
+            The monomial of the variables with the given exponents.
+        """
+        return sym.Mul(*[v ** e for v, e in zip(self.variables, exponents)])
+
+    def get_divisibility_mask(self, exponents):
+        """
+        Returns
+        -------
+        mask: tuple
+            For each variable x_i whether the monomial is divisible by
+            x_i ** d_i, where d_i is the degree of the i polynomial.
+        """
+        return get_divisibility_mask(exponents, self.degrees)
+
     def get_monomials_of_certain_degree(self, degree):
         """
         Returns
         -------
         monomials: list
-            A list of monomials of a certain degree. Sympy returns up to a degree
+            A list of monomials of a certain degree, in decreasing
+            lexicographic order.
         """
-        monomials = list(itermonomials(self.variables, degree) -
-                         itermonomials(self.variables, degree - 1))
-
-        return sorted(monomials, key=monomial_key('lex', self.variables))[::-1]
+        return [self.get_monomial(exponents)
+                for exponents in self.get_exponents_of_certain_degree(degree)]
 
     def get_monomials_set(self):
         """
         Returns
         -------
         self.monomial_set: set
-            The set T. Set of all possible monomials of degree degree_m
+            The set T. Set of all possible monomials of degree degree_m. The
+            stage is computed on first access, so calling this is optional.
+        """
+        return self.monomial_set
+
+    @profiled("macaulay.row_exponents")
+    def get_row_exponents(self):
+        """
+        Returns
+        -------
+        row_exponents: list
+            For each polynomial i the exponent tuples of its row multipliers:
+            the monomials of degree degree_m - d_i which are not divisible by
+            x_j ** d_j for any j < i.
         """
-        monomial_set = self.get_monomials_of_certain_degree(self.degree_m)
-        self.monomial_set = monomial_set
+        return get_row_exponents(self.degrees, self.degree_m)
 
     def get_row_coefficients(self):
         """
@@ -103,82 +237,199 @@ class MacaulayResultant():
         row_coefficients: list
             The row coefficients of Macaulay's matrix
         """
-        row_coefficients = []
-        divisible = []
-        for i in range(self.n):
-            if i == 0:
-                row_coefficients.append(self.get_monomials_of_certain_degree(self.degree_m - self.degrees[i]))
-            else:
-                divisible.append(self.variables[i - 1] ** self.degrees[i - 1])
-                poss_rows = self.get_monomials_of_certain_degree(self.degree_m - self.degrees[i])
-                for div in divisible:
-                    for p in poss_rows:
-                        if sym.fraction((p / div).expand())[1] == 1 :
-                            poss_rows = [item for item in poss_rows if item != p]
-                row_coefficients.append(poss_rows)
-        return row_coefficients
+        return [[self.get_monomial(exponents) for exponents in row]
+                for row in self.row_exponents]
 
-    def get_matrix(self):
+    def iter_rows(self, terms=None):
+        """
+        Returns
+        -------
+        rows: generator
+            The rows of Macaulay's matrix one at a time, each a list of
+            (column, coefficient) pairs sorted by column. A row is a
+            polynomial times its multiplier, so only its terms are walked and
+            placed by the column index of their exponents. `terms` replaces
+            the coefficients of the polynomials, for example by residues.
+        """
+        terms = self.terms if terms is None else terms
+        return iter_macaulay_rows(terms, self.row_exponents, self.monomial_index)
+
+    @profiled("macaulay.matrix")
+    def get_matrix(self, sparse=False):
         """
         Returns
         -------
         macaulay_matrix: sym Matrix
-            The Macaulay's matrix
+            The Macaulay's matrix built from `iter_rows`. If sparse is True a
+            sympy SparseMatrix is returned.
         """
-        rows = []
-        row_coefficients = self.get_row_coefficients()
-        for i in range(self.n):
-            for multiplier in row_coefficients[i]:
-                coefficients = []
-                poly = sym.Poly(self.polynomials[i](*self.variables) * multiplier, *self.variables)
+        entries = {}
+        for row, pairs in enumerate(self.iter_rows()):
+            for column, coefficient in pairs:
+                entries[row, column] = coefficient
 
-                for mono in self.monomial_set:
-                    coefficients.append(poly.coeff_monomial(mono))
-                rows.append(coefficients)
+        shape = (sum(len(row) for row in self.row_exponents), len(self.monomial_exponents))
+        if sparse:
+            return sym.SparseMatrix(*shape, entries)
 
-        macaulay_matrix = sym.Matrix(rows)
+        macaulay_matrix = sym.zeros(*shape)
+        for (i, j), coefficient in entries.items():
+            macaulay_matrix[i, j] = coefficient
         return macaulay_matrix
 
+    def get_modular_terms(self, prime=LARGEST_PRIME, point=None):
+        """
+        Returns
+        -------
+        terms: list
+            For each polynomial its terms with the coefficients evaluated at
+            an integer point of the parameters and reduced modulo a prime.
+            Terms with a zero residue are dropped.
+        """
+        parameters = self.get_parameters()
+        if parameters and point is None:
+            raise ValueError('A point is required for the parameters {}.'.format(parameters))
+        substitution = dict(zip(parameters, [] if point is None else list(point)))
+
+        modular_terms = []
+        for terms in self.terms:
+            residues = {}
+            for powers, coefficient in terms.items():
+                residue = get_residue(sym.sympify(coefficient).xreplace(substitution), prime)
+                if residue:
+                    residues[powers] = residue
+            modular_terms.append(residues)
+
+        return modular_terms
+
+    @profiled("macaulay.write_modular_rows")
+    def write_modular_rows(self, directory, prime=LARGEST_PRIME, point=None):
+        """
+        A function that streams the rows of Macaulay's matrix modulo a prime
+        to memory-mapped files in a directory, see `storage`, and returns the
+        header. The matrix is never held in memory, so the stored rows can be
+        eliminated out of core, for instance by `sparse_rank_mod_prime`.
+
+        Parameters
+        ----------
+        directory: str
+            The directory of the files.
+        prime: int
+            A prime smaller than 2 ** 31.
+        point: list
+            Integer values of the parameters, sorted by name, if there are
+            any.
+        """
+        terms = self.get_modular_terms(prime, point)
+        shape = (sum(len(row) for row in self.row_exponents), len(self.monomial_exponents))
+        capacity = sum(len(t) * len(row) for t, row in zip(terms, self.row_exponents))
+        metadata = {"prime": prime, "point": [] if point is None else [int(v) for v in point],
+                    "parameters": [str(p) for p in self.get_parameters()]}
+
+        return write_sparse_rows(directory, self.iter_rows(terms), shape, capacity, metadata)
+
+    @profiled("macaulay.reduced_nonreduced")
     def get_reduced_nonreduced(self):
         """
         Returns
         -------
         reduced: list
-            A list of the reduced monomials
+            A list of the reduced monomials, the monomials of T divisible by
+            exactly one x_i ** d_i
         non_reduced: list
             A list of the monomials that are not reduced
         """
-        divisible = []
-        for m in self.monomial_set:
-            temp = []
-            for i, v in enumerate(self.variables):
-                temp.append(sym.Poly(m, v).degree() >= self.degrees[i])
-            divisible.append(temp)
+        counts = [sum(mask) for mask in self.divisibility_masks]
+
+        reduced = [i for i, count in enumerate(counts) if count < 2]
+        non_reduced = [i for i, count in enumerate(counts) if count >= 2]
 
-        reduced = [i for i, r in enumerate(divisible) if sum(r) < self.n - 1]
-        non_reduced = [i for i, r in enumerate(divisible) if sum(r) >= self.n -1]
+        return reduced, non_reduced
 
-        return reduced, non_reduced 
+    def get_row_monomials(self):
+        """
+        Returns
+        -------
+        row_monomials: list
+            For each row of Macaulay's matrix the column of its monomial
+            x_i ** d_i times the row multiplier. Every monomial of T is the
+            monomial of exactly one row.
+        """
+        row_monomials = []
+        for i, row in enumerate(self.row_exponents):
+            for exponents in row:
+                product = list(exponents)
+                product[i] += self.degrees[i]
+                row_monomials.append(self.monomial_index[tuple(product)])
 
+        return row_monomials
+
+    def get_extraneous_indices(self):
+        """
+        Returns
+        -------
+        rows: list
+            The rows of Macaulay's matrix whose monomial is not reduced.
+        columns: list
+            The columns of the monomials which are not reduced. The minor on
+            these rows and columns is the extraneous factor.
+        """
+        non_reduced = self.reduced_nonreduced[1]
+        columns = set(non_reduced)
+        rows = [row for row, column in enumerate(self.row_monomials) if column in columns]
+
+        return rows, non_reduced
+
+    @profiled("macaulay.submatrix")
     def get_submatrix(self, matrix):
         """
         Returns
         -------
         macaulay_submatrix: sym Matrix
-            The Macaulay's matrix
+            The submatrix of the rows and columns of the monomials which are
+            not reduced, selected by index.
         """
-        reduced, non_reduced = self.get_reduced_nonreduced()
+        rows, columns = self.get_extraneous_indices()
+        return matrix.extract(rows, columns)
 
-        reduction_set = [v ** self.degrees[i] for i, v in enumerate(self.variables)]
+    @profiled("macaulay.resultant")
+    def get_resultant(self):
+        """
+        Returns
+        -------
+        resultant: sympy polynomial
+            The resultant det(M) / det(A), where A is the extraneous factor
+            minor, as a polynomial in the parameters (or a number if there are
+            none). The rows and columns of A are moved first, so that a single
+            sparse fraction-free elimination gives det(A) as a leading minor
+            on the way to det(M), and the quotient is exact. The rows are
+            streamed from `iter_rows`, so the sympy matrix is never built.
+            The sign is normalised so that the resultant of x_1 ** d_1, ...,
+            x_n ** d_n is 1.
+        """
+        rows, columns = self.get_extraneous_indices()
 
-        ais = list([self.polynomials[i](*self.variables).coeff(reduction_set[i])
-                    for i in range(self.n)])
+        gens = tuple(self.get_parameters())
+        terms = [{powers: sym.Poly(coefficient, *gens) if gens else sym.sympify(coefficient)
+                  for powers, coefficient in polynomial.items() if coefficient != 0}
+                 for polynomial in self.terms]
+        entries = [dict(pairs) for pairs in self.iter_rows(terms)]
 
-        reduced_matrix = matrix[:, reduced]
-        keep = []
-        for row in range(reduced_matrix.rows):
-            check = [ai in reduced_matrix[row, :] for ai in ais]
-            if True not in check:
-                keep.append(row)
+        with stage("macaulay.elimination", size=len(entries), extraneous=len(rows)):
+            return get_macaulay_quotient(entries, self.row_monomials, (rows, columns))
 
-        return matrix[keep, non_reduced]
+    @profiled("macaulay.interpolated_determinant")
+    def get_interpolated_determinant(self, matrix):
+        """
+        Returns
+        -------
+        determinant: sympy polynomial
+            The determinant of Macaulay's matrix (or of a submatrix) as a
+            polynomial in the parameters. The degree of the determinant in
+            each parameter is bounded by the sums of the largest entry degrees
+            over the rows and over the columns of the matrix, see
+            `interpolation.get_degree_bounds`; the parameters are substituted
+            by integer points within that bound and the result is
+            interpolated.
+        """
+        return interpolate_determinant(matrix, self.get_parameters())
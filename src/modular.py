@@ -0,0 +1,318 @@
+"""
+A modular backend for the determinants of integer resultant matrices.
+
+The matrix is reduced modulo several word-size primes, each determinant is
+computed with NumPy int64 arithmetic and the exact integer is rebuilt with the
+Chinese Remainder Theorem. Enough primes are used for their product to exceed
+twice the Hadamard bound of the matrix.
+
+Literature: https://doi.org/10.1145/321662.321664.
+"""
+import math
+
+import numpy as np
+import sympy as sym
+
+LARGEST_PRIME = 2 ** 31 - 1
+
+
+def get_primes(start=LARGEST_PRIME):
+    """
+    Returns
+    -------
+    primes: generator
+        The primes smaller than or equal to start, in decreasing order. Every
+        product of two residues fits in an int64 as long as start < 2 ** 31.
+    """
+    prime = start if sym.isprime(start) else sym.prevprime(start)
+    while prime > 2:
+        yield prime
+        prime = sym.prevprime(prime)
+
+
+def get_crt_primes(bound):
+    """
+    Returns
+    -------
+    primes: list
+        The largest primes of `get_primes` whose product exceeds the bound.
+    """
+    primes, modulus = [], 1
+    for prime in get_primes():
+        if modulus > bound:
+            break
+        primes.append(prime)
+        modulus *= prime
+
+    return primes
+
+
+def combine_residues(residues):
+    """
+    Returns
+    -------
+    value: int
+        The integer of least absolute value with the given residues, a
+        dictionary mapping distinct primes to residues, by the Chinese
+        Remainder Theorem.
+    """
+    residue, modulus = 0, 1
+    for prime, value in residues.items():
+        correction = (value - residue) * pow(modulus % prime, -1, prime) % prime
+        residue += modulus * correction
+        modulus *= prime
+
+    return residue - modulus if residue > modulus // 2 else residue
+
+
+def get_integer_rows(matrix):
+    """
+    Returns
+    -------
+    rows: list
+        The rows of a rational matrix, each scaled by the lcm of its
+        denominators so that all entries are Python integers.
+    denominator: int
+        The product of the row scalings. The determinant of the original
+        matrix is det(rows) / denominator.
+    """
+    rows = []
+    denominator = 1
+    for i in range(matrix.rows):
+        entries = [sym.Rational(entry) for entry in matrix.row(i)]
+        scale = math.lcm(*[int(entry.q) for entry in entries]) if entries else 1
+        rows.append([int(entry.p) * (scale // int(entry.q)) for entry in entries])
+        denominator *= scale
+
+    return rows, denominator
+
+
+def hadamard_bound(rows):
+    """
+    Returns
+    -------
+    bound: int
+        An upper bound of the absolute value of the determinant of an integer
+        matrix, the product of the Euclidean norms of its rows.
+    """
+    bound = 1
+    for row in rows:
+        bound *= math.isqrt(sum(entry * entry for entry in row)) + 1
+
+    return bound
+
+
+def determinant_mod_prime(rows, prime):
+    """
+    Returns
+    -------
+    determinant: int
+        The determinant of an integer matrix modulo a prime, computed with a
+        Gaussian elimination over int64 arrays.
+    """
+    array = np.array([[entry % prime for entry in row] for row in rows], dtype=np.int64)
+    size = array.shape[0]
+
+    determinant = 1
+    for k in range(size):
+        nonzero = np.flatnonzero(array[k:, k])
+        if nonzero.size == 0:
+            return 0
+        pivot_row = k + nonzero[0]
+        if pivot_row != k:
+            array[[k, pivot_row]] = array[[pivot_row, k]]
+            determinant = -determinant
+
+        pivot = int(array[k, k])
+        determinant = determinant * pivot % prime
+
+        factors = array[k + 1:, k] * pow(pivot, -1, prime) % prime
+        update = np.outer(factors, array[k, k:]) % prime
+        array[k + 1:, k:] = (array[k + 1:, k:] - update) % prime
+
+    return determinant % prime
+
+
+def get_residue(value, prime):
+    """
+    Returns
+    -------
+    residue: int
+        A rational number modulo a prime. Raises ZeroDivisionError if the
+        prime divides the denominator.
+    """
+    if not isinstance(value, sym.Rational):
+        value = sym.Rational(value)
+    if int(value.q) % prime == 0:
+        raise ZeroDivisionError('The prime divides the denominator.')
+
+    return int(value.p) * pow(int(value.q), -1, prime) % prime
+
+
+def get_modular_terms(matrix, parameters, prime):
+    """
+    Returns
+    -------
+    terms: list
+        For each non zero entry of a matrix whose entries are polynomials in
+        the parameters, a tuple (i, j, [(coefficient, exponents), ...]) with
+        the coefficients reduced modulo a prime. Expanded entries are read
+        term by term; other entries are expanded with sympy.
+    """
+    index = {parameter: k for k, parameter in enumerate(parameters)}
+
+    def get_terms(entry):
+        terms = []
+        for monomial, coefficient in entry.as_coefficients_dict().items():
+            exponents = [0] * len(parameters)
+            for base, exponent in monomial.as_powers_dict().items():
+                if base == 1:
+                    continue
+                if base not in index or not exponent.is_Integer or exponent < 0:
+                    return None
+                exponents[index[base]] += int(exponent)
+            terms.append((get_residue(coefficient, prime), tuple(exponents)))
+        return terms
+
+    modular_terms = []
+    for (i, j), entry in matrix.todok().items():
+        entry = sym.sympify(entry)
+        if entry == 0:
+            continue
+        terms = get_terms(entry)
+        if terms is None:
+            terms = [(get_residue(coefficient, prime), exponents)
+                     for exponents, coefficient in sym.Poly(entry, *parameters).terms()]
+        modular_terms.append((i, j, terms))
+
+    return modular_terms
+
+
+def evaluate_modular_terms(terms, shape, point, prime):
+    """
+    Returns
+    -------
+    rows: list
+        The rows of the matrix given by `get_modular_terms`, evaluated at an
+        integer point modulo the prime.
+    """
+    powers = {}
+
+    def get_power(exponents):
+        if exponents not in powers:
+            value = 1
+            for coordinate, exponent in zip(point, exponents):
+                value = value * pow(coordinate, exponent, prime) % prime
+            powers[exponents] = value
+        return powers[exponents]
+
+    rows = [[0] * shape[1] for _ in range(shape[0])]
+    for i, j, entry_terms in terms:
+        rows[i][j] = sum(coefficient * get_power(exponents)
+                         for coefficient, exponents in entry_terms) % prime
+
+    return rows
+
+
+def evaluate_mod_prime(matrix, parameters, point, prime):
+    """
+    Returns
+    -------
+    rows: list
+        The rows of a matrix whose entries are polynomials in the parameters,
+        evaluated at an integer point and reduced modulo a prime.
+    """
+    terms = get_modular_terms(matrix, parameters, prime)
+    return evaluate_modular_terms(terms, matrix.shape, point, prime)
+
+
+def rank_profile_mod_prime(rows, prime):
+    """
+    Returns
+    -------
+    pivot_rows: list
+        The increasing rows of a maximal non singular submatrix of an integer
+        matrix modulo a prime.
+    pivot_columns: list
+        Its increasing columns. The columns are scanned from left to right and
+        each one with a non zero entry in an unused row becomes a pivot.
+    """
+    array = np.array([[entry % prime for entry in row] for row in rows], dtype=np.int64)
+    if array.size == 0:
+        return [], []
+
+    used = np.zeros(array.shape[0], dtype=bool)
+    pivot_rows, pivot_columns = [], []
+    for column in range(array.shape[1]):
+        candidates = np.flatnonzero((array[:, column] != 0) & ~used)
+        if candidates.size == 0:
+            continue
+
+        row = candidates[0]
+        used[row] = True
+        pivot_rows.append(int(row))
+        pivot_columns.append(column)
+        if used.all():
+            break
+
+        others = np.flatnonzero(~used)
+        factors = array[others, column] * pow(int(array[row, column]), -1, prime) % prime
+        update = np.outer(factors, array[row, column:]) % prime
+        array[others, column:] = (array[others, column:] - update) % prime
+
+    return sorted(pivot_rows), pivot_columns
+
+
+def sparse_rank_mod_prime(rows, prime):
+    """
+    Returns
+    -------
+    rank: int
+        The rank modulo a prime of a matrix given as an iterable of sparse
+        rows, each a pair of sequences (columns, values), for example
+        `storage.iter_sparse_rows`. The rows are consumed one at a time and
+        reduced against the echelon rows kept so far, so only the echelon
+        form is held in memory.
+    """
+    echelon = {}
+    for columns, values in rows:
+        row = {int(c): int(v) % prime for c, v in zip(columns, values) if int(v) % prime}
+        while row:
+            pivot = min(row)
+            if pivot not in echelon:
+                inverse = pow(row[pivot], -1, prime)
+                echelon[pivot] = {c: v * inverse % prime for c, v in row.items()}
+                break
+
+            factor = row[pivot]
+            for c, v in echelon[pivot].items():
+                value = (row.get(c, 0) - factor * v) % prime
+                if value:
+                    row[c] = value
+                else:
+                    row.pop(c, None)
+
+    return len(echelon)
+
+
+def modular_determinant(matrix):
+    """
+    A function that takes a square matrix with rational entries, for example a
+    numerical `sylvester_matrix`, `cayley_bezout_matrix`, Dixon's or Macaulay's
+    matrix, and returns its exact determinant.
+
+    Parameters
+    ----------
+    matrix: sympy Matrix
+        A square matrix with integer or rational entries.
+    """
+    if matrix.rows != matrix.cols:
+        raise ValueError('Determinant of a non square matrix.')
+    if matrix.free_symbols:
+        raise ValueError('The modular determinant requires numerical entries.')
+
+    rows, denominator = get_integer_rows(matrix)
+    residues = {prime: determinant_mod_prime(rows, prime)
+                for prime in get_crt_primes(2 * hadamard_bound(rows))}
+
+    return sym.Rational(combine_residues(residues), denominator)
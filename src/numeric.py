@@ -0,0 +1,508 @@
+"""
+A floating point mode of the resultant formulations, built on NumPy only.
+
+Polynomials are given by dense coefficient arrays with the lowest power
+first, the convention of `numpy.polynomial`: c[i] is the coefficient of x ** i
+of a univariate polynomial, c[i, j] that of x ** i * y ** j of a bivariate
+one, and so on. The float64 or complex128 matrices of Sylvester, Bezout, Dixon
+and Macaulay are built directly from these arrays, without sympy expressions.
+
+The common roots of two bivariate polynomials are found by hiding y: the
+Sylvester or Bezout matrix in x is a matrix polynomial M(y), and the values
+of y where it is singular are the eigenvalues of a companion linearization.
+The singular values of the matrices report their rank and conditioning.
+
+Literature: https://doi.org/10.1137/S0895479896310220 (linearizations) and
+https://doi.org/10.1090/conm/286/04749 (hidden variable resultants).
+"""
+import itertools
+import math
+
+import numpy as np
+
+
+def trim(coefficients):
+    """
+    Returns
+    -------
+    coefficients: numpy array
+        The coefficient array without the trailing zero slices along the
+        first axis, so that its length is the degree in x plus one.
+    """
+    coefficients = np.asarray(coefficients)
+    nonzero = np.flatnonzero(np.any(coefficients.reshape(len(coefficients), -1) != 0, axis=1))
+    if nonzero.size == 0:
+        raise ValueError('The polynomial is zero.')
+
+    return coefficients[:nonzero[-1] + 1]
+
+
+def get_dtype(*arrays):
+    """
+    Returns
+    -------
+    dtype: numpy dtype
+        float64, or complex128 if any of the arrays is complex.
+    """
+    return np.result_type(np.float64, *arrays)
+
+
+def pad_trailing(arrays):
+    """
+    Returns
+    -------
+    arrays: list
+        The arrays padded with zeros to a common shape of their trailing
+        axes, the axes after the first.
+    """
+    shape = np.max([array.shape[1:] for array in arrays], axis=0).astype(int)
+    return [np.pad(array, [(0, 0)] + [(0, s - t) for s, t in zip(shape, array.shape[1:])])
+            for array in arrays]
+
+
+def multiply_trailing(p, q):
+    """
+    Returns
+    -------
+    product: numpy array
+        The product of two polynomials in y given by the coefficients along
+        the last axis, broadcast over the other axes.
+    """
+    shape = np.broadcast_shapes(p.shape[:-1], q.shape[:-1]) + (p.shape[-1] + q.shape[-1] - 1,)
+    product = np.zeros(shape, dtype=np.result_type(p, q))
+    for k in range(p.shape[-1]):
+        product[..., k:k + q.shape[-1]] += p[..., k, None] * q
+
+    return product
+
+
+def sylvester_matrix(p, q):
+    """
+    A function that takes the coefficients of two polynomials of degree m and
+    n in x and returns their (m + n) x (m + n) Sylvester's matrix, with the
+    rows of `sylvesters.sylvester_matrix`.
+
+    Parameters
+    ----------
+    p: array_like
+        The coefficients of p, lowest power of x first. A second axis holds
+        the coefficients in a hidden variable y; the result then has shape
+        (k, m + n, m + n) and its k-th slice is the coefficient of y ** k.
+    q: array_like
+        The coefficients of q, in the form of p.
+    """
+    p, q = pad_trailing([trim(p), trim(q)])
+    m, n = len(p) - 1, len(q) - 1
+    size = m + n
+
+    matrix = np.zeros(p.shape[1:] + (size, size), dtype=get_dtype(p, q))
+    for coefficients, shifts, offset in [(p, n, 0), (q, m, n)]:
+        rows = offset + np.arange(shifts)[:, None]
+        columns = np.arange(shifts)[:, None] + np.arange(len(coefficients))[None, :]
+        matrix[..., rows, columns] = np.moveaxis(coefficients[::-1], 0, -1)[..., None, :]
+
+    return matrix
+
+
+def bezout_matrix(p, q):
+    """
+    A function that takes the coefficients of two polynomials in x and
+    returns their Cayley-Bezout matrix, with the entries of
+    `cayley_bezout.cayley_bezout_matrix`: the entry (i, j) is the
+    coefficient of x ** j * a ** (n - 1 - i) in (p(x)q(a) - p(a)q(x)) / (x - a).
+
+    Parameters
+    ----------
+    p: array_like
+        The coefficients of p, lowest power of x first. A second axis holds
+        the coefficients in a hidden variable y; the result then has shape
+        (k, n, n) and its k-th slice is the coefficient of y ** k.
+    q: array_like
+        The coefficients of q, in the form of p.
+    """
+    p, q = pad_trailing([trim(p), trim(q)])
+    degree = max(len(p), len(q)) - 1
+    p = np.pad(p, [(0, degree + 1 - len(p))] + [(0, 0)] * (p.ndim - 1))
+    q = np.pad(q, [(0, degree + 1 - len(q))] + [(0, 0)] * (q.ndim - 1))
+
+    hidden = p.ndim > 1
+    if not hidden:
+        p, q = p[:, None], q[:, None]
+
+    upper, lower = slice(1, degree + 1), slice(0, degree)
+    differences = (multiply_trailing(p[upper, None], q[None, lower])
+                   - multiply_trailing(q[upper, None], p[None, lower]))
+
+    entries = differences.copy()
+    for i in range(degree - 2, -1, -1):
+        entries[i, 1:] += entries[i + 1, :-1]
+
+    matrix = np.moveaxis(entries[:, ::-1], -1, 0).swapaxes(1, 2).astype(get_dtype(p, q))
+    return matrix if hidden else matrix[0]
+
+
+def get_kernel(size, mode):
+    """
+    Returns
+    -------
+    kernel: numpy array
+        The size x size x size array which maps the coefficient of x ** k to
+        the coefficients of x ** s * a ** t: kept in x ("x"), moved to the
+        dummy variable a ("a"), or replaced by the divided difference
+        (a ** k - x ** k) / (x - a) ("difference").
+    """
+    k, s, t = np.indices((size, size, size))
+    if mode == "x":
+        return ((s == k) & (t == 0)).astype(float)
+    if mode == "a":
+        return ((s == 0) & (t == k)).astype(float)
+
+    return -(s + t + 1 == k).astype(float)
+
+
+def fold(array, lengths):
+    """
+    Returns
+    -------
+    array: numpy array
+        The coefficient array with every exponent reduced modulo the length
+        of its axis, so that its discrete Fourier transform of these lengths
+        evaluates the polynomial at the roots of unity.
+    """
+    for axis, length in enumerate(lengths):
+        axis += array.ndim - len(lengths)
+        size = array.shape[axis]
+        padded = np.pad(array, [(0, 0)] * axis + [(0, -size % length)] + [(0, 0)] * (array.ndim - axis - 1))
+        shape = padded.shape[:axis] + (-(-size // length), length) + padded.shape[axis + 1:]
+        array = padded.reshape(shape).sum(axis=axis)
+
+    return array
+
+
+def dixon_polynomial(polynomials):
+    """
+    A function that takes the coefficients of n + 1 polynomials in n
+    variables and returns the coefficients of their Dixon's polynomial.
+
+    The rows of Dixon's determinant are the polynomials and their divided
+    differences, as in `DixonResultant.get_dixon_polynomial`; every entry is
+    built from the coefficients with one `numpy.einsum`. The determinant is
+    evaluated at roots of unity with a batched `numpy.linalg.det` and
+    interpolated with an inverse FFT, within the degree bounds of
+    `DixonResultant.get_size_bounds`.
+
+    Parameters
+    ----------
+    polynomials: list
+        n + 1 arrays with n axes, c[e_1, ..., e_n] the coefficient of
+        x_1 ** e_1 ... x_n ** e_n.
+
+    Returns
+    -------
+    dixon_polynomial: numpy array
+        An array with 2n axes, the coefficients of the monomials
+        x_1 ** e_1 ... x_n ** e_n * a_1 ** f_1 ... a_n ** f_n.
+    """
+    arrays = [np.asarray(p) for p in polynomials]
+    n = len(arrays) - 1
+    if any(array.ndim != n for array in arrays):
+        raise ValueError('Dixon requires n + 1 polynomials in n variables.')
+
+    shape = np.max([array.shape for array in arrays], axis=0).astype(int)
+    stacked = np.stack([np.pad(array, [(0, s - t) for s, t in zip(shape, array.shape)])
+                        for array in arrays])
+    degrees = [s - 1 for s in shape]
+    dtype = get_dtype(stacked)
+
+    rows = []
+    for row in range(n + 1):
+        modes = ["a"] * (row - 1) + ["difference"] + ["x"] * (n - row) if row else ["x"] * n
+        operands = [stacked, [3 * n] + list(range(n))]
+        for i, mode in enumerate(modes):
+            operands += [get_kernel(shape[i], mode), [i, n + i, 2 * n + i]]
+        rows.append(np.einsum(*operands, [3 * n] + list(range(n, 3 * n))))
+
+    lengths = [max((i + 1) * d, 1) for i, d in enumerate(degrees)] + \
+              [max((n - i) * d, 1) for i, d in enumerate(degrees)]
+    axes = tuple(range(2, 2 + 2 * n))
+    values = np.fft.fftn(fold(np.stack(rows), lengths), axes=axes)
+    determinants = np.linalg.det(np.moveaxis(values, (0, 1), (-2, -1)))
+
+    polynomial = np.fft.ifftn(determinants)
+    return polynomial if np.issubdtype(dtype, np.complexfloating) else polynomial.real
+
+
+def dixon_matrix(polynomials, tol=1e-10):
+    """
+    A function that takes the coefficients of n + 1 polynomials in n
+    variables and returns their Dixon's matrix, with the rows and columns of
+    `DixonResultant.get_dixon_matrix`: a row for each monomial in a_1, ...,
+    a_n of Dixon's polynomial in decreasing lexicographic order and a column
+    for each monomial in the variables in graded lexicographic order.
+
+    Parameters
+    ----------
+    polynomials: list
+        n + 1 arrays with n axes, as in `dixon_polynomial`.
+    tol: float
+        Coefficients below tol times the largest one are taken as zero.
+
+    Returns
+    -------
+    dixon_matrix: numpy array
+        The Dixon's matrix.
+    rows: numpy array
+        The exponents of the monomial in a_1, ..., a_n of each row.
+    columns: numpy array
+        The exponents of the monomial in the variables of each column.
+    """
+    polynomial = dixon_polynomial(polynomials)
+    n = polynomial.ndim // 2
+    x_shape, a_shape = polynomial.shape[:n], polynomial.shape[n:]
+
+    coefficients = polynomial.reshape(math.prod(x_shape), math.prod(a_shape)).T
+    nonzero = np.abs(coefficients) > tol * max(np.abs(coefficients).max(), np.finfo(float).tiny)
+
+    a_exponents = np.array(list(np.ndindex(*a_shape)))
+    x_exponents = np.array(list(np.ndindex(*x_shape)))
+    rows = np.flatnonzero(nonzero.any(axis=1))[::-1]
+    columns = np.flatnonzero(nonzero.any(axis=0))
+    columns = columns[np.lexsort(x_exponents[columns].T[::-1].tolist()
+                                 + [x_exponents[columns].sum(axis=1)])]
+
+    matrix = np.where(nonzero, coefficients, 0)[np.ix_(rows, columns)]
+    return matrix, a_exponents[rows], x_exponents[columns]
+
+
+def get_exponents(degree, n):
+    """
+    Returns
+    -------
+    exponents: numpy array
+        The exponents of all monomials of a certain degree in n variables, one
+        per row, in decreasing lexicographic order.
+    """
+    if degree < 0:
+        return np.zeros((0, n), dtype=np.int64)
+
+    bars = np.array(list(itertools.combinations(range(degree + n - 1), n - 1)), dtype=np.int64)
+    bars = bars.reshape(len(bars), n - 1)
+    bounds = np.hstack([np.full((len(bars), 1), -1), bars, np.full((len(bars), 1), degree + n - 1)])
+    exponents = np.diff(bounds, axis=1) - 1
+
+    return exponents[np.lexsort(-exponents.T[::-1])]
+
+
+def macaulay_matrix(polynomials):
+    """
+    A function that takes the coefficients of n homogeneous polynomials in n
+    variables and returns their Macaulay's matrix, with the rows and columns
+    of `MacaulayResultant.get_matrix`.
+
+    The columns are the monomials of degree 1 + sum(d_i - 1), found for every
+    row and term at once by a binary search of their mixed radix codes.
+
+    Parameters
+    ----------
+    polynomials: list
+        n arrays with n axes, c[e_1, ..., e_n] the coefficient of
+        x_1 ** e_1 ... x_n ** e_n.
+    """
+    arrays = [np.asarray(p) for p in polynomials]
+    n = len(arrays)
+    terms = [np.argwhere(array != 0) for array in arrays]
+    degrees = [int(t.sum(axis=1).max()) for t in terms]
+    degree = 1 + sum(d - 1 for d in degrees)
+
+    monomials = get_exponents(degree, n)
+    radix = (degree + 1) ** np.arange(n - 1, -1, -1)
+    codes = -(monomials @ radix)
+
+    blocks = []
+    for i, (array, exponents) in enumerate(zip(arrays, terms)):
+        multipliers = get_exponents(degree - degrees[i], n)
+        multipliers = multipliers[~np.any(multipliers[:, :i] >= np.array(degrees[:i]), axis=1)]
+
+        columns = np.searchsorted(codes, -((multipliers[:, None, :] + exponents[None, :, :]) @ radix))
+        block = np.zeros((len(multipliers), len(monomials)), dtype=get_dtype(array))
+        block[np.arange(len(multipliers))[:, None], columns] = array[tuple(exponents.T)]
+        blocks.append(block)
+
+    return np.vstack(blocks).astype(get_dtype(*arrays))
+
+
+def get_svd_diagnostics(matrix, tol=None):
+    """
+    Returns
+    -------
+    diagnostics: dict
+        The singular values of a matrix, or of a stack of matrices along the
+        last two axes, its numerical rank, the number of singular values
+        above tol times the largest (by default the machine precision times
+        the largest dimension), and its 2-norm condition number.
+    """
+    matrix = np.asarray(matrix)
+    singular_values = np.linalg.svd(matrix, compute_uv=False)
+    if tol is None:
+        tol = max(matrix.shape[-2:]) * np.finfo(float).eps
+
+    largest = singular_values[..., :1]
+    rank = np.sum(singular_values > tol * largest, axis=-1)
+    with np.errstate(divide="ignore"):
+        condition = largest[..., 0] / singular_values[..., -1]
+
+    return {"singular_values": singular_values, "rank": rank, "condition": condition}
+
+
+def hidden_variable_eigenvalues(coefficients, seed=None):
+    """
+    A function that takes a matrix polynomial M(y) = sum M_k y ** k and
+    returns the finite values of y where M(y) is singular, with a null
+    vector of each.
+
+    The variable is shifted and inverted, y = s + 1 / z for a random s, so
+    that the leading coefficient of z ** d M(s + 1 / z) is M(s), which is non
+    singular unless det M(y) vanishes identically. The eigenvalues z of its
+    block companion matrix are mapped back to y; z = 0 is a root at infinity.
+
+    Parameters
+    ----------
+    coefficients: array_like
+        The coefficients M_0, ..., M_d, an array of shape (d + 1, N, N).
+    seed: int
+        The seed of the random shift.
+
+    Returns
+    -------
+    values: numpy array
+        The eigenvalues y.
+    vectors: numpy array
+        A null vector of M(y) for each, one per row.
+    diagnostics: dict
+        `get_svd_diagnostics` of M(s).
+    """
+    coefficients = np.asarray(coefficients)
+    nonzero = np.flatnonzero(np.any(coefficients != 0, axis=(1, 2)))
+    if nonzero.size == 0:
+        raise ValueError('The matrix polynomial is singular for every value of the hidden variable.')
+    coefficients = coefficients[:nonzero[-1] + 1]
+    degree, size = len(coefficients) - 1, coefficients.shape[1]
+
+    shift = np.random.default_rng(seed).uniform(-1, 1)
+    weights = np.array([[math.comb(i, k) * shift ** (i - k) if i >= k else 0.0
+                         for i in range(degree + 1)] for k in range(degree + 1)])
+    taylor = np.einsum("ki,imn->kmn", weights, coefficients)
+
+    diagnostics = get_svd_diagnostics(taylor[0])
+    if diagnostics["rank"] < size:
+        raise ValueError('The matrix polynomial is singular for every value of the hidden variable.')
+    if degree == 0:
+        return np.zeros(0), np.zeros((0, size)), diagnostics
+
+    companion = np.zeros((degree * size, degree * size), dtype=np.result_type(taylor, complex))
+    companion[:-size, size:] = np.eye((degree - 1) * size)
+    companion[-size:] = -np.linalg.solve(taylor[0], np.hstack(list(taylor[:0:-1])))
+
+    eigenvalues, eigenvectors = np.linalg.eig(companion)
+    finite = np.abs(eigenvalues) > np.finfo(float).eps * np.abs(eigenvalues).max() * degree * size
+    vectors = eigenvectors[:size, finite].T
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    return shift + 1 / eigenvalues[finite], vectors, diagnostics
+
+
+def refine(p, q, x, y, steps):
+    """
+    Returns
+    -------
+    x: numpy array
+        The x coordinates after steps of Newton's method on p = q = 0, all
+        points at once.
+    y: numpy array
+        The y coordinates.
+    """
+    polyval2d, polyder = np.polynomial.polynomial.polyval2d, np.polynomial.polynomial.polyder
+    derivatives = [polyder(p, axis=0), polyder(p, axis=1), polyder(q, axis=0), polyder(q, axis=1)]
+
+    for _ in range(steps):
+        p_value, q_value = polyval2d(x, y, p), polyval2d(x, y, q)
+        px, py, qx, qy = [polyval2d(x, y, derivative) for derivative in derivatives]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            determinant = px * qy - py * qx
+            dx = (p_value * qy - q_value * py) / determinant
+            dy = (px * q_value - qx * p_value) / determinant
+        step = np.isfinite(dx) & np.isfinite(dy)
+        x, y = np.where(step, x - dx, x), np.where(step, y - dy, y)
+
+    return x, y
+
+
+def solve_bivariate(p, q, method="bezout", tol=1e-8, steps=2, seed=None):
+    """
+    A function that takes the coefficients of two polynomials in x and y and
+    returns their common roots, by hiding y in the Sylvester or Bezout matrix
+    in x. For each eigenvalue y, x is the ratio of consecutive entries of the
+    null vector, which is a vector of powers of x. The roots are refined with
+    Newton's method.
+
+    Parameters
+    ----------
+    p: array_like
+        c[i, j] is the coefficient of x ** i * y ** j.
+    q: array_like
+        The coefficients of q.
+    method: str
+        "bezout" (a matrix of size max(m, n)) or "sylvester" (of size m + n).
+    tol: float
+        Candidates with a residual above tol are dropped; None keeps all.
+    steps: int
+        The number of Newton steps.
+    seed: int
+        The seed of the random shift of `hidden_variable_eigenvalues`.
+
+    Returns
+    -------
+    roots: numpy array
+        The (x, y) roots, one per row, as complex numbers.
+    residuals: numpy array
+        max(|p(x, y)|, |q(x, y)|) at each root, relative to the largest
+        coefficient. Spurious candidates have a large residual: eigenvalues
+        which are perturbed roots at infinity, values of y shared by several
+        roots, whose null space has a dimension above one, and the zeros of
+        the leading coefficient of the Bezout matrix when the degrees of p
+        and q in x differ.
+    diagnostics: dict
+        The rank and condition number of M(s) at the random shift, and the
+        number of candidates before filtering.
+    """
+    p, q = np.atleast_2d(p), np.atleast_2d(q)
+    if method == "bezout":
+        coefficients = bezout_matrix(p, q)
+    elif method == "sylvester":
+        coefficients = sylvester_matrix(p, q)
+    else:
+        raise ValueError("Unknown method: {}".format(method))
+
+    values, vectors, diagnostics = hidden_variable_eigenvalues(coefficients, seed)
+
+    if vectors.shape[1] > 1:
+        if method == "sylvester":
+            vectors = vectors[:, ::-1]
+        lower, upper = vectors[:, :-1], vectors[:, 1:]
+        x = np.sum(lower.conj() * upper, axis=1) / np.sum(lower.conj() * lower, axis=1)
+    else:
+        polyval, polyval2d = np.polynomial.polynomial.polyval, np.polynomial.polynomial.polyval2d
+        x = np.array([min(np.roots(trim(polyval(y, p.T))[::-1]),
+                          key=lambda root: abs(polyval2d(root, y, q)), default=np.nan)
+                      for y in values], dtype=complex)
+
+    x, y = refine(p, q, x, values, steps)
+    scale = max(np.abs(p).max(), np.abs(q).max())
+    with np.errstate(invalid="ignore", over="ignore"):
+        residuals = np.maximum(np.abs(np.polynomial.polynomial.polyval2d(x, y, p)),
+                               np.abs(np.polynomial.polynomial.polyval2d(x, y, q))) / scale
+    keep = np.ones(len(x), dtype=bool) if tol is None else residuals <= tol
+
+    return np.column_stack([x, y])[keep], residuals[keep], {
+        "rank": int(diagnostics["rank"]), "condition": float(diagnostics["condition"]),
+        "candidates": len(x)}
@@ -0,0 +1,205 @@
+"""
+A process pool layer for independent resultant computations.
+
+Whole systems, determinants or the evaluation points of an interpolation are
+farmed out to a `concurrent.futures` process pool. Systems are sent in the
+canonical form of `canonical.py`, because lambdified callables cannot be
+pickled. Results are delivered in order or as they complete.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from canonical import deserialize_system, serialize_system
+from cayley_bezout import bezout_resultant
+from dixon import DixonResultant
+from fraction_free import bareiss_determinant, poly_rows
+from interpolation import (evaluate_determinant, get_degree_bounds,
+                           get_evaluation_points, get_evaluation_terms,
+                           get_parameters, interpolate_values)
+from macaulay import MacaulayResultant
+from modular import modular_determinant
+from sylvesters import sylvester_resultant
+
+METHODS = ["sylvester", "bezout", "dixon", "macaulay"]
+
+# The modular terms, shape and denominator of the matrix interpolated by a
+# worker process, set once per process by `set_evaluation`.
+EVALUATION = {}
+
+
+def determinant(matrix):
+    """
+    Returns
+    -------
+    determinant: sympy expression
+        The determinant of a square matrix: modular for numerical entries and
+        fraction free over the polynomial ring of its symbols otherwise.
+    """
+    if not matrix.free_symbols:
+        return modular_determinant(matrix)
+
+    gens, rows = poly_rows(matrix)
+    return bareiss_determinant(rows).as_expr()
+
+
+def compute_resultant(method, polynomials, variables):
+    """
+    A function that takes a polynomial system and returns the determinant of
+    the given formulation as a sympy expression.
+
+    Parameters
+    ----------
+    method: str
+        One of "sylvester", "bezout" (two univariate polynomials), "dixon"
+        (n + 1 polynomials in n variables) or "macaulay" (n homogeneous
+        polynomials in n variables). For Bezout and Macaulay the determinant
+        of the matrix is divided exactly by the extraneous factor, so that
+        "sylvester" and "bezout" give the same resultant.
+    polynomials: list
+        The polynomials as sympy expressions.
+    variables: list
+        The variables of the system.
+    """
+    if method == "sylvester":
+        p, q = polynomials
+        return sylvester_resultant(p, q, variables[0]).as_expr()
+
+    if method == "bezout":
+        p, q = polynomials
+        return bezout_resultant(p, q, variables[0]).as_expr()
+
+    if method == "dixon":
+        matrix = DixonResultant(polynomials, variables).dixon_matrix
+        if matrix.rows != matrix.cols:
+            raise ValueError('The Dixon matrix is not square.')
+        return determinant(matrix)
+
+    if method == "macaulay":
+        return MacaulayResultant(polynomials, variables).get_resultant().as_expr()
+
+    raise ValueError("Unknown method: {}".format(method))
+
+
+def run_resultant_job(job):
+    """
+    Returns
+    -------
+    resultant: sympy expression
+        The resultant of a (method, serialized system) pair; this is the task
+        sent to the worker processes.
+    """
+    method, system = job
+    polynomials, variables = deserialize_system(system)
+
+    return compute_resultant(method, polynomials, variables)
+
+
+def set_evaluation(terms, shape, denominator):
+    """
+    The initializer of the worker processes of an interpolation: stores the
+    matrix given by `get_evaluation_terms`, so that it is sent once per
+    process and the jobs are only points.
+    """
+    EVALUATION.update(terms=terms, shape=shape, denominator=denominator)
+
+
+def run_evaluation_job(point):
+    """
+    Returns
+    -------
+    determinant: sympy Rational
+        The determinant at a point of the matrix stored by `set_evaluation`,
+        see `interpolation.evaluate_determinant`.
+    """
+    return evaluate_determinant(EVALUATION["terms"], EVALUATION["shape"],
+                                EVALUATION["denominator"], point)
+
+
+def run_chunk(function, chunk):
+    """
+    Returns
+    -------
+    results: list
+        The function applied to each argument of a chunk.
+    """
+    return [function(argument) for argument in chunk]
+
+
+def parallel_map(function, arguments, max_workers=None, chunksize=1, ordered=True,
+                 initializer=None, initargs=()):
+    """
+    A generator that applies a picklable function to each argument in a
+    process pool.
+
+    Parameters
+    ----------
+    function: callable
+        A module level function.
+    arguments: iterable
+        The arguments, one per task.
+    max_workers: int
+        The number of processes. Defaults to the number of CPUs.
+    chunksize: int
+        The number of arguments sent to a worker at once.
+    ordered: bool
+        If True the results are yielded in the order of the arguments.
+        Otherwise (index, result) pairs are yielded as chunks complete.
+    initializer: callable
+        A module level function called with initargs once in each process,
+        for data shared by every task.
+    """
+    arguments = list(arguments)
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=initializer,
+                             initargs=initargs) as executor:
+        if ordered:
+            yield from executor.map(function, arguments, chunksize=chunksize)
+            return
+
+        futures = {executor.submit(run_chunk, function, arguments[start:start + chunksize]): start
+                   for start in range(0, len(arguments), chunksize)}
+        for future in as_completed(futures):
+            for offset, result in enumerate(future.result()):
+                yield futures[future] + offset, result
+
+
+def parallel_resultants(systems, method, max_workers=None, chunksize=1, ordered=True):
+    """
+    A generator of the resultants of many independent systems, each given as
+    a (polynomials, variables) pair. See `parallel_map` for the options.
+    """
+    jobs = [(method, serialize_system(polynomials, variables))
+            for polynomials, variables in systems]
+
+    return parallel_map(run_resultant_job, jobs, max_workers, chunksize, ordered)
+
+
+def parallel_determinants(matrices, max_workers=None, chunksize=1, ordered=True):
+    """
+    A generator of the determinants of many square sympy matrices. See
+    `parallel_map` for the options.
+    """
+    return parallel_map(determinant, matrices, max_workers, chunksize, ordered)
+
+
+def parallel_interpolate_determinant(matrix, parameters=None, max_workers=None, chunksize=8):
+    """
+    Returns
+    -------
+    determinant: sympy Poly
+        The determinant of a parametric matrix as in `interpolate_determinant`,
+        with the numerical determinants at the evaluation points computed in a
+        process pool.
+    """
+    parameters = tuple(parameters) if parameters is not None else get_parameters(matrix)
+    if not parameters:
+        return modular_determinant(matrix)
+
+    degree_bounds = get_degree_bounds(matrix, parameters)
+    points = list(get_evaluation_points(degree_bounds))
+
+    terms, denominator = get_evaluation_terms(matrix, parameters, degree_bounds)
+    values = parallel_map(run_evaluation_job, points, max_workers, chunksize, ordered=False,
+                          initializer=set_evaluation, initargs=(terms, matrix.shape, denominator))
+
+    return interpolate_values({points[index]: value for index, value in values},
+                              parameters, degree_bounds)
@@ -0,0 +1,219 @@
+"""
+Opt-in per-stage profiling of the resultant formulations.
+
+The internal stages of `sylvester_matrix`, `cayley_bezout_matrix`,
+`DixonResultant` and `MacaulayResultant` are marked with `stage` or
+`profiled`. Nothing is measured unless a `profile` context is active, in
+which case the wall time, the number of calls and the matrix dimensions of
+each stage are recorded:
+
+    with profile() as profiler:
+        dixon.dixon_matrix
+    profiler.summary()
+
+Summaries are plain dictionaries which can be written as JSON and merged
+across runs with `aggregate`.
+"""
+import contextlib
+import functools
+import json
+import time
+
+PROFILERS = []
+
+
+class Profiler():
+    """
+    A class collecting the timings of the stages run while it is active.
+    """
+
+    def __init__(self, callback=None):
+        """
+        Parameters
+        ----------
+        callback: callable
+            Called with each event dictionary (stage, seconds, dimensions) as
+            soon as a stage finishes.
+        """
+        self.callback = callback
+        self.events = []
+
+    def record(self, name, seconds, dimensions):
+        """
+        Stores the event of a finished stage.
+        """
+        event = {"stage": name, "seconds": seconds, "dimensions": dimensions}
+        self.events.append(event)
+        if self.callback is not None:
+            self.callback(event)
+
+    def summary(self):
+        """
+        Returns
+        -------
+        summary: dict
+            For each stage the number of calls, the total and the largest wall
+            time in seconds and the distinct dimensions seen.
+        """
+        summary = {}
+        for event in self.events:
+            entry = summary.setdefault(event["stage"], {"calls": 0, "seconds": 0.0,
+                                                        "max_seconds": 0.0, "dimensions": []})
+            entry["calls"] += 1
+            entry["seconds"] += event["seconds"]
+            entry["max_seconds"] = max(entry["max_seconds"], event["seconds"])
+            if event["dimensions"] and event["dimensions"] not in entry["dimensions"]:
+                entry["dimensions"].append(event["dimensions"])
+
+        return summary
+
+    def export(self, path):
+        """
+        Writes the summary to a JSON file.
+        """
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def report(self):
+        """
+        Returns
+        -------
+        report: str
+            A table of the stages, slowest first.
+        """
+        lines = ["{:<32} {:>8} {:>12} {:>12}".format("stage", "calls", "total (s)", "max (s)")]
+        for name, entry in sorted(self.summary().items(), key=lambda item: -item[1]["seconds"]):
+            lines.append("{:<32} {:>8} {:12.4f} {:12.4f}".format(
+                name, entry["calls"], entry["seconds"], entry["max_seconds"]))
+
+        return "\n".join(lines)
+
+
+@contextlib.contextmanager
+def profile(callback=None):
+    """
+    A context manager which activates a `Profiler` and yields it. Contexts can
+    be nested; every active profiler records the stages.
+    """
+    profiler = Profiler(callback)
+    PROFILERS.append(profiler)
+    try:
+        yield profiler
+    finally:
+        PROFILERS.remove(profiler)
+
+
+def record(name, seconds, dimensions=None):
+    """
+    Passes a finished stage to every active profiler.
+    """
+    for profiler in PROFILERS:
+        profiler.record(name, seconds, dimensions or {})
+
+
+class Stage():
+    """
+    The timing context of one stage; `dimensions` can be filled in before the
+    context exits.
+    """
+
+    def __init__(self, name, dimensions):
+        self.name = name
+        self.dimensions = dimensions
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exception):
+        record(self.name, time.perf_counter() - self.start, self.dimensions)
+        return False
+
+
+class NullStage():
+    """
+    The context of a stage when no profiler is active.
+    """
+    dimensions = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        return False
+
+
+NULL_STAGE = NullStage()
+
+
+def stage(name, **dimensions):
+    """
+    Returns
+    -------
+    context: context manager
+        Times the enclosed block as the given stage, or does nothing if no
+        profiler is active.
+    """
+    if not PROFILERS:
+        return NULL_STAGE
+    return Stage(name, dict(dimensions))
+
+
+def get_dimensions(result):
+    """
+    Returns
+    -------
+    dimensions: dict
+        The shape of a matrix result, the number of terms of a polynomial or
+        the length of a list.
+    """
+    if hasattr(result, "shape"):
+        return {"shape": list(result.shape)}
+    if hasattr(result, "terms") and callable(result.terms):
+        return {"terms": len(result.terms())}
+    if isinstance(result, (list, tuple)):
+        return {"length": len(result)}
+    return {}
+
+
+def profiled(name):
+    """
+    A decorator which times each call of a function as the given stage and
+    records the dimensions of its result. When no profiler is active the
+    function is called directly.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not PROFILERS:
+                return function(*args, **kwargs)
+
+            start = time.perf_counter()
+            result = function(*args, **kwargs)
+            record(name, time.perf_counter() - start, get_dimensions(result))
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def aggregate(summaries):
+    """
+    Returns
+    -------
+    summary: dict
+        The summaries of several runs merged: calls and times are added, the
+        largest time is kept and the dimensions are joined.
+    """
+    merged = {}
+    for summary in summaries:
+        for name, entry in summary.items():
+            total = merged.setdefault(name, {"calls": 0, "seconds": 0.0,
+                                             "max_seconds": 0.0, "dimensions": []})
+            total["calls"] += entry["calls"]
+            total["seconds"] += entry["seconds"]
+            total["max_seconds"] = max(total["max_seconds"], entry["max_seconds"])
+            total["dimensions"] += [d for d in entry["dimensions"] if d not in total["dimensions"]]
+
+    return merged
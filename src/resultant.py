@@ -0,0 +1,305 @@
+"""
+Automatic choice of the formulation of a resultant.
+
+The cost of the four formulations differs by orders of magnitude on the same
+system: a Sylvester matrix of size m + n where a Bezout matrix of size
+max(m, n) would do, or a Macaulay matrix much larger than Dixon's. A
+`ResultantPlan` lists the formulations which apply to a system, estimates the
+size of their matrices and the cost of their determinants from the degrees
+alone, without building any matrix, and runs the cheapest of those which
+give the resultant itself:
+
+    plan = get_plan(polynomials, variables)
+    plan.candidates, plan.chosen
+    plan.run()
+
+The systems and formulations are
+
+    two polynomials in one variable      sylvester, bezout, macaulay
+    n + 1 polynomials in n variables     dixon, macaulay
+    n homogeneous polynomials in n       macaulay, and the formulations of
+    variables                            the system with x_n = 1
+
+"sylvester", "bezout" and "macaulay" give the same resultant, the
+determinant of the Sylvester matrix, which is also Macaulay's resultant of
+the homogenised pair: the Bezout determinant is divided by its extraneous
+power of a leading coefficient and its sign is normalised. "dixon" gives the
+projection operator of `DixonResultant.get_dixon_resultant`, a multiple of
+the resultant, and "macaulay" on affine polynomials the resultant of their
+homogenisation. Since the projection operator can have extraneous factors,
+"auto" never chooses "dixon", so that its result does not depend on the cost
+ranking; Dixon's candidate is listed with its cost and runs when requested.
+"""
+import functools
+import math
+
+import sympy as sym
+
+from canonical import get_symbols, get_terms
+from cayley_bezout import bezout_resultant
+from dixon import DixonResultant
+from macaulay import MacaulayResultant
+from sylvesters import sylvester_resultant
+
+METHODS = ["sylvester", "bezout", "dixon", "macaulay"]
+
+# The degree of the matrix entries in the coefficients of the polynomials;
+# the entries of Dixon's matrix have degree n + 1 in n variables.
+ENTRY_DEGREES = {"sylvester": 1, "bezout": 2, "macaulay": 1}
+
+# The formulations which return a multiple of the resultant.
+PROJECTION_METHODS = ["dixon"]
+
+
+def get_determinant_cost(rows, columns, entry_degree, coefficient_degree, parameters):
+    """
+    Returns
+    -------
+    cost: int
+        An estimate of the cost of a fraction-free elimination of a rows x
+        columns matrix: rows * columns * min(rows, columns) operations on
+        entries of the size of the determinant. With p parameters this is
+        the number of monomials of degree D = min(rows, columns) *
+        entry_degree * coefficient_degree in p variables, binomial(D + p, p);
+        with integer entries the length D of the coefficients grows linearly.
+    """
+    size = min(rows, columns)
+    if parameters:
+        weight = math.comb(size * entry_degree * coefficient_degree + parameters, parameters)
+    else:
+        weight = size * entry_degree
+
+    return rows * columns * size * max(weight, 1)
+
+
+def is_homogeneous(terms):
+    """
+    Returns
+    -------
+    homogeneous: bool
+        Whether every term of a polynomial has the same total degree.
+    """
+    return len({sum(powers) for powers in terms}) <= 1
+
+
+def get_total_degree(terms):
+    return max((sum(powers) for powers in terms), default=0)
+
+
+class ResultantPlan():
+    """
+    A class for choosing and running the cheapest formulation of the
+    resultant of a system.
+
+    The stages (terms, parameters, formulations and candidates) are
+    attributes computed on first access and cached; only `run` builds a
+    matrix.
+    """
+
+    def __init__(self, polynomials, variables):
+        """
+        Parameters
+        ----------
+        polynomials: list
+            Two polynomials in one variable, n + 1 polynomials in n variables,
+            or n homogeneous polynomials in n variables, as sympy Poly
+            objects, expressions or lambdified functions of the variables.
+        variables: list
+            The variables of the system.
+        """
+        self.polynomials = polynomials
+        self.variables = list(variables)
+
+    @functools.cached_property
+    def terms(self):
+        return [get_terms(p, self.variables) for p in self.polynomials]
+
+    @functools.cached_property
+    def parameters(self):
+        symbols = set().union(*[get_symbols(c) for terms in self.terms for c in terms.values()])
+        return sorted(symbols - set(self.variables), key=sym.default_sort_key)
+
+    @functools.cached_property
+    def coefficient_degree(self):
+        if not self.parameters:
+            return 0
+        return max(sym.Poly(c, *self.parameters).total_degree()
+                   for terms in self.terms for c in terms.values())
+
+    @functools.cached_property
+    def kind(self):
+        """
+        The kind of system: "univariate", "affine" or "homogeneous". Raises
+        ValueError if the resultant of the system is not defined.
+        """
+        n, m = len(self.variables), len(self.polynomials)
+        if m == n + 1:
+            return "univariate" if n == 1 else "affine"
+        if m == n and n >= 2 and all(is_homogeneous(terms) for terms in self.terms):
+            return "homogeneous"
+
+        raise ValueError('A resultant needs n + 1 polynomials in n variables or n homogeneous '
+                         'polynomials in n variables, not {} polynomials in {}.'.format(m, n))
+
+    @functools.cached_property
+    def homogeneous(self):
+        """
+        The polynomials as a homogeneous system and its variables: affine
+        polynomials are homogenised with a new variable.
+        """
+        if self.kind == "homogeneous":
+            return self.polynomials, self.variables
+
+        h = sym.Dummy("h")
+        polynomials = []
+        for terms in self.terms:
+            degree = get_total_degree(terms)
+            polynomials.append(sym.Poly.from_dict(
+                {powers + (degree - sum(powers),): c for powers, c in terms.items()},
+                *self.variables, h))
+
+        return polynomials, self.variables + [h]
+
+    @functools.cached_property
+    def affine(self):
+        """
+        The polynomials as an affine system of sympy Poly objects and its
+        variables: homogeneous polynomials are dehomogenised with x_n = 1.
+        """
+        if self.kind != "homogeneous":
+            return [sym.Poly.from_dict(terms, *self.variables) for terms in self.terms], self.variables
+
+        variables = self.variables[:-1]
+        polynomials = [sym.Poly.from_dict({powers[:-1]: c for powers, c in terms.items()}, *variables)
+                       for terms in self.terms]
+
+        return polynomials, variables
+
+    @functools.cached_property
+    def formulations(self):
+        """
+        The formulations which apply to the system, a dictionary mapping each
+        method to its (rows, columns) and the object or polynomials it runs on.
+        """
+        formulations = {}
+        polynomials, variables = self.affine
+
+        degrees = [get_total_degree(terms) for terms in self.terms]
+        if len(variables) == 1 and min(degrees) > 0:
+            # For a homogeneous pair the degrees must survive x_2 = 1.
+            m, n = [p.degree() for p in polynomials]
+            if [m, n] == degrees:
+                formulations["sylvester"] = (m + n, m + n), polynomials
+                formulations["bezout"] = (max(m, n), max(m, n)), polynomials
+        elif len(variables) >= 2:
+            dixon = DixonResultant(polynomials, variables)
+            formulations["dixon"] = dixon.size_bounds, dixon
+
+        if min(degrees) > 0:
+            macaulay = MacaulayResultant(*self.homogeneous)
+            size = int(macaulay.monomials_size)
+            formulations["macaulay"] = (size, size), macaulay
+
+        return formulations
+
+    @functools.cached_property
+    def candidates(self):
+        """
+        The applicable formulations as dictionaries of the method, the size of
+        its matrix, the degree of its entries in the coefficients, the
+        estimated cost and whether it returns the resultant itself rather than
+        a multiple, sorted by cost.
+        """
+        candidates = []
+        for method, ((rows, columns), _) in self.formulations.items():
+            entry_degree = ENTRY_DEGREES.get(method, len(self.affine[1]) + 1)
+            cost = get_determinant_cost(rows, columns, entry_degree, self.coefficient_degree,
+                                        len(self.parameters))
+            candidates.append({"method": method, "rows": rows, "columns": columns,
+                               "entry_degree": entry_degree, "cost": cost,
+                               "resultant": method not in PROJECTION_METHODS})
+
+        return sorted(candidates, key=lambda c: (c["cost"], METHODS.index(c["method"])))
+
+    @functools.cached_property
+    def chosen(self):
+        return self.choose()
+
+    def choose(self, method="auto"):
+        """
+        Returns
+        -------
+        candidate: dict
+            The cheapest candidate which returns the resultant if method is
+            "auto", else the candidate of the method. Raises ValueError if the
+            method does not apply.
+        """
+        if method == "auto":
+            candidates = [c for c in self.candidates if c["resultant"]]
+            if not candidates:
+                raise ValueError('No formulation applies to a system with a constant polynomial.')
+            return candidates[0]
+
+        for candidate in self.candidates:
+            if candidate["method"] == method:
+                return candidate
+
+        if method not in METHODS:
+            raise ValueError("Unknown method: {}".format(method))
+        raise ValueError('The {} formulation does not apply to a {} system.'.format(method, self.kind))
+
+    def run(self, method="auto"):
+        """
+        Returns
+        -------
+        resultant: sympy expression
+            The resultant of the system by the chosen formulation, see the
+            module docstring.
+        """
+        method = self.choose(method)["method"]
+        _, formulation = self.formulations[method]
+
+        if method in ("sylvester", "bezout"):
+            x = self.affine[1][0]
+            p, q = formulation
+            if method == "sylvester":
+                result = sylvester_resultant(p.as_expr(), q.as_expr(), x).as_expr()
+            else:
+                result = bezout_resultant(p.as_expr(), q.as_expr(), x)
+
+        elif method == "dixon":
+            result = formulation.get_dixon_resultant()
+
+        else:
+            result = formulation.get_resultant()
+
+        return sym.expand(result.as_expr() if isinstance(result, sym.Poly) else sym.sympify(result))
+
+
+def get_plan(polynomials, variables):
+    """
+    A function that takes a system and returns its `ResultantPlan`, whose
+    candidates and chosen formulation can be inspected before running it.
+    """
+    return ResultantPlan(polynomials, variables)
+
+
+def resultant(polynomials, variables, method="auto"):
+    """
+    A function that takes a polynomial system and returns its resultant.
+
+    Parameters
+    ----------
+    polynomials: list
+        Two polynomials in one variable, n + 1 polynomials in n variables or
+        n homogeneous polynomials in n variables.
+    variables: list
+        The variables of the system.
+    method: str
+        "auto" runs the formulation of least estimated cost among
+        "sylvester", "bezout" and "macaulay", which give the same resultant.
+        "sylvester", "bezout", "dixon" or "macaulay" run the given one;
+        "dixon" gives the projection operator of Kapur, Saxena and Yang, a
+        multiple of the resultant, and is only run when requested.
+    """
+    return ResultantPlan(polynomials, variables).run(method)
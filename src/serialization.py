@@ -0,0 +1,291 @@
+"""
+A compact binary format for resultant matrices.
+
+The entries of the matrices of `sylvester_matrix`, `cayley_bezout_matrix`,
+`DixonResultant.get_dixon_matrix` and `MacaulayResultant.get_matrix` are
+polynomials in the parameters with rational coefficients. They are stored as
+sparse polynomials in flat NumPy arrays instead of sympy expression trees:
+
+    entry_rows, entry_columns   the position of each non zero entry
+    term_offsets                the terms of entry k are term_offsets[k:k + 2]
+    exponents                   one row of parameter exponents per term
+    numerators, denominators    the coefficients of the terms
+
+Integers which fit in an int64 are kept as an array; larger ones as the
+little-endian bytes of each integer in one uint8 buffer with the offsets of the integers. Every
+array uses the smallest integer type which holds its values, and the
+denominators are omitted when every coefficient is an integer. A matrix is
+saved as one flat file of a JSON header followed by the raw arrays, so that
+loading can memory map the arrays without copying them.
+"""
+import json
+
+import numpy as np
+import sympy as sym
+
+from canonical import get_symbols
+
+VERSION = 1
+MAGIC = b"RESMAT\x00\x01"
+ALIGNMENT = 8
+
+
+def get_entry_terms(entry, parameters, index):
+    """
+    Returns
+    -------
+    terms: list
+        The (exponents, coefficient) pairs of a matrix entry as a polynomial in
+        the parameters, with sympy Rational coefficients. Expanded entries are
+        read term by term; other entries are expanded with sympy. Raises
+        ValueError if the entry is not such a polynomial.
+    """
+    terms = []
+    for monomial, coefficient in entry.as_coefficients_dict().items():
+        exponents = [0] * len(parameters)
+        for base, exponent in monomial.as_powers_dict().items():
+            if base == 1:
+                continue
+            if base not in index or not exponent.is_Integer or exponent < 0:
+                terms = None
+                break
+            exponents[index[base]] += int(exponent)
+        if terms is None or not coefficient.is_Rational:
+            terms = None
+            break
+        terms.append((tuple(exponents), coefficient))
+
+    if terms is not None:
+        return terms
+
+    try:
+        poly = sym.Poly(entry, *parameters)
+    except sym.PolynomialError:
+        poly = None
+    if poly is None or not all(c.is_Rational for c in poly.coeffs()):
+        raise ValueError('The entry {} is not a polynomial with rational coefficients.'.format(entry))
+
+    return poly.terms()
+
+
+def get_integer_dtype(values):
+    """
+    Returns
+    -------
+    dtype: numpy dtype
+        The smallest of int8, int16, int32 and int64 which holds the values.
+    """
+    low, high = min(values, default=0), max(values, default=0)
+    for dtype in (np.int8, np.int16, np.int32):
+        if np.iinfo(dtype).min <= low and high <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+
+    return np.dtype(np.int64)
+
+
+def encode_integers(values):
+    """
+    Returns
+    -------
+    arrays: dict
+        The integers as an array under "values" if they all fit in an int64,
+        otherwise as a uint8 buffer "bytes" of their signed little-endian
+        bytes and the "offsets" of each integer in the buffer.
+    """
+    if all(-2 ** 63 <= value < 2 ** 63 for value in values):
+        return {"values": np.array(values, dtype=get_integer_dtype(values))}
+
+    chunks = [value.to_bytes(value.bit_length() // 8 + 1, "little", signed=True) for value in values]
+    offsets = np.cumsum([0] + [len(chunk) for chunk in chunks])
+    offsets = offsets.astype(get_integer_dtype([offsets[-1]]))
+
+    return {"bytes": np.frombuffer(b"".join(chunks), dtype=np.uint8), "offsets": offsets}
+
+
+def decode_integers(arrays):
+    """
+    Returns
+    -------
+    values: list
+        The Python integers encoded by `encode_integers`.
+    """
+    if "values" in arrays:
+        return arrays["values"].tolist()
+
+    buffer, offsets = arrays["bytes"], arrays["offsets"].tolist()
+    return [int.from_bytes(buffer[start:end].tobytes(), "little", signed=True)
+            for start, end in zip(offsets, offsets[1:])]
+
+
+def matrix_to_arrays(matrix, parameters=None):
+    """
+    A function that takes a matrix whose entries are polynomials with rational
+    coefficients and returns its header and arrays.
+
+    Parameters
+    ----------
+    matrix: sympy Matrix
+        A dense or sparse matrix.
+    parameters: list
+        The symbols of the polynomials. By default the symbols and indexed
+        symbols of the matrix, sorted by name.
+    """
+    if parameters is None:
+        parameters = sorted(get_symbols(matrix), key=sym.default_sort_key)
+    index = {parameter: k for k, parameter in enumerate(parameters)}
+
+    rows, columns, offsets, exponents, numerators, denominators = [], [], [0], [], [], []
+    for (i, j), entry in sorted(matrix.todok().items()):
+        entry = sym.sympify(entry)
+        if entry == 0:
+            continue
+        terms = get_entry_terms(entry, parameters, index)
+        rows.append(i)
+        columns.append(j)
+        offsets.append(offsets[-1] + len(terms))
+        for powers, coefficient in terms:
+            exponents.append(powers)
+            numerators.append(int(coefficient.p))
+            denominators.append(int(coefficient.q))
+
+    powers = [e for powers in exponents for e in powers]
+    arrays = {"entry_rows": np.array(rows, dtype=get_integer_dtype(rows)),
+              "entry_columns": np.array(columns, dtype=get_integer_dtype(columns)),
+              "term_offsets": np.array(offsets, dtype=get_integer_dtype(offsets)),
+              "exponents": np.array(powers, dtype=get_integer_dtype(powers)).reshape(
+                  len(exponents), len(parameters))}
+    encodings = {}
+    for name, values in [("numerators", numerators), ("denominators", denominators)]:
+        if name == "denominators" and all(value == 1 for value in values):
+            continue
+        encoded = encode_integers(values)
+        encodings[name] = encoded["values"].dtype.name if "values" in encoded else "bytes"
+        arrays.update({"{}_{}".format(name, key): array for key, array in encoded.items()})
+
+    header = {"version": VERSION, "shape": list(matrix.shape),
+              "parameters": [sym.srepr(parameter) for parameter in parameters],
+              "entries": len(rows), "terms": len(exponents), "integers": encodings}
+
+    return header, arrays
+
+
+def arrays_to_matrix(header, arrays, sparse=False):
+    """
+    Returns
+    -------
+    matrix: sympy Matrix
+        The matrix of a header and its arrays, as given by `matrix_to_arrays`
+        or `load_arrays`, with expanded entries. If sparse is True a sympy
+        SparseMatrix is returned.
+    """
+    parameters = [sym.sympify(parameter) for parameter in header["parameters"]]
+
+    def get_integers(name):
+        prefix = name + "_"
+        return decode_integers({key[len(prefix):]: array for key, array in arrays.items()
+                                if key.startswith(prefix)})
+
+    numerators = get_integers("numerators")
+    denominators = get_integers("denominators") if "denominators" in header["integers"] \
+        else [1] * len(numerators)
+    exponents = arrays["exponents"].tolist()
+    offsets = arrays["term_offsets"].tolist()
+
+    monomials = {}
+
+    def get_monomial(powers):
+        key = tuple(powers)
+        if key not in monomials:
+            monomials[key] = sym.Mul(*[p ** e for p, e in zip(parameters, key)])
+        return monomials[key]
+
+    entries = {}
+    for k, (i, j) in enumerate(zip(arrays["entry_rows"].tolist(), arrays["entry_columns"].tolist())):
+        entries[i, j] = sym.Add(*[sym.Rational(numerators[t], denominators[t]) * get_monomial(exponents[t])
+                                  for t in range(offsets[k], offsets[k + 1])])
+
+    if sparse:
+        return sym.SparseMatrix(*header["shape"], entries)
+
+    matrix = sym.zeros(*header["shape"])
+    for (i, j), entry in entries.items():
+        matrix[i, j] = entry
+    return matrix
+
+
+def save_matrix(path, matrix, parameters=None):
+    """
+    A function that writes a matrix to a single flat file and returns the
+    header. The file starts with MAGIC, the length of the JSON header as an
+    8 byte little-endian integer and the header; the arrays follow, each at an
+    offset aligned to 8 bytes which is recorded in the header.
+
+    Parameters
+    ----------
+    path: str
+        The file to write.
+    matrix: sympy Matrix
+        A matrix whose entries are polynomials with rational coefficients.
+    parameters: list
+        The symbols of the polynomials, see `matrix_to_arrays`.
+    """
+    header, arrays = matrix_to_arrays(matrix, parameters)
+
+    layout, offset = {}, 0
+    for name, array in sorted(arrays.items()):
+        layout[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+
+    encoded = json.dumps({**header, "arrays": layout}).encode()
+    encoded += b" " * (-(len(MAGIC) + 8 + len(encoded)) % ALIGNMENT)
+    with open(path, "wb") as f:
+        f.write(MAGIC + len(encoded).to_bytes(8, "little") + encoded)
+        for name in sorted(arrays):
+            data = np.ascontiguousarray(arrays[name]).tobytes()
+            f.write(data + b"\0" * (-len(data) % ALIGNMENT))
+
+    return header
+
+
+def load_arrays(path, mmap_mode="r"):
+    """
+    Returns
+    -------
+    header: dict
+        The shape, the parameters and the integer encodings of a saved
+        matrix.
+    arrays: dict
+        Its arrays, memory-mapped views of the file unless mmap_mode is None,
+        in which case they are read into memory.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError('{} is not a saved matrix.'.format(path))
+        length = int.from_bytes(f.read(8), "little")
+        header = json.loads(f.read(length))
+    if header["version"] != VERSION:
+        raise ValueError('Unsupported format version {}.'.format(header["version"]))
+
+    start = len(MAGIC) + 8 + length
+    buffer = np.memmap(path, dtype=np.uint8, mode=mmap_mode) if mmap_mode else np.fromfile(path, dtype=np.uint8)
+
+    arrays = {}
+    for name, entry in header.pop("arrays").items():
+        dtype = np.dtype(entry["dtype"])
+        size = int(np.prod(entry["shape"])) * dtype.itemsize
+        offset = start + entry["offset"]
+        arrays[name] = buffer[offset:offset + size].view(dtype).reshape(entry["shape"])
+
+    return header, arrays
+
+
+def load_matrix(path, sparse=False):
+    """
+    Returns
+    -------
+    matrix: sympy Matrix
+        The matrix saved by `save_matrix`, rebuilt from memory-mapped arrays.
+        If sparse is True a sympy SparseMatrix is returned.
+    """
+    header, arrays = load_arrays(path)
+    return arrays_to_matrix(header, arrays, sparse)
@@ -0,0 +1,338 @@
+"""
+A local batch service for resultant computations.
+
+Polynomial systems are read from JSON Lines, one job per line:
+
+    {"id": "s1", "method": "macaulay", "variables": ["x", "y", "z"],
+     "polynomials": ["x**2 + y*z", "y**2 - 3*x*z", "x + y - z"]}
+
+where method is one of `parallel.METHODS`. The jobs are dispatched to a pool
+of worker processes and one result is written per job as it completes:
+
+    {"id": "s1", "status": "ok", "resultant": "...", "seconds": 0.12}
+
+The status is "ok", "error", "timeout" or "memory". A worker which exceeds
+its timeout is killed and replaced, and each worker runs under an address
+space limit, so that one job cannot stall or exhaust the machine. The input
+is only read when a worker is free, so at most one job per worker is in
+flight, and nothing is read while the consumer of the results is busy.
+
+The polynomials are parsed with sympy, which evaluates the strings: the input
+must be trusted. Run from the src directory:
+
+    python service.py systems.jsonl --output results.jsonl --workers 4 --timeout 60 --memory-limit 2048
+"""
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from multiprocessing.connection import wait
+
+import sympy as sym
+
+from parallel import METHODS, compute_resultant
+
+STATUSES = ["ok", "error", "timeout", "memory"]
+
+
+def parse_job(job):
+    """
+    Returns
+    -------
+    method: str
+        The formulation of the job.
+    polynomials: list
+        The polynomials of the job as sympy expressions.
+    variables: list
+        The variables of the job as sympy symbols.
+    """
+    method = job.get("method", "sylvester")
+    if method not in METHODS:
+        raise ValueError("Unknown method: {}".format(method))
+
+    variables = [sym.Symbol(name) for name in job["variables"]]
+    names = {str(v): v for v in variables}
+    polynomials = [sym.sympify(p, locals=names) for p in job["polynomials"]]
+
+    return method, polynomials, variables
+
+
+def run_job(job):
+    """
+    Returns
+    -------
+    result: dict
+        The id, status and resultant (or error message) of a job, with the
+        seconds spent computing it.
+    """
+    start = time.perf_counter()
+    result = {"id": job.get("id")}
+    try:
+        method, polynomials, variables = parse_job(job)
+        result.update(status="ok", resultant=str(compute_resultant(method, polynomials, variables)))
+    except MemoryError:
+        result.update(status="memory", error="The memory limit was exceeded.")
+    except Exception as error:
+        result.update(status="error", error="{}: {}".format(type(error).__name__, error))
+    result["seconds"] = time.perf_counter() - start
+
+    return result
+
+
+def set_memory_limit(megabytes):
+    """
+    A function that caps the address space of the current process, where the
+    resource module is available.
+    """
+    try:
+        import resource
+    except ImportError:
+        return
+
+    limit = megabytes * 2 ** 20
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def work(connection, memory_limit):
+    """
+    The loop of a worker process: receive jobs from the connection and send
+    back their results, until None is received.
+    """
+    if memory_limit is not None:
+        set_memory_limit(memory_limit)
+
+    while True:
+        job = connection.recv()
+        if job is None:
+            break
+        connection.send(run_job(job))
+
+
+class Worker():
+    """
+    A class for a worker process and the job it is running.
+    """
+
+    def __init__(self, context, memory_limit):
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=work, args=(child, memory_limit), daemon=True)
+        self.process.start()
+        child.close()
+        self.job = None
+        self.started = None
+
+    def submit(self, job):
+        self.job, self.started = job, time.perf_counter()
+        self.connection.send(job)
+
+    def stop(self):
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(1)
+        self.kill()
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+def percentile(values, q):
+    """
+    Returns
+    -------
+    value: float
+        The q-th percentile of the values by the nearest rank, None if there
+        are no values.
+    """
+    if not values:
+        return None
+
+    values = sorted(values)
+    return values[max(0, -(-q * len(values) // 100) - 1)]
+
+
+class ResultantService():
+    """
+    A class for running streams of resultant jobs in a pool of worker
+    processes.
+    """
+
+    def __init__(self, workers=None, timeout=None, memory_limit=None):
+        """
+        Parameters
+        ----------
+        workers: int
+            The number of worker processes. Defaults to the number of CPUs.
+        timeout: float
+            The seconds after which a job is stopped and its worker replaced.
+        memory_limit: int
+            The address space limit of each worker in megabytes. It includes
+            the interpreter and sympy, of a few hundred megabytes.
+        """
+        self.workers = workers or multiprocessing.cpu_count()
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.context = multiprocessing.get_context()
+        self.latencies = []
+        self.counts = dict.fromkeys(STATUSES, 0)
+        self.elapsed = 0.0
+
+    def run(self, jobs):
+        """
+        A generator of the results of the jobs, dictionaries as in the module
+        docstring, in the order in which they complete. Jobs may also be given
+        as strings, which are parsed as JSON; the id of a job defaults to its
+        position in the input.
+        """
+        pool = [Worker(self.context, self.memory_limit) for _ in range(self.workers)]
+        jobs = iter(enumerate(jobs))
+        exhausted = False
+        start = time.perf_counter()
+
+        try:
+            while True:
+                for worker in pool:
+                    if exhausted or worker.job is not None:
+                        continue
+                    for position, job in jobs:
+                        job, error = self.load(job, position)
+                        if error is None:
+                            worker.submit(job)
+                            break
+                        yield self.record(error)
+                    else:
+                        exhausted = True
+
+                busy = [worker for worker in pool if worker.job is not None]
+                if not busy:
+                    break
+
+                timeout = None
+                if self.timeout is not None:
+                    deadline = min(worker.started for worker in busy) + self.timeout
+                    timeout = max(0.0, deadline - time.perf_counter())
+
+                ready = wait([worker.connection for worker in busy], timeout)
+                now = time.perf_counter()
+                for index, worker in enumerate(pool):
+                    if worker.job is None:
+                        continue
+                    if worker.connection in ready:
+                        try:
+                            result, reusable = worker.connection.recv(), True
+                        except (EOFError, OSError):
+                            result, reusable = {"id": worker.job.get("id"), "status": "error",
+                                                "error": "The worker exited with code {}.".format(
+                                                    worker.process.exitcode)}, False
+                    elif self.timeout is not None and now - worker.started >= self.timeout:
+                        result, reusable = {"id": worker.job.get("id"), "status": "timeout",
+                                            "error": "The job exceeded {} seconds.".format(self.timeout),
+                                            "seconds": now - worker.started}, False
+                    else:
+                        continue
+
+                    latency = now - worker.started
+                    if reusable:
+                        worker.job = None
+                    else:
+                        worker.kill()
+                        pool[index] = Worker(self.context, self.memory_limit)
+                    yield self.record(result, latency)
+        finally:
+            for worker in pool:
+                worker.stop()
+            self.elapsed += time.perf_counter() - start
+
+    def load(self, job, position):
+        """
+        Returns
+        -------
+        job: dict
+            The job with its id.
+        error: dict
+            An error result if the job is not a valid JSON object, else None.
+        """
+        if isinstance(job, str):
+            try:
+                job = json.loads(job)
+            except json.JSONDecodeError as error:
+                return None, {"id": position, "status": "error", "error": "Invalid JSON: {}".format(error)}
+        if not isinstance(job, dict):
+            return None, {"id": position, "status": "error", "error": "A job must be a JSON object."}
+        job.setdefault("id", position)
+
+        return job, None
+
+    def record(self, result, latency=None):
+        """
+        Counts a result by its status and keeps its latency; jobs rejected
+        before reaching a worker have no latency.
+        """
+        self.counts[result["status"]] += 1
+        if latency is not None:
+            self.latencies.append(latency)
+        return result
+
+    def summary(self):
+        """
+        Returns
+        -------
+        summary: dict
+            The number of jobs of each status, the throughput in jobs per
+            second and the latency percentiles in seconds of the jobs run by
+            a worker. Jobs which are not valid JSON objects are counted but
+            have no latency.
+        """
+        jobs = sum(self.counts.values())
+        return {"jobs": jobs, **self.counts, "seconds": self.elapsed,
+                "throughput": jobs / self.elapsed if self.elapsed else 0.0,
+                "latency": {"mean": (sum(self.latencies) / len(self.latencies)
+                                     if self.latencies else None),
+                            "p50": percentile(self.latencies, 50),
+                            "p90": percentile(self.latencies, 90),
+                            "p99": percentile(self.latencies, 99),
+                            "max": max(self.latencies, default=None)}}
+
+
+def run_batch(jobs, workers=None, timeout=None, memory_limit=None):
+    """
+    A generator of the results of the jobs as they complete, see
+    `ResultantService.run`.
+    """
+    return ResultantService(workers, timeout, memory_limit).run(jobs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", default="-", help="A JSON Lines file, - for stdin.")
+    parser.add_argument("--output", default="-", help="A JSON Lines file, - for stdout.")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=None)
+    parser.add_argument("--memory-limit", type=int, default=None, help="In megabytes per worker.")
+    arguments = parser.parse_args()
+
+    source = sys.stdin if arguments.input == "-" else open(arguments.input)
+    target = sys.stdout if arguments.output == "-" else open(arguments.output, "w")
+    service = ResultantService(arguments.workers, arguments.timeout, arguments.memory_limit)
+    try:
+        lines = (line for line in source if line.strip())
+        for result in service.run(lines):
+            target.write(json.dumps(result) + "\n")
+            target.flush()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+    print(json.dumps(service.summary()), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
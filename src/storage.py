@@ -0,0 +1,107 @@
+"""
+Out-of-core storage of large sparse matrices with modular coefficients.
+
+Rows are streamed into memory-mapped NumPy files in compressed sparse row
+layout: `indptr.npy` (the start of each row), `indices.npy` (the columns) and
+`data.npy` (the int64 residues), next to a `header.json` with the shape, the
+number of stored entries and any metadata. Neither writing nor reading needs
+the whole matrix in memory.
+"""
+import json
+import os
+
+import numpy as np
+
+
+def get_paths(directory):
+    """
+    Returns
+    -------
+    paths: dict
+        The files of a stored matrix.
+    """
+    return {name: os.path.join(directory, name + ".npy") for name in ("indptr", "indices", "data")}
+
+
+def write_sparse_rows(directory, rows, shape, capacity, metadata=None):
+    """
+    A function that writes an iterable of sparse rows to a directory and
+    returns its header.
+
+    Parameters
+    ----------
+    directory: str
+        The directory of the files, created if needed.
+    rows: iterable
+        For each row a list of (column, value) pairs with integer values.
+    shape: tuple
+        The number of rows and columns.
+    capacity: int
+        An upper bound of the number of stored entries, the size of the
+        memory-mapped column and value files.
+    metadata: dict
+        Extra JSON data kept in the header, for example the prime.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = get_paths(directory)
+
+    indptr = np.lib.format.open_memmap(paths["indptr"], mode="w+", dtype=np.int64, shape=(shape[0] + 1,))
+    indices = np.lib.format.open_memmap(paths["indices"], mode="w+", dtype=np.int64, shape=(max(capacity, 1),))
+    data = np.lib.format.open_memmap(paths["data"], mode="w+", dtype=np.int64, shape=(max(capacity, 1),))
+
+    count = 0
+    indptr[0] = 0
+    for i, row in enumerate(rows):
+        for column, value in row:
+            indices[count] = column
+            data[count] = value
+            count += 1
+        indptr[i + 1] = count
+
+    for array in (indptr, indices, data):
+        array.flush()
+    del indptr, indices, data
+
+    header = {"shape": list(shape), "nnz": count, **(metadata or {})}
+    with open(os.path.join(directory, "header.json"), "w") as f:
+        json.dump(header, f, indent=2)
+
+    return header
+
+
+def load_sparse_rows(directory, mmap_mode="r"):
+    """
+    Returns
+    -------
+    indptr: numpy array
+        The row starts, memory mapped.
+    indices: numpy array
+        The columns of the stored entries, memory mapped.
+    data: numpy array
+        The values of the stored entries, memory mapped.
+    header: dict
+        The shape, the number of entries and the metadata.
+    """
+    with open(os.path.join(directory, "header.json")) as f:
+        header = json.load(f)
+
+    paths = get_paths(directory)
+    indptr = np.load(paths["indptr"], mmap_mode=mmap_mode)
+    indices = np.load(paths["indices"], mmap_mode=mmap_mode)[:header["nnz"]]
+    data = np.load(paths["data"], mmap_mode=mmap_mode)[:header["nnz"]]
+
+    return indptr, indices, data, header
+
+
+def iter_sparse_rows(directory):
+    """
+    Returns
+    -------
+    rows: generator
+        For each stored row the arrays of its columns and values, read from
+        the memory-mapped files one row at a time.
+    """
+    indptr, indices, data, header = load_sparse_rows(directory)
+    for i in range(header["shape"][0]):
+        start, end = indptr[i], indptr[i + 1]
+        yield indices[start:end], data[start:end]
@@ -0,0 +1,203 @@
+"""
+Functions for the subresultant chain of two polynomials, read off a single
+fraction-free elimination of the Sylvester's matrix.
+
+For p of degree m and q of degree n the j-th subresultant is built from the
+first n - j rows of p and the first m - j rows of q of `sylvester_matrix`; its
+principal coefficient is the minor of the first m + n - 2j columns. The rows
+are reordered so that these blocks are leading blocks, and Bareiss'
+elimination computes every leading minor on the way to the resultant.
+
+Literature: https://doi.org/10.1145/321607.321609.
+"""
+import sympy as sym
+
+from fraction_free import bareiss_determinant, exact_quotient, permutation_sign
+from profiling import profiled, stage
+from sylvesters import get_coefficient_ring, get_sylvester_rows
+
+
+def get_chain_order(m, n):
+    """
+    Returns
+    -------
+    order: list
+        The rows of the Sylvester's matrix (p rows 0, ..., n - 1 then q rows
+        n, ..., n + m - 1) in elimination order: the |m - n| extra rows of
+        the polynomial of lower degree first, then a row of p and a row of q
+        for each subresultant.
+    blocks: dict
+        Maps the size m + n - 2j of each leading block to j.
+    """
+    if m >= n:
+        prefix = [n + k for k in range(m - n)]
+        pairs = [(k, m + k) for k in range(n)]
+    else:
+        prefix = [k for k in range(n - m)]
+        pairs = [(n - m + k, n + k) for k in range(m)]
+
+    order = prefix + [row for pair in pairs for row in pair]
+    blocks = {len(prefix) + 2 * (t + 1): min(m, n) - t - 1 for t in range(len(pairs))}
+
+    return order, blocks
+
+
+def get_block_minor(sylvester_rows, block, columns):
+    """
+    Returns
+    -------
+    minor: ring element
+        The determinant of the given rows (in increasing order) and columns of
+        the Sylvester's matrix.
+    """
+    return bareiss_determinant([[sylvester_rows[i][c] for c in columns] for i in sorted(block)])
+
+
+def get_subresultant_minors(p_coefficients, q_coefficients, smallest=0):
+    """
+    Returns
+    -------
+    minors: dict
+        Maps each j from min(m, n) - 1 down to smallest to the coefficients,
+        highest power first, of the j-th subresultant. They are the minors of
+        the first s - 1 columns and one of the columns s - 1, ..., s - 1 + j,
+        for s = m + n - 2j. A vanishing principal minor stops the elimination;
+        the remaining subresultants are then computed one minor at a time.
+    """
+    m, n = len(p_coefficients) - 1, len(q_coefficients) - 1
+    zero = p_coefficients[0] * 0
+    sylvester_rows = get_sylvester_rows(p_coefficients, q_coefficients, zero)
+
+    order, blocks = get_chain_order(m, n)
+    size = m + n - 2 * smallest
+    width = m + n - smallest
+
+    rows = [list(sylvester_rows[i][:width]) for i in order[:size]]
+    minors = {}
+    sign = 1
+    previous = None
+
+    for k in range(size):
+        if k + 1 in blocks:
+            j = blocks[k + 1]
+            block_sign = sign * permutation_sign(order[:k + 1])
+            minors[j] = [rows[k][c] if block_sign == 1 else -rows[k][c]
+                         for c in range(k, k + j + 1)]
+
+        if k == size - 1:
+            break
+
+        if not rows[k][k]:
+            if k + 1 in blocks or not rows[k + 1][k]:
+                if k + 2 in blocks:
+                    minors[blocks[k + 2]] = [zero] * (blocks[k + 2] + 1)
+                break
+            rows[k], rows[k + 1] = rows[k + 1], rows[k]
+            sign = -sign
+
+        pivot = rows[k][k]
+        for i in range(k + 1, size):
+            for c in range(k + 1, width):
+                entry = pivot * rows[i][c] - rows[i][k] * rows[k][c]
+                rows[i][c] = entry if previous is None else exact_quotient(entry, previous)
+        previous = pivot
+
+    for s, j in blocks.items():
+        if j >= smallest and j not in minors:
+            minors[j] = [get_block_minor(sylvester_rows, order[:s], list(range(s - 1)) + [c])
+                         for c in range(s - 1, s + j)]
+
+    return minors
+
+
+def get_ring_coefficients(p, q, x):
+    """
+    Returns
+    -------
+    gens: tuple
+        The coefficient ring of `get_coefficient_ring`.
+    p_coefficients: list
+        The coefficients of p, highest power first, as sympy polynomials in
+        gens.
+    q_coefficients: list
+        The coefficients of q.
+    """
+    gens = get_coefficient_ring(p, q, x)
+    p_coefficients = [sym.Poly(c, *gens) for c in sym.Poly(p, x).all_coeffs()]
+    q_coefficients = [sym.Poly(c, *gens) for c in sym.Poly(q, x).all_coeffs()]
+
+    return gens, p_coefficients, q_coefficients
+
+
+@profiled("subresultants.chain")
+def subresultant_chain(p, q, x):
+    """
+    A function that takes two non zero polynomials of degree m and n and
+    returns their subresultants S_0, ..., S_{min(m, n) - 1} with respect to x,
+    as sympy polynomials in x. S_0 is the resultant.
+
+    Parameters
+    ----------
+    p: sympy expression
+        A non zero polynomial of degree m.
+    q: sympy expression
+        A non zero polynomial of degree n.
+    x: sympy symbol
+        Variable for which we are solving.
+    """
+    gens, p_coefficients, q_coefficients = get_ring_coefficients(p, q, x)
+
+    with stage("subresultants.elimination", size=len(p_coefficients) + len(q_coefficients) - 2):
+        minors = get_subresultant_minors(p_coefficients, q_coefficients)
+
+    return [sym.Poly(sum(c.as_expr() * x ** (j - i) for i, c in enumerate(minors[j])), x)
+            for j in range(len(minors))]
+
+
+@profiled("subresultants.principal_coefficients")
+def principal_subresultant_coefficients(p, q, x):
+    """
+    A function that takes two non zero polynomials of degree m and n and
+    returns the principal coefficients of the subresultants S_0, ...,
+    S_{min(m, n) - 1}, as sympy polynomials in the parameters. The first is
+    the resultant; the smallest j with a non zero coefficient is the degree of
+    the gcd of p and q.
+
+    Parameters
+    ----------
+    p: sympy expression
+        A non zero polynomial of degree m.
+    q: sympy expression
+        A non zero polynomial of degree n.
+    x: sympy symbol
+        Variable for which we are solving.
+    """
+    gens, p_coefficients, q_coefficients = get_ring_coefficients(p, q, x)
+    minors = get_subresultant_minors(p_coefficients, q_coefficients)
+
+    return [minors[j][0] for j in range(len(minors))]
+
+
+@profiled("subresultants.principal_coefficient")
+def principal_subresultant_coefficient(p, q, x, j):
+    """
+    A function that returns the principal coefficient of the j-th
+    subresultant of p and q, as a sympy polynomial in the parameters. The
+    elimination stops at the block of size m + n - 2j.
+
+    Parameters
+    ----------
+    p: sympy expression
+        A non zero polynomial of degree m.
+    q: sympy expression
+        A non zero polynomial of degree n.
+    x: sympy symbol
+        Variable for which we are solving.
+    j: int
+        An integer with 0 <= j < min(m, n).
+    """
+    gens, p_coefficients, q_coefficients = get_ring_coefficients(p, q, x)
+    if not 0 <= j < min(len(p_coefficients), len(q_coefficients)) - 1:
+        raise ValueError('No subresultant of index {}.'.format(j))
+
+    return get_subresultant_minors(p_coefficients, q_coefficients, smallest=j)[j][0]
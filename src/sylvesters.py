@@ -1,9 +1,17 @@
 """
-Function for constructing the Sylvester's matrix.
+Functions for constructing the Sylvester's matrix and calculating the
+Sylvester's resultant.
 Literature: http://comet.lehman.cuny.edu/vpan/pdf/DEKPalg.pdf
 """
 import sympy as sym
 
+from canonical import get_symbols
+from core import get_euclidean_resultant, get_sylvester_rows
+from fraction_free import bareiss_determinant
+from modular import modular_determinant
+from profiling import profiled, stage
+
+@profiled("sylvester.matrix")
 def sylvester_matrix(p, q, x):
     """
     A function that takes two non zero polynomials, of degree m and n respectively
@@ -21,23 +29,69 @@ def sylvester_matrix(p, q, x):
     p_polynomial = sym.Poly(p, x)
     q_polynomial = sym.Poly(q, x)
 
-    m_degree, n_degree = p_polynomial.degree(), q_polynomial.degree()
+    matrix = get_sylvester_rows(p_polynomial.all_coeffs(),
+                                q_polynomial.all_coeffs())
+
+    return sym.Matrix(matrix)
 
-    p_coefficients = p_polynomial.all_coeffs()
-    q_coefficients = q_polynomial.all_coeffs()
 
-    matrix_size = m_degree + n_degree
+def get_coefficient_ring(p, q, x):
+    """
+    Returns
+    -------
+    gens: tuple
+        The parameters of p and q, that is every symbol or indexed symbol
+        except x, sorted by name. If there are none, x itself is used so that constants can
+        still be represented as sympy polynomials.
+    """
+    parameters = (get_symbols(p) | get_symbols(q)) - {x}
+    gens = tuple(sorted(parameters, key=sym.default_sort_key))
 
-    matrix = []
-    for row in [p_coefficients, q_coefficients]:
-        matrix.append(row)
-        while len(row) < matrix_size:
-            row = [0] + row
-            matrix.append(row)
+    return gens or (x,)
 
-    for row in matrix:
-        while len(row) < matrix_size:
-            row.append(0)
 
-    return sym.Matrix(matrix)
+@profiled("sylvester.resultant")
+def sylvester_resultant(p, q, x, method="bareiss"):
+    """
+    A function that takes two non zero polynomials and returns their resultant
+    with respect to x, as a sympy polynomial in the remaining parameters.
+
+    Parameters
+    ----------
+    p: sympy expression
+        A non zero polynomial of degree m.
+    q: sympy expression
+        A non zero polynomial of degree n.
+    x: sympy symbol
+        Variable for which we are solving.
+    method: str
+        "bareiss" runs a fraction-free elimination directly on the coefficient
+        lists over the polynomial ring of the parameters. "det" calls the
+        determinant of `sylvester_matrix`. "modular" reduces the matrix of
+        integer coefficient polynomials modulo word-size primes. "euclidean"
+        runs the subresultant remainder sequence on the coefficient lists, in
+        O(m * n) ring operations instead of O((m + n) ** 3).
+    """
+    gens = get_coefficient_ring(p, q, x)
+
+    if method == "det":
+        return sym.Poly(sylvester_matrix(p, q, x).det(), *gens)
+
+    if method == "modular":
+        return sym.Poly(modular_determinant(sylvester_matrix(p, q, x)), *gens)
+
+    if method not in ("bareiss", "euclidean"):
+        raise ValueError("Unknown method: {}".format(method))
+
+    p_coefficients = [sym.Poly(c, *gens) for c in sym.Poly(p, x).all_coeffs()]
+    q_coefficients = [sym.Poly(c, *gens) for c in sym.Poly(q, x).all_coeffs()]
+
+    if method == "euclidean":
+        with stage("sylvester.euclidean", size=len(p_coefficients) + len(q_coefficients) - 2):
+            return get_euclidean_resultant(p_coefficients, q_coefficients)
+
+    zero = sym.Poly(0, *gens)
+    rows = get_sylvester_rows(p_coefficients, q_coefficients, zero)
 
+    with stage("sylvester.determinant", size=len(rows)):
+        return bareiss_determinant(rows) if rows else sym.Poly(1, *gens)
@@ -0,0 +1,85 @@
+"""
+A file to test the batched evaluation of resultant matrices.
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import unittest
+import numpy as np
+import sympy as sym
+
+from batch import (CompiledMatrix, batched_condition, batched_rank,
+                   batched_slogdet, compile_matrix)
+from cayley_bezout import cayley_bezout_matrix
+from dixon import DixonResultant
+from sylvesters import sylvester_matrix
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_compile_matrix_sylvester(self):
+        """Test a two parameter Sylvester's matrix against substitution."""
+        x, s, t = sym.symbols("x, s, t")
+        matrix = sylvester_matrix(s * x ** 2 + t, x - s * t, x)
+
+        compiled = compile_matrix(matrix)
+        self.assertIsInstance(compiled, CompiledMatrix)
+        self.assertEqual(compiled.parameters, [s, t])
+
+        points = np.array([[1.0, 2.0], [0.5, -3.0], [2.0, 0.0]])
+        stack = compiled(points)
+        self.assertEqual(stack.shape, (3, 3, 3))
+
+        for point, values in zip(points, stack):
+            expected = np.array(matrix.subs({s: point[0], t: point[1]}), dtype=float)
+            np.testing.assert_allclose(values, expected)
+
+        sign, logdet = batched_slogdet(stack)
+        determinants = [float(matrix.det().subs({s: a, t: b})) for a, b in points]
+        np.testing.assert_allclose(sign * np.exp(logdet), determinants, atol=1e-12)
+
+        conditions = batched_condition(stack)
+        self.assertLess(conditions[0], 1e3)
+        self.assertGreater(conditions[2], 1e10)
+
+    def test_compile_matrix_indexed(self):
+        """Test that the parameters of an indexed Sylvester's matrix omit the bases."""
+        x = sym.symbols("x")
+        a, b = sym.IndexedBase("a"), sym.IndexedBase("b")
+        matrix = sylvester_matrix(a[1] * x + a[0], b[1] * x + b[0], x)
+
+        compiled = compile_matrix(matrix)
+        self.assertEqual(compiled.parameters, [a[0], a[1], b[0], b[1]])
+
+        stack = compiled(np.array([[1.0, 2.0, 3.0, 4.0]]))
+        np.testing.assert_allclose(stack[0], [[2.0, 1.0], [4.0, 3.0]])
+
+    def test_compile_matrix_single_parameter(self):
+        """Test a Dixon matrix and the rank and condition estimates."""
+        x, y, z = sym.symbols("x, y, z")
+
+        f = sym.lambdify((y, z), x ** 2 + y ** 2 - 1 + z * 0)
+        g = sym.lambdify((y, z), x ** 2 + z ** 2 - 1 + y * 0)
+        h = sym.lambdify((y, z), y ** 2 + z ** 2 - 1)
+
+        dixon = DixonResultant([f, g, h], [y, z])
+        matrix = dixon.get_dixon_matrix(dixon.get_dixon_polynomial())
+
+        compiled = compile_matrix(matrix)
+        stack = compiled([0.0, np.sqrt(0.5), 2.0])
+        self.assertEqual(stack.shape, (3,) + matrix.shape)
+
+        ranks = batched_rank(stack, tol=1e-8)
+        self.assertEqual(list(ranks), [matrix.rows, 0, matrix.rows])
+
+        conditions = batched_condition(stack)
+        self.assertAlmostEqual(conditions[0], 1.0)
+
+    def test_compile_matrix_complex(self):
+        x, s = sym.symbols("x, s")
+        p = sym.lambdify(x, x ** 2 + sym.I * s)
+        q = sym.lambdify(x, x - s)
+
+        compiled = compile_matrix(cayley_bezout_matrix(p, q, x))
+        self.assertEqual(compiled.dtype, np.dtype(complex))
+        self.assertEqual(compiled(1.0).shape, (1, 2, 2))
@@ -0,0 +1,78 @@
+"""
+A file to test the cache of constructed matrices.
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import os
+import tempfile
+import unittest
+import sympy as sym
+
+from cache import MatrixCache, get_system_key
+
+x, y, z = sym.symbols("x, y, z")
+
+
+class TestMatrixCache(unittest.TestCase):
+
+    def test_get_system_key(self):
+        """Test that the key only depends on the expanded system and method."""
+        polynomials = [(x + y) ** 2, x - y]
+        key = get_system_key(polynomials, [x, y], "dixon")
+
+        self.assertEqual(key, get_system_key([x ** 2 + 2 * x * y + y ** 2, x - y], [x, y], "dixon"))
+        self.assertEqual(key, get_system_key([sym.lambdify((x, y), p) for p in polynomials],
+                                             [x, y], "dixon"))
+        self.assertNotEqual(key, get_system_key(polynomials, [y, x], "dixon"))
+        self.assertNotEqual(key, get_system_key(polynomials, [x, y], "macaulay"))
+
+    def test_memory_tier(self):
+        """Test hits, misses and LRU eviction of the memory tier."""
+        cache = MatrixCache(max_entries=2)
+        builds = []
+
+        def build(value):
+            builds.append(value)
+            return value
+
+        for k in [1, 2, 1, 3, 2]:
+            cache.get_or_build([x - k], [x], "test", lambda: build(k))
+
+        self.assertEqual(builds, [1, 2, 3, 2])
+        self.assertEqual(cache.stats, {"memory_hits": 1, "disk_hits": 0, "misses": 4})
+        self.assertEqual(len(cache.memory), 2)
+
+        cache.clear()
+        self.assertEqual(cache.stats["misses"], 0)
+        self.assertEqual(len(cache.memory), 0)
+
+    def test_disk_tier(self):
+        """Test that a new cache on the same directory finds the matrices."""
+        polynomials = [x + y, x ** 2 + y ** 3, x ** 2 + y]
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = MatrixCache(directory=directory, max_disk_entries=2)
+            matrix = cache.get_dixon_matrix(polynomials, [x, y])
+            self.assertEqual(cache.stats["misses"], 1)
+
+            restarted = MatrixCache(directory=directory)
+            self.assertEqual(restarted.get_dixon_matrix(polynomials, [x, y]), matrix)
+            self.assertEqual(restarted.stats, {"memory_hits": 0, "disk_hits": 1, "misses": 0})
+
+            self.assertEqual(restarted.get_dixon_matrix(polynomials, [x, y]), matrix)
+            self.assertEqual(restarted.stats["memory_hits"], 1)
+
+            for k in range(3):
+                cache.get_or_build([x - k], [x], "test", lambda: k)
+            self.assertEqual(len(os.listdir(directory)), 2)
+
+    def test_get_macaulay_matrices(self):
+        polynomials = [2 * x ** 2 + 3 * x * y - 5 * z ** 2, 7 * x ** 2 - 11 * y ** 2 + 13 * y * z,
+                       x + 17 * y - 19 * z]
+        cache = MatrixCache()
+
+        matrix, submatrix = cache.get_macaulay_matrices(polynomials, [x, y, z])
+        self.assertEqual(matrix.shape, (10, 10))
+        self.assertEqual(cache.get_macaulay_matrices(polynomials, [x, y, z]), (matrix, submatrix))
+        self.assertEqual(cache.stats["memory_hits"], 1)
@@ -0,0 +1,67 @@
+"""
+A file to test the canonical form of polynomial systems.
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import pickle
+import unittest
+import sympy as sym
+
+from canonical import (as_expression, deserialize_polynomial,
+                       deserialize_system, get_symbols, get_terms,
+                       serialize_polynomial, serialize_system)
+
+
+class TestCanonical(unittest.TestCase):
+
+    def test_as_expression(self):
+        x, y, a = sym.symbols("x, y, a")
+        expression = a * x + y
+
+        self.assertEqual(as_expression(expression, [x, y]), expression)
+        self.assertEqual(as_expression(sym.Poly(expression, x, y), [x, y]), expression)
+        self.assertEqual(as_expression(sym.lambdify((x, y), expression), [x, y]), expression)
+        self.assertEqual(as_expression("a*x + y", [x, y]), expression)
+
+    def test_get_symbols(self):
+        """Test that indexed symbols are generators and their bases are not."""
+        x, i = sym.symbols("x, i")
+        a = sym.IndexedBase("a")
+
+        self.assertEqual(get_symbols(a[1] * x ** 2 + a[0]), {x, a[0], a[1]})
+        self.assertEqual(get_symbols(a[i] + sym.Symbol("a")), {a[i], sym.Symbol("a")})
+        self.assertEqual(get_symbols(sym.Matrix([[a[0], 1], [x, 2]])), {x, a[0]})
+
+    def test_get_terms(self):
+        x, y, a = sym.symbols("x, y, a")
+        expression = a * x ** 2 + 3 * y
+
+        terms = {(2, 0): a, (0, 1): 3}
+        self.assertEqual(get_terms(expression, [x, y]), terms)
+        self.assertEqual(get_terms(sym.Poly(expression, x, y), [x, y]), terms)
+        self.assertEqual(get_terms(sym.Poly(expression, y, x), [x, y]), terms)
+        self.assertEqual(get_terms(sym.lambdify((x, y), expression), [x, y]), terms)
+
+    def test_serialize_polynomial(self):
+        x, y, a = sym.symbols("x, y, a")
+
+        terms = serialize_polynomial((x + a * y) ** 2, [x, y])
+        self.assertEqual(terms, serialize_polynomial(x ** 2 + 2 * a * x * y + a ** 2 * y ** 2, [x, y]))
+        self.assertEqual(deserialize_polynomial(terms, [x, y]).expand(), ((x + a * y) ** 2).expand())
+
+    def test_serialize_system(self):
+        """Test that the canonical form is hashable, picklable and round trips."""
+        x, y, b = sym.symbols("x, y, b")
+        polynomials = [x * y + b, 3 * x ** 2 - y]
+
+        system = serialize_system([sym.lambdify((x, y), p) for p in polynomials], [x, y])
+        self.assertEqual(hash(system), hash(serialize_system(polynomials, [x, y])))
+
+        x, y = sym.symbols("x, y", real=True)
+        polynomials = [x * y + b, sym.Rational(1, 3) * x ** 2 - y]
+        system = serialize_system(polynomials, [x, y])
+
+        restored, variables = deserialize_system(pickle.loads(pickle.dumps(system)))
+        self.assertEqual(variables, [x, y])
+        self.assertEqual(restored, polynomials)
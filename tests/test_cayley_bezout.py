@@ -7,7 +7,9 @@ sys.path.insert(0, '../src/')
 import unittest
 import sympy as sym
 
-from cayley_bezout import cayley_bezout_matrix
+from cayley_bezout import (bezout_resultant, cayley_bezout_determinant, cayley_bezout_matrix,
+                           get_bezoutian)
+from sylvesters import sylvester_resultant
 
 
 class TestCayleyBezout(unittest.TestCase):
@@ -49,3 +51,74 @@ class TestCayleyBezout(unittest.TestCase):
         matrix = cayley_bezout_matrix(p, q, x)
 
         self.assertEqual(matrix.det(), 0)
+
+    def test_cayley_bezout_matrix_methods(self):
+        """Test that both constructions give identical matrices."""
+        x, s, t = sym.symbols("x, s, t")
+
+        examples = [(x ** 2 - 5 * x + 6, x ** 2 - 3 * x + 2),
+                    (x ** 3 + 1, x + 1),
+                    (s * x ** 4 - t * x ** 2 + 3, x ** 3 + s * t * x - 1)]
+
+        for p, q in examples:
+            matrix = cayley_bezout_matrix(p, q, x)
+            self.assertEqual(matrix, cayley_bezout_matrix(sym.Poly(p, x), sym.Poly(q, x), x))
+
+            p, q = sym.lambdify(x, p), sym.lambdify(x, q)
+            self.assertEqual(matrix, cayley_bezout_matrix(p, q, x))
+            self.assertEqual(matrix, cayley_bezout_matrix(p, q, x, method="factor"))
+
+        with self.assertRaises(ValueError):
+            cayley_bezout_matrix(p, q, x, method="unknown")
+
+    def test_cayley_bezout_determinant(self):
+        """Test the symmetric elimination against the dense determinant."""
+        x, s, t = sym.symbols("x, s, t")
+
+        examples = [(x ** 2 - 5 * x + 6, x ** 2 - 3 * x + 2),
+                    (x ** 3 + 1, x + 1),
+                    (s * x ** 4 - t * x ** 2 + 3, x ** 3 + s * t * x - 1),
+                    (x ** 4 + s, x ** 4 - x ** 2 + t),
+                    (x ** 2 + 1, 3)]
+        for p, q in examples:
+            expected = cayley_bezout_matrix(p, q, x).det().expand()
+            for method in ["ldl", "bareiss", "det"]:
+                determinant = cayley_bezout_determinant(p, q, x, method=method)
+                self.assertIsInstance(determinant, sym.Poly)
+                self.assertEqual(determinant.as_expr(), expected)
+
+        with self.assertRaises(ValueError):
+            cayley_bezout_determinant(x + 1, x - 1, x, method="unknown")
+
+    def test_bezout_resultant(self):
+        """Test that the normalised Bezout determinant is the Sylvester resultant."""
+        x, s, t = sym.symbols("x, s, t")
+
+        examples = [(x ** 2 - 5 * x + 6, x ** 2 - 3 * x + 2),
+                    (2 * x ** 3 + 1, 3 * x + 1),
+                    (s * x ** 4 - t * x ** 2 + 3, t * x ** 3 + s * x - 1),
+                    (x ** 2 + 1, 3)]
+        for p, q in examples:
+            for p, q in [(p, q), (q, p)]:
+                self.assertEqual(bezout_resultant(p, q, x), sylvester_resultant(p, q, x))
+
+    def test_get_bezoutian_high_degree(self):
+        """Test the Bezoutian identity for a polynomial of degree 100."""
+        x, a = sym.symbols("x, a")
+        degree = 100
+
+        p_coefficients = [(-1) ** i * (i + 1) for i in range(degree + 1)]
+        q_coefficients = [3 - i % 5 for i in range(degree)] + [0]
+
+        entries = get_bezoutian(p_coefficients, q_coefficients)
+        self.assertEqual(len(entries), degree)
+
+        def as_poly(coefficients, power):
+            return sym.Poly.from_dict({(i * (1 - power), i * power): c
+                                       for i, c in enumerate(coefficients)}, x, a)
+
+        bezoutian = sym.Poly.from_dict({(i, j): entries[i][j] for i in range(degree)
+                                        for j in range(degree)}, x, a)
+        cayley = (as_poly(p_coefficients, 0) * as_poly(q_coefficients, 1)
+                  - as_poly(p_coefficients, 1) * as_poly(q_coefficients, 0))
+        self.assertEqual(bezoutian * sym.Poly(x - a, x, a), cayley)
@@ -0,0 +1,72 @@
+"""
+A file to test the sympy-free core.
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import fractions
+import subprocess
+import unittest
+import sympy as sym
+
+import core
+from cayley_bezout import cayley_bezout_matrix
+from macaulay import MacaulayResultant
+from sylvesters import sylvester_matrix
+
+x, y, z = sym.symbols("x, y, z")
+
+
+class TestCore(unittest.TestCase):
+
+    def test_no_sympy_import(self):
+        """Test that a resultant of an integer system does not import sympy."""
+        code = ("import sys; sys.path.insert(0, '../src/'); import core; "
+                "print(core.sylvester_resultant([1, 0, -2], [1, -3]), "
+                "core.macaulay_resultant([{(1, 0): 2, (0, 1): 1}, {(1, 0): 1, (0, 1): 3}]), "
+                "core.is_sympy_loaded(), 'numpy' in sys.modules)")
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout.split(), ["7", "5", "False", "False"])
+
+    def test_univariate_matrices(self):
+        """Test the Sylvester and Bezout rows against the symbolic matrices."""
+        p, q = [3, 0, -1, 5, 2], [1, -4, 7]
+        expressions = [sym.Poly(p, x).as_expr(), sym.Poly(q, x).as_expr()]
+
+        self.assertEqual(sym.Matrix(core.sylvester_matrix(p, q)), sylvester_matrix(*expressions, x))
+        self.assertEqual(sym.Matrix(core.bezout_matrix(p, q)), cayley_bezout_matrix(*expressions, x))
+        self.assertEqual(core.sylvester_resultant(p, q), sym.resultant(*expressions, x))
+        self.assertEqual(core.sylvester_resultant(p, q, method="euclidean"), core.sylvester_resultant(p, q))
+        self.assertEqual(core.sylvester_matrix({(2,): 1, (0,): -2}, [0, 1, -3]),
+                         [[1, 0, -2], [1, -3, 0], [0, 1, -3]])
+
+        half = fractions.Fraction(1, 2)
+        self.assertEqual(core.sylvester_resultant([half, 1], [1, half]), sym.Rational(-3, 4))
+        self.assertEqual(core.sylvester_resultant([half, 1], [1, half], method="euclidean"),
+                         sym.Rational(-3, 4))
+        self.assertEqual(core.sylvester_resultant([1.5, 1], [1, 0.5]), fractions.Fraction(-1, 4))
+        with self.assertRaises(ValueError):
+            core.sylvester_matrix([0, 0], [1, 2])
+
+    def test_macaulay(self):
+        """Test the Macaulay's rows and resultant against MacaulayResultant."""
+        system = [3 * x ** 2 + y * z - 2 * z ** 2, x ** 2 + 5 * y ** 2 + x * z, x + 2 * y - 7 * z]
+        terms = [core.get_terms(p, [x, y, z]) for p in system]
+        self.assertTrue(all(isinstance(c, int) for t in terms for c in t.values()))
+
+        mac = MacaulayResultant(system, [x, y, z])
+        self.assertEqual(sym.Matrix(core.macaulay_matrix(terms)), mac.matrix)
+        self.assertEqual(core.macaulay_resultant(terms), mac.get_resultant())
+        self.assertEqual(core.macaulay_resultant([{(2, 0, 0): 1}, {(0, 3, 0): 1}, {(0, 0, 1): 1}]), 1)
+
+        structure = core.get_macaulay_structure(terms)
+        self.assertEqual(structure["degree_m"], 3)
+        self.assertEqual(structure["extraneous"], mac.get_extraneous_indices())
+
+    def test_conversions(self):
+        self.assertEqual(core.to_number(sym.Rational(6, 3)), 2)
+        self.assertEqual(core.to_number(sym.Rational(1, 3)), fractions.Fraction(1, 3))
+        self.assertEqual(core.to_number(sym.Symbol("a")), sym.Symbol("a"))
+        self.assertEqual(core.to_sympy_matrix([[fractions.Fraction(1, 2), 3]]),
+                         sym.Matrix([[sym.Rational(1, 2), 3]]))
+        self.assertEqual(core.to_array([[fractions.Fraction(1, 2), 3]]).tolist(), [[0.5, 3.0]])
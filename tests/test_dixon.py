@@ -61,7 +61,7 @@ class TestDixonResultant(unittest.TestCase):
         - x * y * a[1] ** 2 - x * a[0] * a[1] ** 2 + x * a[0] - y ** 2 * a[0] * a[1] \
         + y ** 2 * a[1] - y * a[0] * a[1] ** 2 + y * a[1] ** 2
 
-        self.assertEqual(dixon.get_dixon_polynomial().factor(), polynomial)
+        self.assertEqual(dixon.get_dixon_polynomial().as_expr().expand(), polynomial)
 
     def test_get_coefficients_of_alpha_numerical(self):
         """Test Dixon's coefficients of a_1,...,a_n products for a numerical example."""
@@ -102,7 +102,7 @@ class TestDixonResultant(unittest.TestCase):
         matrix = example_two.get_dixon_matrix(poly)
 
         expr = 1 - 8 * x ** 2 + 24 * x ** 4 - 32 * x ** 6 + 16 * x ** 8
-        self.assertEqual(matrix.det(), expr)
+        self.assertEqual(matrix.det().expand(), expr)
 
     def test_get_dixon_matrix(self):
         """Test Dixon's resultant for a numerical example."""
@@ -117,4 +117,119 @@ class TestDixonResultant(unittest.TestCase):
         dixon = DixonResultant([p, q, h], [x, y])
         polynomial = dixon.get_dixon_polynomial()
 
-        self.assertEqual(dixon.get_dixon_matrix(polynomial).det(), 0)
\ No newline at end of file
+        self.assertEqual(dixon.get_dixon_matrix(polynomial).det(), 0)
+
+    def test_get_parameters(self):
+        """Test that the parameters are the coefficient symbols, sorted by name."""
+        self.assertEqual(dixon.get_parameters(), [c, d])
+
+    def test_get_interpolated_determinant(self):
+        """Test the interpolated determinant against the symbolic one."""
+        z = sym.symbols('z')
+
+        f = sym.lambdify((y, z), x ** 2 + y ** 2 - 1 + z * 0)
+        g = sym.lambdify((y, z), x ** 2 + z ** 2 - 1 + y * 0)
+        h = sym.lambdify((y, z), y ** 2 + z ** 2 - 1)
+
+        example_two = DixonResultant([f, g, h], [y, z])
+        matrix = example_two.get_dixon_matrix(example_two.get_dixon_polynomial())
+
+        determinant = example_two.get_interpolated_determinant(matrix)
+        self.assertIsInstance(determinant, sym.Poly)
+        self.assertEqual(determinant.as_expr(), matrix.det().expand())
+
+    def test_get_dixon_polynomial_methods(self):
+        """Test that both methods give the same Dixon's polynomial."""
+        x, y = sym.symbols('x, y')
+
+        polynomials = [sym.lambdify((x, y), f) for f in
+                       [x * y + c, x ** 2 - d * y, x + y ** 2]]
+        system = DixonResultant(polynomials, [x, y])
+
+        polynomial = system.get_dixon_polynomial()
+        self.assertIsInstance(polynomial, sym.Poly)
+        self.assertEqual(polynomial.gens, tuple(system.dummy_variables))
+        self.assertEqual(polynomial, system.get_dixon_polynomial(method="factor"))
+
+        with self.assertRaises(ValueError):
+            system.get_dixon_polynomial(method="unknown")
+
+    def test_get_dixon_matrix_support(self):
+        """Test that the columns are exactly the monomials of the coefficients."""
+        x, y = sym.symbols('x, y')
+
+        p = sym.lambdify((x, y), x + y)
+        q = sym.lambdify((x, y), x ** 2 + y ** 3)
+        h = sym.lambdify((x, y), x ** 2 + y)
+
+        dixon = DixonResultant([p, q, h], [x, y])
+        matrix = dixon.get_dixon_matrix(dixon.get_dixon_polynomial())
+
+        self.assertEqual(matrix.shape, (5, 5))
+        self.assertTrue(all(any(matrix[:, j]) for j in range(matrix.cols)))
+        self.assertEqual(matrix[:, 0], sym.Matrix([-1, 0, 0, 1, 0]))
+
+    def test_polynomial_inputs(self):
+        """Test that Poly objects, expressions and callables give the same matrix."""
+        x, y = sym.symbols('x, y')
+        system = [x * y + c, x ** 2 - d * y, x + y ** 2]
+
+        matrices = []
+        for polynomials in [system, [sym.Poly(f, x, y) for f in system],
+                            [sym.lambdify((x, y), f) for f in system]]:
+            dixon = DixonResultant(polynomials, [x, y])
+            self.assertEqual(dixon.terms[0], {(1, 1): 1, (0, 0): c})
+            matrices.append(dixon.get_dixon_matrix(dixon.get_dixon_polynomial()))
+
+        self.assertEqual(matrices[0], matrices[1])
+        self.assertEqual(matrices[0], matrices[2])
+
+    def test_lazy_stages(self):
+        """Test that stages are computed on access, cached and invalidated."""
+        x, y = sym.symbols('x, y')
+        system = [x * y + c, x ** 2 - d * y, x + y ** 2]
+        dixon = DixonResultant(system, [x, y])
+
+        self.assertEqual(dixon.upper_degree, 4)
+        self.assertEqual(dixon.size_bounds, (8, 8))
+        self.assertNotIn("dixon_polynomial", vars(dixon))
+        self.assertNotIn("dixon_matrix", vars(dixon))
+
+        matrix = dixon.dixon_matrix
+        self.assertIs(dixon.dixon_matrix, matrix)
+        self.assertLessEqual(matrix.rows, dixon.size_bounds[0])
+        self.assertLessEqual(matrix.cols, dixon.size_bounds[1])
+        self.assertEqual(dixon.resultant.as_expr(), matrix.det().expand())
+
+        dixon.polynomials = [x + c, y - d, x * y - 1]
+        dixon.invalidate()
+        self.assertEqual(dixon.max_degrees, [1, 1])
+        self.assertNotIn("dixon_matrix", vars(dixon))
+
+    def test_get_maximal_minor(self):
+        matrix = sym.Matrix([[c, 2 * c, 1], [d, 2 * d, 0]])
+        self.assertEqual(dixon.get_maximal_minor(matrix, seed=0), ([0, 1], [0, 2]))
+
+        x, y = sym.symbols('x, y')
+        singular = DixonResultant([x + y, x ** 2 + y ** 3, x ** 2 + y], [x, y])
+        rows, columns = singular.get_maximal_minor()
+        self.assertEqual(len(rows), singular.dixon_matrix.rank())
+        self.assertEqual(len(rows), 4)
+
+    def test_get_dixon_resultant(self):
+        """Test the projection operator on square and singular Dixon matrices."""
+        x, y = sym.symbols('x, y')
+        a, b, e = sym.symbols('a, b, e')
+
+        system = DixonResultant([x + y - a, x * y - b, x ** 2 + y ** 2 - e], [x, y])
+        resultant = system.get_dixon_resultant()
+        self.assertEqual(resultant.as_expr(), system.dixon_matrix.det().expand())
+        self.assertEqual(sym.rem(resultant.as_expr(), a ** 2 - 2 * b - e, a), 0)
+        self.assertEqual(system.get_dixon_resultant(method="interpolation").as_expr(), resultant.as_expr())
+
+        singular = DixonResultant([x + y, x ** 2 + y ** 3, x ** 2 + y], [x, y])
+        self.assertEqual(singular.dixon_matrix.det(), 0)
+        self.assertNotEqual(singular.get_dixon_resultant(), 0)
+
+        with self.assertRaises(ValueError):
+            system.get_dixon_resultant(method="unknown")
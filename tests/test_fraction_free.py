@@ -0,0 +1,121 @@
+"""
+A file to test the fraction-free elimination.
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import unittest
+import sympy as sym
+
+from fraction_free import (bareiss_determinant, exact_quotient, permutation_sign,
+                           poly_rows, sparse_bareiss_determinant, sparse_bareiss_minors,
+                           sparse_determinant, sparse_poly_rows, symmetric_bareiss_determinant)
+
+
+class TestFractionFree(unittest.TestCase):
+
+    def test_exact_quotient(self):
+        """Test exact division in the supported rings."""
+        x = sym.symbols("x")
+
+        self.assertEqual(exact_quotient(12, 4), 3)
+        self.assertEqual(exact_quotient(sym.Rational(1, 2), 2), sym.Rational(1, 4))
+        self.assertEqual(exact_quotient(sym.Poly(x ** 2 - 1, x), sym.Poly(x - 1, x)),
+                         sym.Poly(x + 1, x))
+
+    def test_bareiss_determinant_integers(self):
+        """Test the determinant of integer matrices, including zero pivots."""
+        matrix = sym.Matrix([[0, 2, 1], [3, 1, 4], [5, 9, 2]])
+        self.assertEqual(bareiss_determinant(matrix.tolist()), matrix.det())
+
+        matrix = sym.Matrix([[1, 2], [2, 4]])
+        self.assertEqual(bareiss_determinant(matrix.tolist()), 0)
+        self.assertEqual(bareiss_determinant([]), 1)
+
+    def test_bareiss_determinant_polynomials(self):
+        """Test the determinant of a matrix over a polynomial ring."""
+        a, b = sym.symbols("a, b")
+        matrix = sym.Matrix([[a, 1, b], [b, a, 0], [1, b, a]])
+
+        gens, rows = poly_rows(matrix)
+        self.assertEqual(gens, (a, b))
+
+        determinant = bareiss_determinant(rows)
+        self.assertIsInstance(determinant, sym.Poly)
+        self.assertEqual(determinant.as_expr(), matrix.det().expand())
+
+    def test_symmetric_bareiss_determinant(self):
+        """Test symmetric matrices from their upper triangle, with zero pivots."""
+        a, b = sym.symbols("a, b")
+        for matrix in [sym.Matrix([[2, 1, 3], [1, 0, 4], [3, 4, 5]]),
+                       sym.Matrix([[0, 1, 3], [1, 2, 4], [3, 4, 0]]),
+                       sym.Matrix([[0, 1, 2], [1, 0, 3], [2, 3, 0]]),
+                       sym.Matrix([[1, 2, 3], [2, 4, 6], [3, 6, 9]]),
+                       sym.Matrix([[a, b, 1], [b, 0, a], [1, a, b]])]:
+            gens, rows = poly_rows(matrix)
+            upper = [row[i:] for i, row in enumerate(rows)]
+            determinant = symmetric_bareiss_determinant(upper)
+            self.assertEqual(sym.sympify(determinant.as_expr() if gens else determinant),
+                             matrix.det().expand())
+
+        self.assertEqual(symmetric_bareiss_determinant([]), 1)
+        self.assertEqual(symmetric_bareiss_determinant([[0, 0], [0]]), 0)
+
+    def test_sparse_poly_rows(self):
+        a = sym.symbols("a")
+        matrix = sym.SparseMatrix([[a, 0], [0, 2]])
+
+        gens, rows = sparse_poly_rows(matrix)
+        self.assertEqual(gens, (a,))
+        self.assertEqual(rows, [{0: sym.Poly(a, a)}, {1: sym.Poly(2, a)}])
+
+    def test_sparse_determinant(self):
+        """Test the sparse elimination against the dense determinant."""
+        a, b = sym.symbols("a, b")
+        matrices = [sym.SparseMatrix([[0, 2, 1], [3, 0, 4], [5, 9, 0]]),
+                    sym.SparseMatrix([[a, 0, 0, b], [0, 1, a, 0], [b, 0, a, 0], [0, b, 0, 1]]),
+                    sym.SparseMatrix([[0, a], [b, 0]]),
+                    sym.SparseMatrix([[a, b], [a, b]])]
+
+        for matrix in matrices:
+            determinant = sparse_determinant(matrix)
+            self.assertEqual(sym.sympify(determinant.as_expr() if isinstance(determinant, sym.Poly)
+                                         else determinant), matrix.det().expand())
+
+        self.assertEqual(sparse_bareiss_determinant([], 0), 1)
+        with self.assertRaises(ValueError):
+            sparse_determinant(sym.SparseMatrix([[1, 2]]))
+
+    def test_sparse_bareiss_minors(self):
+        """Test the leading minors of one elimination against their determinants."""
+        a, b = sym.symbols("a, b")
+        matrix = sym.SparseMatrix([[0, a, 1, 0], [b, 0, 0, 1], [1, 2, a, b], [a, 0, 1, 3]])
+        gens, rows = sparse_poly_rows(matrix)
+
+        minors = sparse_bareiss_minors(rows, [0, 2, 4])
+        self.assertEqual(minors[0], 1)
+        self.assertEqual(minors[1].as_expr(), matrix[:2, :2].det())
+        self.assertEqual(minors[2].as_expr(), matrix.det().expand())
+
+    def test_sparse_bareiss_minors_vanishing(self):
+        """Test that a vanishing leading minor does not stop the elimination."""
+        a, b = sym.symbols("a, b")
+        self.assertEqual(sparse_bareiss_minors([{1: -1}, {0: -2, 1: -1}], [1, 2]), [0, -2])
+
+        matrix = sym.SparseMatrix([[a, b, 1], [a, b, 0], [1, 0, 0]])
+        gens, rows = sparse_poly_rows(matrix)
+        minors = sparse_bareiss_minors(rows, [1, 2, 3])
+        self.assertEqual(minors[1], 0)
+        self.assertEqual([minors[0].as_expr(), minors[2].as_expr()], [a, -b])
+
+        singular = sym.SparseMatrix([[a, b, 1], [a, b, 1], [1, 0, 0]])
+        gens, rows = sparse_poly_rows(singular)
+        self.assertEqual(sparse_bareiss_minors(rows, [2, 3]), [0, 0])
+
+    def test_permutation_sign(self):
+        self.assertEqual(permutation_sign([]), 1)
+        self.assertEqual(permutation_sign([1, 0, 2]), -1)
+        self.assertEqual(permutation_sign([1, 2, 0]), 1)
+        self.assertEqual(permutation_sign([3, 2, 1, 0]), 1)
+        self.assertEqual(permutation_sign([5, 2, 9]), -1)
+        self.assertEqual(permutation_sign([7, 0, 4]), 1)
@@ -0,0 +1,73 @@
+"""
+A file to test the evaluation and interpolation of determinants.
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import unittest
+import sympy as sym
+
+from interpolation import (evaluate_determinant, get_degree_bounds,
+                           get_evaluation_points, get_evaluation_terms,
+                           get_parameters, interpolate_determinant,
+                           interpolate_values, newton_interpolation)
+
+
+class TestInterpolation(unittest.TestCase):
+
+    def test_get_degree_bounds(self):
+        a, b = sym.symbols("a, b")
+        matrix = sym.Matrix([[a ** 2, b], [1, a * b]])
+
+        self.assertEqual(get_parameters(matrix), (a, b))
+        self.assertEqual(get_degree_bounds(matrix, (a, b)), [3, 1])
+
+    def test_get_evaluation_points(self):
+        self.assertEqual(list(get_evaluation_points([1, 2])),
+                         [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)])
+
+    def test_evaluate_determinant(self):
+        """Test the modular evaluations against the substituted determinants."""
+        a, b = sym.symbols("a, b")
+        matrix = sym.Matrix([[a * (b + 3), sym.Rational(1, 2), b ** 2],
+                             [-7 * b, a - sym.Rational(2, 3), 0],
+                             [10 ** 12, b, a ** 2 * b]])
+        degree_bounds = get_degree_bounds(matrix, (a, b))
+
+        terms, denominator = get_evaluation_terms(matrix, (a, b), degree_bounds)
+        self.assertEqual(denominator, 6)
+        for point in get_evaluation_points(degree_bounds):
+            self.assertEqual(evaluate_determinant(terms, matrix.shape, denominator, point),
+                             matrix.subs({a: point[0], b: point[1]}).det())
+
+    def test_newton_interpolation(self):
+        t = sym.symbols("t")
+        values = [sym.Poly(v, t) for v in [1, 2, 5, 10]]
+
+        polynomial = newton_interpolation(values, t, (t,))
+        self.assertEqual(polynomial.as_expr(), t ** 2 + 1)
+
+    def test_interpolate_values(self):
+        a, b = sym.symbols("a, b")
+        expr = 3 * a ** 2 * b - a + sym.Rational(1, 2)
+        values = {point: expr.subs({a: point[0], b: point[1]})
+                  for point in get_evaluation_points([2, 1])}
+
+        self.assertEqual(interpolate_values(values, (a, b), [2, 1]).as_expr(), expr)
+
+    def test_interpolate_determinant(self):
+        a, b = sym.symbols("a, b")
+        matrix = sym.Matrix([[a, 1, b], [b, a, 0], [1, b, a ** 2]])
+
+        determinant = interpolate_determinant(matrix)
+        self.assertEqual(determinant.as_expr(), matrix.det().expand())
+
+        self.assertEqual(interpolate_determinant(sym.Matrix([[1, 2], [3, 4]])), -2)
+
+        c = sym.IndexedBase("c")
+        matrix = sym.Matrix([[c[0], 1], [c[1], c[0]]])
+        self.assertEqual(get_parameters(matrix), (c[0], c[1]))
+        self.assertEqual(interpolate_determinant(matrix).as_expr(), c[0] ** 2 - c[1])
+
+        with self.assertRaises(ValueError):
+            interpolate_determinant(sym.Matrix([[a, b]]))
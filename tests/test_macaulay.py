@@ -4,10 +4,15 @@ A file to test Macaulay's formulation.
 import sys
 sys.path.insert(0, '../src/')
 
+import tempfile
 import unittest
+import numpy as np
 import sympy as sym
 
+from fraction_free import sparse_determinant
 from macaulay import MacaulayResultant
+from modular import evaluate_mod_prime, rank_profile_mod_prime, sparse_rank_mod_prime
+from storage import iter_sparse_rows, load_sparse_rows
 
 c, d = sym.symbols("a, b")
 x, y = sym.symbols("x, y")
@@ -108,4 +113,201 @@ class TestMacaulayResultant(unittest.TestCase):
         self.assertEqual(mac.get_submatrix(matrix), sym.Matrix([[-a_1, a_0, a_2, 0],
                                                                 [0, -a_1, 0, 0],
                                                                 [0, 0, -a_1, 0],
-                                                                [0, 0, 0, -a_1]]))
\ No newline at end of file
+                                                                [0, 0, 0, -a_1]]))
+
+    def test_get_parameters(self):
+        """Test that the parameters are the coefficient symbols, sorted by name."""
+        self.assertEqual(macaulay.get_parameters(), [c, d])
+
+    def test_get_interpolated_determinant(self):
+        """Test the interpolated determinants against the symbolic ones."""
+        x, y, z = sym.symbols('x, y, z')
+        s, t = sym.symbols('s, t')
+
+        f = sym.lambdify((x, y, z), s * x ** 2 + y * z - 2 * z ** 2)
+        g = sym.lambdify((x, y, z), x ** 2 + t * y ** 2 + x * z)
+        h = sym.lambdify((x, y, z), x + s * y - t * z)
+
+        mac = MacaulayResultant([f, g, h], [x, y, z])
+        mac.get_monomials_set()
+        matrix = mac.get_matrix()
+        submatrix = mac.get_submatrix(matrix)
+
+        for m in [matrix, submatrix]:
+            determinant = mac.get_interpolated_determinant(m)
+            self.assertEqual(determinant.as_expr(), m.det().expand())
+
+    def test_get_exponents_of_certain_degree(self):
+        x, y, z = sym.symbols('x, y, z')
+        f = sym.lambdify((x, y, z), x + y + z)
+        mac = MacaulayResultant([f, f, f], [x, y, z])
+
+        self.assertEqual(mac.get_exponents_of_certain_degree(2),
+                         [(2, 0, 0), (1, 1, 0), (1, 0, 1), (0, 2, 0), (0, 1, 1), (0, 0, 2)])
+        self.assertEqual(mac.get_exponents_of_certain_degree(-1), [])
+        self.assertEqual(mac.get_monomials_of_certain_degree(0), [1])
+        self.assertEqual(mac.get_monomial((1, 0, 2)), x * z ** 2)
+
+    def test_row_exponents_five_variables(self):
+        """Test that the rows index the set T exactly once for n = 5."""
+        variables = sym.symbols('x_0:5')
+        polynomials = [sym.lambdify(variables, sum(v ** 4 for v in variables) + i * variables[i] ** 2)
+                       for i in range(5)]
+        mac = MacaulayResultant(polynomials, list(variables))
+        mac.get_monomials_set()
+
+        self.assertEqual(mac.degree_m, 16)
+        self.assertEqual(len(mac.monomial_exponents), mac.monomials_size)
+
+        row_exponents = mac.get_row_exponents()
+        rows = set()
+        for i, row in enumerate(row_exponents):
+            for exponents in row:
+                product = list(exponents)
+                product[i] += mac.degrees[i]
+                rows.add(tuple(product))
+        self.assertEqual(rows, set(mac.monomial_exponents))
+
+        reduced, non_reduced = mac.get_reduced_nonreduced()
+        self.assertEqual(len(reduced) + len(non_reduced), mac.monomials_size)
+
+    def test_get_matrix_sparse(self):
+        """Test the sparse Macaulay's matrix and its determinant."""
+        x, y, z = sym.symbols('x, y, z')
+        s, t = sym.symbols('s, t')
+
+        f = sym.lambdify((x, y, z), s * x ** 2 + y * z - 2 * z ** 2)
+        g = sym.lambdify((x, y, z), x ** 2 + t * y ** 2 + x * z)
+        h = sym.lambdify((x, y, z), x + s * y - t * z)
+
+        mac = MacaulayResultant([f, g, h], [x, y, z])
+        mac.get_monomials_set()
+
+        matrix = mac.get_matrix()
+        sparse = mac.get_matrix(sparse=True)
+
+        self.assertIsInstance(sparse, sym.SparseMatrix)
+        self.assertEqual(sparse, matrix)
+        self.assertEqual(len(sparse.todok()), 30)
+        self.assertEqual(sparse_determinant(sparse).as_expr(), matrix.det().expand())
+
+
+    def test_polynomial_inputs(self):
+        """Test that Poly objects, expressions and callables give the same matrices."""
+        x, y, z = sym.symbols('x, y, z')
+        s, t = sym.symbols('s, t')
+        system = [s * x ** 2 + y * z - 2 * z ** 2, x ** 2 + t * y ** 2 + x * z, x + s * y - t * z]
+
+        matrices = []
+        for polynomials in [system, [sym.Poly(f, x, y, z) for f in system],
+                            [sym.lambdify((x, y, z), f) for f in system]]:
+            mac = MacaulayResultant(polynomials, [x, y, z])
+            self.assertEqual(mac.degrees, [2, 2, 1])
+            mac.get_monomials_set()
+            matrix = mac.get_matrix()
+            matrices.append((matrix, mac.get_submatrix(matrix)))
+
+        self.assertEqual(matrices[0], matrices[1])
+        self.assertEqual(matrices[0], matrices[2])
+
+    def test_lazy_stages(self):
+        """Test that stages are computed on access, cached and invalidated."""
+        x, y, z = sym.symbols('x, y, z')
+        s, t = sym.symbols('s, t')
+        system = [s * x ** 2 + y * z - 2 * z ** 2, x ** 2 + t * y ** 2 + x * z, x + s * y - t * z]
+        mac = MacaulayResultant(system, [x, y, z])
+
+        self.assertEqual(mac.monomials_size, 10)
+        self.assertNotIn("monomial_set", vars(mac))
+        self.assertNotIn("matrix", vars(mac))
+
+        matrix = mac.matrix
+        self.assertIs(mac.matrix, matrix)
+        self.assertEqual(mac.submatrix, mac.get_submatrix(matrix))
+        product = sym.expand(mac.resultant.as_expr() * mac.submatrix.det())
+        self.assertIn(product, [matrix.det().expand(), -matrix.det().expand()])
+
+        mac.polynomials = [x + y, y + z, z + x]
+        mac.invalidate()
+        self.assertEqual(mac.degree_m, 1)
+        self.assertEqual(mac.matrix.shape, (3, 3))
+
+    def test_get_extraneous_indices(self):
+        """Test that the extraneous rows are those of the non reduced monomials."""
+        x, y, z = sym.symbols('x, y, z')
+        mac = MacaulayResultant([x ** 2 + y * z, y ** 2 + x * z, x + y + z], [x, y, z])
+
+        rows, columns = mac.get_extraneous_indices()
+        self.assertEqual([mac.monomial_exponents[c] for c in columns], [(2, 0, 1), (0, 2, 1)])
+        self.assertEqual(sorted(mac.row_monomials[row] for row in rows), columns)
+        self.assertEqual(sorted(mac.row_monomials), list(range(mac.monomials_size)))
+
+    def test_get_resultant(self):
+        """Test the resultant against its normalisation and other formulations."""
+        x, y, z, w = sym.symbols('x, y, z, w')
+        s, t = sym.symbols('s, t')
+
+        self.assertEqual(MacaulayResultant([x ** 2, y ** 3, z], [x, y, z]).get_resultant(), 1)
+
+        coefficients = sym.Matrix([[2, -1, 3], [1, 4, -2], [0, 5, 1]])
+        linear = [sum(coefficients[i, j] * v for j, v in enumerate([x, y, z])) for i in range(3)]
+        self.assertEqual(MacaulayResultant(linear, [x, y, z]).get_resultant(), coefficients.det())
+
+        f, g = 3 * x ** 3 - x * y ** 2 + 2 * y ** 3, x ** 2 + 5 * x * y - 7 * y ** 2
+        self.assertEqual(MacaulayResultant([f, g], [x, y]).get_resultant(),
+                         sym.resultant(f.subs(y, 1), g.subs(y, 1), x))
+
+        system = [s * x ** 2 + y * z - 2 * z ** 2 + w ** 2, x ** 2 + 3 * y ** 2 + x * w,
+                  x + s * y - 5 * z, y - w + z]
+        mac = MacaulayResultant(system, [x, y, z, w])
+        resultant = mac.get_resultant()
+        self.assertNotIn("matrix", mac.__dict__)
+        self.assertEqual(sym.expand(resultant.as_expr() * mac.submatrix.det()) ** 2,
+                         sym.expand(mac.matrix.det()) ** 2)
+
+        common_root = [x ** 2 - y * z, y ** 2 - x * z + 2 * z ** 2 - 2 * x * y, x + y - 2 * z]
+        self.assertEqual(MacaulayResultant(common_root, [x, y, z]).get_resultant(), 0)
+
+    def test_write_modular_rows(self):
+        """Test the streamed rows, their memory-mapped storage and the out of core rank."""
+        x, y, z = sym.symbols('x, y, z')
+        s, t = sym.symbols('s, t')
+        system = [s * x ** 2 + y * z - 2 * z ** 2, x ** 2 + t * y ** 2 + x * z, x + s * y - t * z]
+        mac = MacaulayResultant(system, [x, y, z])
+
+        rows = list(mac.iter_rows())
+        self.assertEqual({(i, j): c for i, row in enumerate(rows) for j, c in row},
+                         mac.get_matrix(sparse=True).todok())
+        with self.assertRaises(ValueError):
+            mac.get_modular_terms(101)
+        self.assertEqual(mac.get_modular_terms(101, np.array([3, 7])),
+                         mac.get_modular_terms(101, (3, 7)))
+
+        prime, point = 101, [3, 7]
+        with tempfile.TemporaryDirectory() as directory:
+            header = mac.write_modular_rows(directory, prime=prime, point=point)
+            self.assertEqual(header["shape"], [10, 10])
+            self.assertEqual(header["parameters"], ["s", "t"])
+
+            indptr, indices, data, header = load_sparse_rows(directory)
+            self.assertEqual(len(data), header["nnz"])
+            stored = [[0] * 10 for _ in range(10)]
+            for i, (columns, values) in enumerate(iter_sparse_rows(directory)):
+                for j, value in zip(columns, values):
+                    stored[i][j] = int(value)
+
+            expected = evaluate_mod_prime(mac.matrix, [s, t], point, prime)
+            self.assertEqual(stored, expected)
+            self.assertEqual(sparse_rank_mod_prime(iter_sparse_rows(directory), prime),
+                             len(rank_profile_mod_prime(expected, prime)[0]))
+
+        with tempfile.TemporaryDirectory() as directory:
+            header = mac.write_modular_rows(directory, prime=prime, point=np.array(point))
+            self.assertEqual(header["point"], point)
+            self.assertEqual([list(map(int, values)) for _, values in iter_sparse_rows(directory)],
+                             [[v for v in row if v] for row in expected])
+
+        singular = MacaulayResultant([x + y, x + y, z], [x, y, z])
+        with tempfile.TemporaryDirectory() as directory:
+            singular.write_modular_rows(directory)
+            self.assertEqual(sparse_rank_mod_prime(iter_sparse_rows(directory), 2 ** 31 - 1), 2)
@@ -0,0 +1,110 @@
+"""
+A file to test the modular determinant backend.
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import random
+import unittest
+import sympy as sym
+
+from cayley_bezout import cayley_bezout_matrix
+from dixon import DixonResultant
+from macaulay import MacaulayResultant
+from modular import (determinant_mod_prime, evaluate_mod_prime, get_integer_rows,
+                     get_primes, get_residue, hadamard_bound, modular_determinant,
+                     rank_profile_mod_prime)
+from sylvesters import sylvester_matrix, sylvester_resultant
+
+
+class TestModular(unittest.TestCase):
+
+    def test_get_primes(self):
+        primes = get_primes()
+        first, second = next(primes), next(primes)
+
+        self.assertEqual(first, 2 ** 31 - 1)
+        self.assertTrue(sym.isprime(second))
+        self.assertLess(second, first)
+
+    def test_get_integer_rows(self):
+        matrix = sym.Matrix([[sym.Rational(1, 2), 1], [sym.Rational(2, 3), sym.Rational(1, 6)]])
+        rows, denominator = get_integer_rows(matrix)
+
+        self.assertEqual(rows, [[1, 2], [4, 1]])
+        self.assertEqual(denominator, 12)
+
+    def test_hadamard_bound(self):
+        rows = [[3, 4], [1, 0]]
+        self.assertGreaterEqual(hadamard_bound(rows), 5)
+        self.assertGreaterEqual(hadamard_bound(rows), abs(sym.Matrix(rows).det()))
+
+    def test_determinant_mod_prime(self):
+        self.assertEqual(determinant_mod_prime([[0, 1], [1, 0]], 7), 6)
+        self.assertEqual(determinant_mod_prime([[2, 4], [1, 2]], 7), 0)
+
+    def test_evaluate_mod_prime(self):
+        a, b = sym.symbols("a, b")
+        matrix = sym.Matrix([[a ** 2 + b, 0], [sym.Rational(1, 2) * a, (a + 1) * (b - 1)]])
+
+        self.assertEqual(get_residue(sym.Rational(1, 2), 7), 4)
+        self.assertEqual(evaluate_mod_prime(matrix, [a, b], [3, 5], 7), [[0, 0], [5, 2]])
+
+    def test_rank_profile_mod_prime(self):
+        rows = [[1, 2, 0, 1], [2, 4, 0, 2], [0, 0, 1, 1]]
+        self.assertEqual(rank_profile_mod_prime(rows, 7), ([0, 2], [0, 2]))
+        self.assertEqual(rank_profile_mod_prime([[0, 0], [0, 7]], 7), ([], []))
+
+        rng = random.Random(1)
+        matrix = sym.Matrix(12, 9, lambda i, j: rng.randint(-5, 5))
+        matrix[:, 4] = matrix[:, 1] - 2 * matrix[:, 3]
+        matrix[7, :] = matrix[2, :] + matrix[5, :]
+
+        pivot_rows, pivot_columns = rank_profile_mod_prime(get_integer_rows(matrix)[0], 2 ** 31 - 1)
+        self.assertEqual(len(pivot_rows), matrix.rank())
+        self.assertNotIn(4, pivot_columns)
+        self.assertNotEqual(matrix.extract(pivot_rows, pivot_columns).det(), 0)
+
+    def test_modular_determinant_random(self):
+        """Test large random matrices against sympy's determinant."""
+        rng = random.Random(1)
+        for size in [1, 5, 20]:
+            matrix = sym.Matrix(size, size, lambda i, j: rng.randint(-10 ** 6, 10 ** 6))
+            self.assertEqual(modular_determinant(matrix), matrix.det(method="bareiss"))
+
+        matrix = sym.Matrix([[sym.Rational(1, 2), 1], [sym.Rational(2, 3), 3]])
+        self.assertEqual(modular_determinant(matrix), matrix.det())
+
+    def test_modular_determinant_formulations(self):
+        """Test the matrices of the four formulations."""
+        x, y, z = sym.symbols("x, y, z")
+
+        p, q = 3 * x ** 3 - 7 * x + 2, 5 * x ** 2 + x - 11
+        matrix = sylvester_matrix(p, q, x)
+        self.assertEqual(modular_determinant(matrix), matrix.det())
+        self.assertEqual(sylvester_resultant(p, q, x, method="modular").as_expr(),
+                         matrix.det())
+
+        matrix = cayley_bezout_matrix(sym.lambdify(x, p), sym.lambdify(x, q), x)
+        self.assertEqual(modular_determinant(matrix), matrix.det())
+
+        polynomials = [sym.lambdify((x, y), f) for f in [x + y, x ** 2 + y ** 3, x ** 2 + y]]
+        dixon = DixonResultant(polynomials, [x, y])
+        matrix = dixon.get_dixon_matrix(dixon.get_dixon_polynomial())
+        self.assertEqual(modular_determinant(matrix), 0)
+
+        polynomials = [sym.lambdify((x, y, z), f) for f in
+                       [2 * x ** 2 - y * z + 3 * z ** 2, x ** 2 - 4 * y ** 2 + x * z,
+                        7 * y - x + z]]
+        macaulay = MacaulayResultant(polynomials, [x, y, z])
+        macaulay.get_monomials_set()
+        matrix = macaulay.get_matrix()
+        self.assertEqual(modular_determinant(matrix), matrix.det())
+
+    def test_modular_determinant_invalid(self):
+        a = sym.symbols("a")
+
+        with self.assertRaises(ValueError):
+            modular_determinant(sym.Matrix([[1, 2, 3], [4, 5, 6]]))
+        with self.assertRaises(ValueError):
+            modular_determinant(sym.Matrix([[a, 1], [1, a]]))
@@ -0,0 +1,112 @@
+"""
+A file to test the floating point mode.
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import unittest
+import numpy as np
+import sympy as sym
+
+import numeric
+from cayley_bezout import cayley_bezout_matrix
+from dixon import DixonResultant
+from macaulay import MacaulayResultant
+from sylvesters import sylvester_matrix
+
+x, y, z = sym.symbols("x, y, z")
+
+
+def to_expression(coefficients, variables):
+    return sum(int(c) * sym.Mul(*[v ** e for v, e in zip(variables, powers)])
+               for powers, c in np.ndenumerate(coefficients) if c)
+
+
+class TestNumeric(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def test_univariate_matrices(self):
+        """Test the Sylvester and Bezout matrices against the symbolic ones."""
+        p = self.rng.integers(-9, 9, 6).astype(float)
+        q = self.rng.integers(-9, 9, 4).astype(float)
+        p[-1], q[-1] = 3, -2
+        expressions = [to_expression(p, [x]), to_expression(q, [x])]
+
+        self.assertTrue(np.array_equal(numeric.sylvester_matrix(p, q),
+                                       np.array(sylvester_matrix(*expressions, x), dtype=float)))
+        self.assertTrue(np.array_equal(numeric.bezout_matrix(p, q),
+                                       np.array(cayley_bezout_matrix(*expressions, x), dtype=float)))
+        self.assertEqual(numeric.sylvester_matrix(p * 1j, q).dtype, np.complex128)
+
+    def test_hidden_variable_matrices(self):
+        """Test that the slices of a hidden variable matrix are its coefficients in y."""
+        p = self.rng.standard_normal((4, 3))
+        q = self.rng.standard_normal((3, 4))
+        value = 0.7
+        evaluate = np.polynomial.polynomial.polyval
+
+        for build in [numeric.sylvester_matrix, numeric.bezout_matrix]:
+            coefficients = build(p, q)
+            self.assertTrue(np.allclose(evaluate(value, coefficients),
+                                        build(evaluate(value, p.T), evaluate(value, q.T))))
+
+    def test_dixon_matrix(self):
+        """Test Dixon's matrix against DixonResultant."""
+        for shapes in [[(3, 3)] * 3, [(2, 3), (3, 2), (2, 2)], [(2, 2, 2)] * 4]:
+            polynomials = [self.rng.integers(-5, 5, shape).astype(float) for shape in shapes]
+            variables = [x, y, z][:len(shapes[0])]
+            expressions = [to_expression(p, variables) for p in polynomials]
+
+            matrix, rows, columns = numeric.dixon_matrix(polynomials)
+            expected = np.array(DixonResultant(expressions, variables).dixon_matrix, dtype=float)
+            self.assertEqual(matrix.shape, expected.shape)
+            self.assertTrue(np.allclose(matrix, expected))
+            self.assertEqual(len(rows), matrix.shape[0])
+
+    def test_macaulay_matrix(self):
+        """Test Macaulay's matrix against MacaulayResultant."""
+        polynomials = []
+        for degree in [2, 2, 1]:
+            coefficients = np.zeros((degree + 1,) * 3)
+            for powers in np.ndindex(*coefficients.shape):
+                if sum(powers) == degree:
+                    coefficients[powers] = self.rng.integers(1, 9)
+            polynomials.append(coefficients)
+        expressions = [to_expression(p, [x, y, z]) for p in polynomials]
+
+        expected = np.array(MacaulayResultant(expressions, [x, y, z]).matrix, dtype=float)
+        self.assertTrue(np.array_equal(numeric.macaulay_matrix(polynomials), expected))
+        self.assertEqual(numeric.get_exponents(2, 3).tolist(),
+                         [[2, 0, 0], [1, 1, 0], [1, 0, 1], [0, 2, 0], [0, 1, 1], [0, 0, 2]])
+
+    def test_svd_diagnostics(self):
+        diagnostics = numeric.get_svd_diagnostics(np.array([[1.0, 2.0], [2.0, 4.0]]))
+        self.assertEqual(diagnostics["rank"], 1)
+        self.assertGreater(diagnostics["condition"], 1e15)
+
+        stack = numeric.get_svd_diagnostics(np.stack([np.eye(3), np.diag([1.0, 1.0, 0.0])]))
+        self.assertEqual(stack["rank"].tolist(), [3, 2])
+
+    def test_solve_bivariate(self):
+        """Test the hidden variable solver on known and random systems."""
+        p = np.array([[-3, 1], [1, 0]], dtype=float)
+        q = np.array([[-2, 0], [0, 1]], dtype=float)
+        for method in ["bezout", "sylvester"]:
+            roots, residuals, diagnostics = numeric.solve_bivariate(p, q, method=method, seed=0)
+            self.assertEqual(sorted(np.round(roots.real, 8).tolist()), [[1, 2], [2, 1]])
+
+        degree = 4
+        p, q = [np.where(np.add.outer(range(degree + 1), range(degree + 1)) <= degree,
+                         self.rng.standard_normal((degree + 1, degree + 1)), 0) for _ in range(2)]
+        for method in ["bezout", "sylvester"]:
+            roots, residuals, diagnostics = numeric.solve_bivariate(p, q, method=method, seed=1)
+            self.assertEqual(len(roots), degree ** 2)
+            self.assertLess(residuals.max(), 1e-8)
+            self.assertGreaterEqual(diagnostics["candidates"], degree ** 2)
+
+        with self.assertRaises(ValueError):
+            numeric.solve_bivariate(p, 2 * p)
+        with self.assertRaises(ValueError):
+            numeric.solve_bivariate(p, q, method="dixon")
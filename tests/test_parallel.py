@@ -0,0 +1,88 @@
+"""
+A file to test the process pool layer.
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import unittest
+import sympy as sym
+
+from interpolation import interpolate_determinant
+from parallel import (compute_resultant, determinant, parallel_determinants,
+                      parallel_interpolate_determinant, parallel_map,
+                      parallel_resultants)
+
+
+def square(value):
+    return value ** 2
+
+
+OFFSET = {}
+
+
+def set_offset(value):
+    OFFSET["value"] = value
+
+
+def add_offset(value):
+    return value + OFFSET["value"]
+
+
+class TestParallel(unittest.TestCase):
+
+    def test_parallel_map(self):
+        self.assertEqual(list(parallel_map(square, range(7), max_workers=2, chunksize=3)),
+                         [v ** 2 for v in range(7)])
+        self.assertEqual(list(parallel_map(add_offset, range(5), max_workers=2,
+                                           initializer=set_offset, initargs=(10,))),
+                         [v + 10 for v in range(5)])
+
+        results = dict(parallel_map(square, range(7), max_workers=2, chunksize=2, ordered=False))
+        self.assertEqual(results, {v: v ** 2 for v in range(7)})
+
+    def test_determinant(self):
+        a = sym.symbols("a")
+
+        self.assertEqual(determinant(sym.Matrix([[1, 2], [3, 4]])), -2)
+        self.assertEqual(determinant(sym.Matrix([[a, 2], [3, a]])), a ** 2 - 6)
+
+    def test_compute_resultant(self):
+        """Test the four formulations on small systems."""
+        x, y, z, a = sym.symbols("x, y, z, a")
+
+        p, q = x ** 2 - a, x - 2
+        self.assertEqual(compute_resultant("sylvester", [p, q], [x]), 4 - a)
+        self.assertEqual(compute_resultant("bezout", [p, q], [x]), 4 - a)
+        self.assertEqual(compute_resultant("bezout", [2 * x - a, a * x ** 2 + 3], [x]),
+                         compute_resultant("sylvester", [2 * x - a, a * x ** 2 + 3], [x]))
+        self.assertEqual(compute_resultant("dixon", [x + y, x ** 2 + y ** 3, x ** 2 + y], [x, y]), 0)
+
+        polynomials = [2 * x ** 2 + 3 * x * y - 5 * z ** 2, 7 * x ** 2 - 11 * y ** 2 + 13 * y * z,
+                       x + 17 * y - 19 * z]
+        resultant = compute_resultant("macaulay", polynomials, [x, y, z])
+        self.assertEqual(resultant, sym.resultant(
+            sym.resultant(polynomials[0], polynomials[2], x),
+            sym.resultant(polynomials[1], polynomials[2], x), y).subs(z, 1))
+
+        with self.assertRaises(ValueError):
+            compute_resultant("unknown", [p, q], [x])
+
+    def test_parallel_resultants(self):
+        """Test many systems in a process pool against the serial results."""
+        x, a = sym.symbols("x, a")
+        systems = [([x ** 2 - a * k, x - k], [x]) for k in range(5)]
+
+        results = list(parallel_resultants(systems, "sylvester", max_workers=2))
+        self.assertEqual(results, [compute_resultant("sylvester", *s) for s in systems])
+
+        matrices = [sym.Matrix([[a, k], [k, a]]) for k in range(4)]
+        self.assertEqual(list(parallel_determinants(matrices, max_workers=2)),
+                         [a ** 2 - k ** 2 for k in range(4)])
+
+    def test_parallel_interpolate_determinant(self):
+        a, b = sym.symbols("a, b")
+        matrix = sym.Matrix([[a, 1, b], [b, a, 0], [1, b, a ** 2]])
+
+        self.assertEqual(parallel_interpolate_determinant(matrix, max_workers=2),
+                         interpolate_determinant(matrix))
+        self.assertEqual(parallel_interpolate_determinant(sym.Matrix([[2]])), 2)
@@ -0,0 +1,88 @@
+"""
+A file to test the profiling hooks.
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import json
+import os
+import tempfile
+import unittest
+import sympy as sym
+
+import profiling
+from cayley_bezout import cayley_bezout_matrix
+from dixon import DixonResultant
+from macaulay import MacaulayResultant
+from profiling import aggregate, profile, profiled, stage
+from sylvesters import sylvester_matrix, sylvester_resultant
+
+x, y, z, a, b = sym.symbols("x, y, z, a, b")
+
+
+class TestProfiling(unittest.TestCase):
+
+    def test_disabled(self):
+        """Test that nothing is recorded without an active profiler."""
+        self.assertEqual(profiling.PROFILERS, [])
+        self.assertIs(stage("test"), profiling.NULL_STAGE)
+
+        with profile() as profiler:
+            pass
+        sylvester_matrix(x ** 2 + a, x - b, x)
+        self.assertEqual(profiler.events, [])
+
+    def test_stages(self):
+        """Test the stages, call counts and dimensions of the formulations."""
+        events = []
+        with profile(callback=events.append) as profiler:
+            sylvester_matrix(x ** 2 + a, x - b, x)
+            sylvester_resultant(x ** 2 + a, x - b, x)
+            cayley_bezout_matrix(x ** 3 + a, x ** 2 - b, x)
+
+            dixon = DixonResultant([x * y + a, x ** 2 - b * y, x + y ** 2], [x, y])
+            dixon.dixon_matrix
+
+            mac = MacaulayResultant([a * x ** 2 + y * z, x ** 2 + b * y ** 2, x + y - z], [x, y, z])
+            mac.submatrix
+
+        summary = profiler.summary()
+        self.assertEqual(len(events), sum(entry["calls"] for entry in summary.values()))
+        self.assertEqual(summary["sylvester.matrix"]["dimensions"], [{"shape": [3, 3]}])
+        self.assertEqual(summary["sylvester.determinant"]["dimensions"], [{"size": 3}])
+        self.assertEqual(summary["bezout.matrix"]["dimensions"], [{"shape": [3, 3]}])
+        self.assertEqual(summary["bezout.coefficients"]["calls"], 2)
+        self.assertEqual(summary["dixon.matrix"]["dimensions"], [{"shape": list(dixon.dixon_matrix.shape)}])
+        for name in ["dixon.substitution", "dixon.divided_differences", "dixon.determinant",
+                     "macaulay.monomials", "macaulay.row_exponents", "macaulay.matrix",
+                     "macaulay.submatrix"]:
+            self.assertIn(name, summary)
+        self.assertEqual(summary["macaulay.matrix"]["dimensions"], [{"shape": [10, 10]}])
+
+        self.assertEqual(profiling.PROFILERS, [])
+
+    def test_export_and_aggregate(self):
+        @profiled("square")
+        def square(value):
+            return value ** 2
+
+        summaries = []
+        for _ in range(2):
+            with profile() as profiler:
+                square(3)
+                with stage("block", size=4) as block:
+                    block.dimensions["rank"] = 2
+            summaries.append(profiler.summary())
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            profiler.export(path)
+            with open(path) as f:
+                self.assertEqual(json.load(f), summaries[-1])
+
+        merged = aggregate(summaries)
+        self.assertEqual(merged["square"]["calls"], 2)
+        self.assertEqual(merged["block"]["dimensions"], [{"size": 4, "rank": 2}])
+        self.assertAlmostEqual(merged["block"]["seconds"],
+                               sum(s["block"]["seconds"] for s in summaries))
+        self.assertIn("square", profiler.report())
@@ -0,0 +1,95 @@
+"""
+A file to test the automatic choice of the formulation of a resultant.
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import unittest
+
+import sympy as sym
+
+from dixon import DixonResultant
+from resultant import get_determinant_cost, get_plan, resultant
+from sylvesters import sylvester_resultant
+
+
+class TestResultant(unittest.TestCase):
+
+    def test_get_determinant_cost(self):
+        self.assertEqual(get_determinant_cost(4, 4, 1, 0, 0), 4 ** 3 * 4)
+        self.assertEqual(get_determinant_cost(2, 3, 2, 1, 1), 2 * 3 * 2 * 5)
+        self.assertLess(get_determinant_cost(5, 5, 2, 1, 1), get_determinant_cost(10, 10, 1, 1, 1))
+
+    def test_univariate(self):
+        """Test that the three formulations agree with the Sylvester resultant."""
+        x, a = sym.symbols("x, a")
+        for p, q in [(x ** 3 + a * x + 2, 3 * x ** 3 - x ** 2 + a),
+                     (2 * x ** 2 + a, x ** 4 - 3 * a * x + 1),
+                     (a * x ** 5 - x + 1, 2 * x - a)]:
+            plan = get_plan([p, q], [x])
+            expected = sylvester_resultant(p, q, x).as_expr()
+
+            self.assertEqual(plan.kind, "univariate")
+            self.assertEqual({c["method"] for c in plan.candidates}, {"sylvester", "bezout", "macaulay"})
+            for method in ["sylvester", "bezout", "macaulay"]:
+                self.assertEqual(sym.expand(plan.run(method) - expected), 0)
+
+    def test_chosen(self):
+        """Test that the plan is inspected without building a matrix."""
+        x, a = sym.symbols("x, a")
+        plan = get_plan([x ** 4 + a, 2 * x ** 4 - a * x + 1], [x])
+
+        self.assertEqual(plan.chosen["method"], "bezout")
+        self.assertEqual((plan.chosen["rows"], plan.chosen["columns"]), (4, 4))
+        self.assertEqual([c["cost"] for c in plan.candidates], sorted(c["cost"] for c in plan.candidates))
+
+        plan = get_plan([x ** 8 + a, x - a], [x])
+        self.assertEqual(plan.chosen["method"], "sylvester")
+
+        self.assertNotIn("matrix", plan.formulations["macaulay"][1].__dict__)
+        self.assertEqual(resultant([x ** 2 - a, x - 2], [x]), 4 - a)
+
+    def test_homogeneous(self):
+        x, y, z, a = sym.symbols("x, y, z, a")
+
+        plan = get_plan([x ** 2 + a * x * y - y ** 2, 3 * x ** 3 + y ** 3], [x, y])
+        self.assertEqual(plan.kind, "homogeneous")
+        values = {sym.expand(plan.run(c["method"])) for c in plan.candidates}
+        self.assertEqual(values, {sylvester_resultant(x ** 2 + a * x - 1, 3 * x ** 3 + 1, x).as_expr()})
+
+        polynomials = [x ** 2 + y * z, y ** 2 - 3 * x * z, x + y - a * z]
+        plan = get_plan(polynomials, [x, y, z])
+        self.assertEqual({c["method"] for c in plan.candidates}, {"dixon", "macaulay"})
+        self.assertEqual(sym.factor(plan.run("macaulay")), a * (a ** 3 + 9 * a + 6))
+
+    def test_affine(self):
+        x, y, a, b = sym.symbols("x, y, a, b")
+        polynomials = [x + y - a, x ** 2 + y ** 2 - 4, x * y - b]
+        plan = get_plan(polynomials, [x, y])
+
+        self.assertEqual(plan.kind, "affine")
+        self.assertEqual(plan.run("dixon"),
+                         DixonResultant(polynomials, [x, y]).get_dixon_resultant().as_expr())
+        self.assertEqual(sym.factor(plan.run("macaulay")), (a ** 2 - 2 * b - 4) ** 2)
+
+    def test_auto_returns_resultant(self):
+        """Test that auto skips Dixon's projection operator even when it is cheapest."""
+        x, y, a = sym.symbols("x, y, a")
+        polynomials = [x ** 2 + a * x * y + y ** 2 - 1, x ** 2 - 2 * y ** 2 + a * x + 3,
+                       a * x * y + x + y ** 2 - a]
+        plan = get_plan(polynomials, [x, y])
+
+        self.assertEqual(plan.candidates[0]["method"], "dixon")
+        self.assertFalse(plan.candidates[0]["resultant"])
+        self.assertEqual(plan.chosen["method"], "macaulay")
+        self.assertEqual(plan.choose("dixon")["method"], "dixon")
+
+    def test_errors(self):
+        x, y = sym.symbols("x, y")
+
+        with self.assertRaises(ValueError):
+            get_plan([x + y + 1, x - y], [x, y]).candidates
+        with self.assertRaises(ValueError):
+            get_plan([x + 1, x - 2], [x]).run("dixon")
+        with self.assertRaises(ValueError):
+            resultant([x + 1, x - 2], [x], method="unknown")
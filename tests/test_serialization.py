@@ -0,0 +1,82 @@
+"""
+A file to test the binary serialization of matrices.
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+import sympy as sym
+
+from cayley_bezout import cayley_bezout_matrix
+from dixon import DixonResultant
+from macaulay import MacaulayResultant
+from serialization import (arrays_to_matrix, decode_integers, encode_integers, load_arrays,
+                           load_matrix, matrix_to_arrays, save_matrix)
+from sylvesters import sylvester_matrix
+
+x, y, z, a, b = sym.symbols("x, y, z, a, b")
+
+
+class TestSerialization(unittest.TestCase):
+
+    def test_round_trip(self):
+        """Test that the matrices of the four formulations are reproduced exactly."""
+        matrices = [
+            sylvester_matrix(a * x ** 3 + b * x - 2 ** 80, x ** 2 - sym.Rational(3, 7) * a, x),
+            cayley_bezout_matrix(a * x ** 3 + b * x + 1, x ** 2 - a * b, x),
+            DixonResultant([x * y + a, x ** 2 - b * y, x + y ** 2 + a * b], [x, y]).dixon_matrix,
+            MacaulayResultant([a * x ** 2 + y * z, x ** 2 + b * y ** 2, x + y - z], [x, y, z]).get_matrix(),
+            sym.Matrix([[1, -2], [0, 5]]),
+        ]
+
+        for matrix in matrices:
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "matrix.bin")
+                header = save_matrix(path, matrix)
+                self.assertEqual(load_matrix(path), matrix)
+                self.assertEqual(load_matrix(path, sparse=True), matrix)
+
+                header, arrays = load_arrays(path)
+                self.assertFalse(any(array.flags.writeable for array in arrays.values()))
+                self.assertEqual(header["entries"], len(matrix.todok()))
+                self.assertEqual(arrays_to_matrix(*load_arrays(path, mmap_mode=None)), matrix)
+                del arrays
+
+            header, arrays = matrix_to_arrays(matrix)
+            self.assertEqual(arrays_to_matrix(header, arrays), matrix)
+            self.assertLess(len(pickle.dumps(arrays)), len(pickle.dumps(matrix)) + 2048)
+
+        header, arrays = matrix_to_arrays(matrices[0])
+        self.assertEqual(header["integers"], {"numerators": "bytes", "denominators": "int8"})
+        self.assertEqual(header["parameters"], [sym.srepr(a), sym.srepr(b)])
+
+        c = sym.IndexedBase("c")
+        matrix = sylvester_matrix(c[1] * x + c[0], c[2] * x ** 2 - 3, x)
+        header, arrays = matrix_to_arrays(matrix)
+        self.assertEqual(header["parameters"], [sym.srepr(c[i]) for i in range(3)])
+        self.assertEqual(arrays["exponents"].shape, (6, 3))
+        self.assertEqual(arrays_to_matrix(header, arrays), matrix)
+
+    def test_integers(self):
+        """Test the encodings of small and large integers."""
+        for small, dtype in [([0, -1, 127], np.int8), ([0, 2 ** 15], np.int32),
+                             ([-1, 2 ** 63 - 1, -2 ** 63], np.int64)]:
+            self.assertEqual(encode_integers(small)["values"].dtype, dtype)
+            self.assertEqual(decode_integers(encode_integers(small)), small)
+
+        large = [0, 255, -256, 2 ** 63, -2 ** 200 + 1, 7]
+        self.assertEqual(sorted(encode_integers(large)), ["bytes", "offsets"])
+        self.assertEqual(decode_integers(encode_integers(large)), large)
+
+    def test_invalid_entries(self):
+        """Test that entries which are not rational polynomials are rejected."""
+        for entry in [sym.sqrt(2), 1 / a, sym.Float(0.5) * a, sym.sin(a)]:
+            with self.assertRaises(ValueError):
+                matrix_to_arrays(sym.Matrix([[entry]]))
+
+        header, arrays = matrix_to_arrays(sym.Matrix([[a * (b + 1)]]))
+        self.assertEqual(arrays_to_matrix(header, arrays), sym.Matrix([[a * b + a]]))
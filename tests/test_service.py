@@ -0,0 +1,71 @@
+"""
+A file to test the batch resultant service.
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import json
+import unittest
+
+import sympy as sym
+
+from service import ResultantService, parse_job, percentile, run_batch, run_job
+
+
+class TestService(unittest.TestCase):
+
+    def test_run_job(self):
+        x, a = sym.symbols("x, a")
+        job = {"id": 1, "method": "bezout", "variables": ["x"], "polynomials": ["x**2 - a", "x - 2"]}
+
+        method, polynomials, variables = parse_job(job)
+        self.assertEqual((method, polynomials, variables), ("bezout", [x ** 2 - a, x - 2], [x]))
+
+        result = run_job(job)
+        self.assertEqual((result["id"], result["status"]), (1, "ok"))
+        self.assertEqual(sym.sympify(result["resultant"]), 4 - a)
+
+        result = run_job({"id": 2, "method": "unknown", "variables": ["x"], "polynomials": ["x"]})
+        self.assertEqual(result["status"], "error")
+        self.assertIn("Unknown method", result["error"])
+
+    def test_percentile(self):
+        self.assertIsNone(percentile([], 50))
+        self.assertEqual(percentile([3, 1, 2, 4], 50), 2)
+        self.assertEqual(percentile(range(1, 101), 90), 90)
+        self.assertEqual(percentile([5], 99), 5)
+
+    def test_run(self):
+        """Test a stream of valid and invalid jobs given as JSON lines."""
+        lines = [json.dumps({"id": "s{}".format(k), "method": "sylvester", "variables": ["x"],
+                             "polynomials": ["x**2 - {}".format(k), "x - 1"]}) for k in range(6)]
+        lines.insert(2, "not json")
+        lines.append(json.dumps({"method": "macaulay", "variables": ["x", "y"],
+                                 "polynomials": ["x**2 + y**2", "x*y"]}))
+
+        service = ResultantService(workers=2)
+        results = {result["id"]: result for result in service.run(lines)}
+
+        self.assertEqual({k: results["s{}".format(k)]["resultant"] for k in range(6)},
+                         {k: str(1 - k) for k in range(6)})
+        self.assertEqual(results[2]["status"], "error")
+        self.assertEqual((results[7]["status"], results[7]["resultant"]), ("ok", "1"))
+
+        summary = service.summary()
+        self.assertEqual((summary["jobs"], summary["ok"], summary["error"]), (8, 7, 1))
+        self.assertEqual(len(service.latencies), 7)
+        self.assertGreater(summary["latency"]["mean"], 0)
+        self.assertGreater(summary["throughput"], 0)
+        self.assertLessEqual(summary["latency"]["p50"], summary["latency"]["max"])
+
+    def test_timeout(self):
+        """Test that a slow job is stopped and its worker replaced."""
+        p = " + ".join("a{0}*x**{0}".format(i) for i in range(40))
+        q = " + ".join("b{0}*x**{0}".format(i) for i in range(40))
+        jobs = [{"id": "slow", "method": "sylvester", "variables": ["x"], "polynomials": [p, q]},
+                {"id": "fast", "method": "sylvester", "variables": ["x"], "polynomials": ["x - a", "x - 2"]}]
+
+        results = {result["id"]: result for result in run_batch(jobs, workers=1, timeout=0.5)}
+
+        self.assertEqual(results["slow"]["status"], "timeout")
+        self.assertEqual((results["fast"]["status"], results["fast"]["resultant"]), ("ok", "a - 2"))
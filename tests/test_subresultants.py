@@ -0,0 +1,75 @@
+"""
+A file to test the subresultant chain.
+"""
+import sys
+sys.path.insert(0, '../src/')
+
+import unittest
+import sympy as sym
+
+from subresultants import (get_chain_order, principal_subresultant_coefficient,
+                           principal_subresultant_coefficients, subresultant_chain)
+from sylvesters import sylvester_matrix, sylvester_resultant
+
+x, a, b = sym.symbols("x, a, b")
+
+
+def get_minor_subresultants(p, q):
+    """The subresultants as minors of the Sylvester's matrix, one determinant each."""
+    m, n = sym.degree(p, x), sym.degree(q, x)
+    matrix = sylvester_matrix(p, q, x)
+
+    subresultants = []
+    for j in range(min(m, n)):
+        size = m + n - 2 * j
+        rows = list(range(n - j)) + [n + k for k in range(m - j)]
+        coefficients = [matrix.extract(rows, list(range(size - 1)) + [c]).det()
+                        for c in range(size - 1, size + j)]
+        subresultants.append(sym.Poly(sum(c * x ** (j - i) for i, c in enumerate(coefficients)), x))
+
+    return subresultants
+
+
+class TestSubresultants(unittest.TestCase):
+
+    def test_get_chain_order(self):
+        order, blocks = get_chain_order(4, 2)
+        self.assertEqual(order, [2, 3, 0, 4, 1, 5])
+        self.assertEqual(blocks, {4: 1, 6: 0})
+
+        order, blocks = get_chain_order(1, 3)
+        self.assertEqual(order, [0, 1, 2, 3])
+        self.assertEqual(blocks, {4: 0})
+
+    def test_subresultant_chain(self):
+        """Test the chain against the minors of the Sylvester's matrix."""
+        examples = [(x ** 5 + a * x ** 3 + 2 * x + b, 3 * x ** 3 - x + a),
+                    (x ** 2 + a, x ** 4 + b * x + 1),
+                    ((x - 1) ** 2 * (x + 2) * (x - a), (x - 1) ** 2 * (x + 3)),
+                    (x ** 4 + 1, x ** 4 + x ** 2 + 1),
+                    (x ** 6 + x ** 2 + a, x ** 4 + 1)]
+
+        for p, q in examples:
+            chain = subresultant_chain(p, q, x)
+            expected = get_minor_subresultants(p, q)
+
+            self.assertEqual(len(chain), len(expected))
+            for subresultant, minor in zip(chain, expected):
+                self.assertEqual(sym.expand(subresultant.as_expr() - minor.as_expr()), 0)
+            self.assertEqual(sym.expand(chain[0].as_expr() - sylvester_resultant(p, q, x).as_expr()), 0)
+
+    def test_principal_subresultant_coefficients(self):
+        """Test that the first non zero coefficient gives the degree of the gcd."""
+        p = (x - 1) ** 2 * (x + 2) * (x - 5)
+        q = (x - 1) ** 2 * (x + 3)
+
+        coefficients = principal_subresultant_coefficients(p, q, x)
+        self.assertEqual([c.is_zero for c in coefficients], [True, True, False])
+        self.assertEqual(sym.degree(sym.gcd(p, q), x), 2)
+
+        for j, coefficient in enumerate(principal_subresultant_coefficients(x ** 3 + a * x + b, x ** 2 - a, x)):
+            self.assertEqual(principal_subresultant_coefficient(x ** 3 + a * x + b, x ** 2 - a, x, j),
+                             coefficient)
+
+        with self.assertRaises(ValueError):
+            principal_subresultant_coefficient(p, q, x, 3)
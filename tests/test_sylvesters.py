@@ -7,7 +7,7 @@ sys.path.insert(0, '../src/')
 import unittest
 import sympy as sym
 
-from sylvesters import sylvester_matrix
+from sylvesters import get_coefficient_ring, sylvester_matrix, sylvester_resultant
 
 
 class TestSylvester(unittest.TestCase):
@@ -51,3 +51,73 @@ class TestSylvester(unittest.TestCase):
 
         matrix = sylvester_matrix(p, q, x)
         self.assertEqual(matrix.det(), 0)
+
+
+    def test_sylvester_resultant_generic_case(self):
+        """Test the fraction-free resultant for a generic case."""
+        a = sym.IndexedBase("a")
+        b = sym.IndexedBase("b")
+        x = sym.symbols("x")
+
+        p = a[1] * x + a[0]
+        q = b[2] * x ** 2 + b[1] * x + b[0]
+
+        self.assertEqual(get_coefficient_ring(p, q, x), (a[0], a[1], b[0], b[1], b[2]))
+
+        resultant = sylvester_resultant(p, q, x)
+        self.assertIsInstance(resultant, sym.Poly)
+        self.assertEqual(resultant.gens, (a[0], a[1], b[0], b[1], b[2]))
+        self.assertEqual(resultant.as_expr(),
+                         a[0] ** 2 * b[2] - a[0] * a[1] * b[1] + a[1] ** 2 * b[0])
+
+    def test_sylvester_resultant_against_determinant(self):
+        """Test that both methods agree with one and two parameters."""
+        x, s, t = sym.symbols("x, s, t")
+
+        p = s * x ** 4 - 3 * x ** 3 + t * x + 2
+        q = x ** 3 + (s + t) * x ** 2 - 5 * s
+
+        for method in ["bareiss", "det"]:
+            resultant = sylvester_resultant(p, q, x, method=method)
+            self.assertEqual(resultant.as_expr(),
+                             sylvester_matrix(p, q, x).det().expand())
+
+        p = x ** 3 + s * x - 1
+        q = 2 * x ** 2 - s
+        self.assertEqual(sylvester_resultant(p, q, x).as_expr(),
+                         sym.resultant(p, q, x).expand())
+
+    def test_sylvester_resultant_euclidean(self):
+        """Test the subresultant remainder sequence against the determinant."""
+        x, s, t = sym.symbols("x, s, t")
+
+        examples = [(s * x ** 4 - 3 * x ** 3 + t * x + 2, x ** 3 + (s + t) * x ** 2 - 5 * s),
+                    (2 * x ** 2 - s, x ** 5 + s * x - 1),
+                    (x ** 3 - 2 * x + t, 7),
+                    ((x - s) * (x ** 2 + t), (x - s) * (3 * x - 1)),
+                    (x / 2 + 1, x ** 2 - 2)]
+        for p, q in examples:
+            resultant = sylvester_resultant(p, q, x, method="euclidean")
+            self.assertIsInstance(resultant, sym.Poly)
+            self.assertEqual(resultant.as_expr(), sylvester_matrix(p, q, x).det().expand())
+
+    def test_sylvester_resultant_euclidean_high_degree(self):
+        """Test the methods agree for integer polynomials of degree 30."""
+        x = sym.symbols("x")
+        p = sum((-1) ** i * (i % 7 + 1) * x ** i for i in range(31))
+        q = sum((i % 5 - 2) * x ** i for i in range(30)) + 3 * x ** 30
+
+        self.assertEqual(sylvester_resultant(p, q, x, method="euclidean"),
+                         sylvester_resultant(p, q, x, method="modular"))
+
+    def test_sylvester_resultant_numerical(self):
+        """Test the fraction-free resultant for numerical examples."""
+        x = sym.symbols("x")
+
+        self.assertEqual(sylvester_resultant(x ** 2 - 5 * x + 6,
+                                             x ** 2 - 3 * x + 2, x).as_expr(), 0)
+        self.assertEqual(sylvester_resultant(x ** 2 + 1, x - 2, x).as_expr(), 5)
+        self.assertEqual(sylvester_resultant(x / 2 + 1, x - 2, x).as_expr(), -2)
+
+        with self.assertRaises(ValueError):
+            sylvester_resultant(x + 1, x - 1, x, method="unknown")